@@ -0,0 +1,106 @@
+from csv import reader
+from json import loads
+from typing import Iterable, Iterator, List, Tuple
+from sistema.sistema_turistico import SistemaTuristico
+from sistema.ponto_interesse import ESCALA
+from interface.input_output import aplicar_alteracao, registar_alteracao
+
+
+def ler_eventos(linhas: Iterable[str]) -> Iterator[Tuple[str, object]]:
+    """
+    Lê avaliações em CSV (designacao,avaliacao) ou em JSON, um objeto
+    {"designacao": ..., "avaliacao": ...} por linha. As linhas vazias e
+    um cabeçalho CSV na primeira linha são ignorados. Uma linha que não
+    pode ser interpretada dá origem a um evento com avaliação None
+
+    :param linhas: linhas do ficheiro ou da entrada padrão
+    :type linhas: Iterable[str]
+    :yield: designação e avaliação, por validar
+    :rtype: Iterator[Tuple[str, object]]
+    """
+    primeira: bool = True
+    for linha in linhas:
+        linha = linha.strip()
+        if not linha:
+            continue
+        if linha.startswith("{"):
+            try:
+                evento: dict = loads(linha)
+                yield str(evento["designacao"]), evento["avaliacao"]
+            except (ValueError, KeyError, TypeError):
+                yield linha, None
+        else:
+            campos: List[str] = next(reader([linha]))
+            if primeira and [c.strip().lower() for c in campos] == [
+                "designacao",
+                "avaliacao",
+            ]:
+                primeira = False
+                continue
+            if len(campos) == 2:
+                yield campos[0].strip(), campos[1].strip()
+            else:
+                yield linha, None
+        primeira = False
+
+
+def validar_avaliacao(avaliacao: object) -> int:
+    """
+    Converte uma avaliação num inteiro da escala numérica
+
+    :param avaliacao: avaliação lida
+    :type avaliacao: object
+    :return: avaliação de 1 a 4
+    :rtype: int
+    :raises ValueError: se a avaliação não for um inteiro da escala
+    """
+    if isinstance(avaliacao, bool) or isinstance(avaliacao, float):
+        raise ValueError(f"avaliação inválida: {avaliacao!r}")
+    valor: int = int(avaliacao)
+    if valor not in ESCALA:
+        raise ValueError(f"avaliação fora da escala de 1 a 4: {valor}")
+    return valor
+
+
+def importar_avaliacoes(
+    st: SistemaTuristico, eventos: Iterable[Tuple[str, object]]
+) -> Tuple[int, List[str]]:
+    """
+    Valida e aplica várias avaliações de uma só vez. As avaliações são
+    agregadas por ponto de interesse numa única passagem, aplicadas ao
+    sistema e registadas no diário como uma só alteração. Os eventos
+    inválidos são ignorados e descritos nos erros
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param eventos: designação e avaliação de cada visita
+    :type eventos: Iterable[Tuple[str, object]]
+    :return: número de avaliações aplicadas e erros, um por evento ignorado
+    :rtype: Tuple[int, List[str]]
+    """
+    contagens: dict[str, List[int]] = {}
+    erros: List[str] = []
+    for numero, (designacao, avaliacao) in enumerate(eventos, 1):
+        if avaliacao is None:
+            erros.append(f"evento {numero}: não foi possível interpretar {designacao}")
+            continue
+        try:
+            valor: int = validar_avaliacao(avaliacao)
+        except (TypeError, ValueError) as erro:
+            erros.append(f"evento {numero} ({designacao}): {erro}")
+            continue
+        contagem: List[int] = contagens.get(designacao)
+        if contagem is None:
+            if not st.existe_ponto(designacao):
+                erros.append(
+                    f"evento {numero}: ponto de interesse não existente: {designacao}"
+                )
+                continue
+            contagem = contagens[designacao] = [0, 0, 0, 0]
+        contagem[valor - 1] += 1
+    if not contagens:
+        return 0, erros
+    registo: dict = {"op": "avaliar_pontos", "contagens": contagens}
+    aplicar_alteracao(st, registo)
+    registar_alteracao(st, registo)
+    return sum(sum(c) for c in contagens.values()), erros
@@ -0,0 +1,239 @@
+import gc
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import List
+from sistema.sistema_turistico import SistemaTuristico
+from sistema.ponto_interesse import PontoInteresse
+from sistema.via_circulacao import ViaCirculacao
+from sistema.Ponto2D import Ponto2D
+
+MAGICO: bytes = b"STUR"
+VERSAO: int = 1
+CABECALHO: struct.Struct = struct.Struct("<4sIqQQQQQQ")
+"""mágico, versão, geração, número de textos, bytes dos textos,
+número de pontos, número de vias, número de vértices e número de arestas"""
+COLUNAS_TEXTOS: tuple = (0, 1, 2, 3, 4, 11, 12, 16, 17, 18)
+"""posições, em _colunas, das colunas com índices da tabela de textos"""
+
+
+class ErroSnapshot(Exception):
+    """Ficheiro que não é um snapshot binário válido do sistema"""
+
+
+def _colunas(pontos: int, vias: int, vertices: int, arestas: int) -> List[tuple]:
+    """
+    Obtém o tipo e o número de elementos de cada coluna do snapshot,
+    pela ordem em que são gravadas
+
+    :param pontos: número de pontos de interesse
+    :type pontos: int
+    :param vias: número de vias
+    :type vias: int
+    :param vertices: número de vértices do grafo
+    :type vertices: int
+    :param arestas: número de arestas do grafo
+    :type arestas: int
+    :return: código de tipo do array e número de elementos de cada coluna
+    :rtype: List[tuple]
+    """
+    return [
+        ("I", pontos),  # designação
+        ("I", pontos),  # morada
+        ("I", pontos),  # categoria
+        ("I", pontos),  # acessibilidade
+        ("I", pontos),  # atividades
+        ("d", pontos),  # latitude
+        ("d", pontos),  # longitude
+        ("q", pontos),  # número de avaliações
+        ("q", pontos),  # soma das avaliações
+        ("q", 4 * pontos),  # histograma das avaliações
+        ("q", pontos),  # visitas
+        ("I", vias),  # início
+        ("I", vias),  # fim
+        ("d", vias),  # distância
+        ("d", vias),  # velocidade mínima
+        ("d", vias),  # velocidade máxima
+        ("I", vertices),  # vértices do grafo
+        ("I", arestas),  # início das arestas
+        ("I", arestas),  # fim das arestas
+        ("d", arestas),  # peso das arestas
+    ]
+
+
+def gravar_binario(st: SistemaTuristico, caminho: str, geracao: int) -> None:
+    """
+    Grava o sistema num snapshot binário: uma tabela de textos sem
+    repetições, seguida de colunas de tamanho fixo com os índices dos
+    textos, as coordenadas, os agregados das avaliações, as vias e o grafo
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param caminho: ficheiro a gravar
+    :type caminho: str
+    :param geracao: geração do snapshot
+    :type geracao: int
+    """
+    ids: dict[str, int] = {}
+
+    def texto(valor: str) -> int:
+        """Obtém o índice de um texto na tabela, acrescentando-o se for novo"""
+        if valor not in ids:
+            if "\0" in valor:
+                raise ValueError(f"Texto com um carácter nulo: {valor!r}")
+            ids[valor] = len(ids)
+        return ids[valor]
+
+    colunas: List[array] = [array(tipo) for tipo, _ in _colunas(0, 0, 0, 0)]
+    for p in st._pontos:
+        colunas[0].append(texto(p._designacao))
+        colunas[1].append(texto(p._morada))
+        colunas[2].append(texto(p._categoria))
+        colunas[3].append(texto(p._acessibilidade))
+        colunas[4].append(texto(p._atividades))
+        colunas[5].append(p._coordenadas._x)
+        colunas[6].append(p._coordenadas._y)
+        colunas[7].append(p._contagem_avaliacoes)
+        colunas[8].append(p._soma_avaliacoes)
+        colunas[9].extend(p._histograma)
+        colunas[10].append(p._visitas)
+    for via in st._rede.values():
+        colunas[11].append(texto(via._inicio))
+        colunas[12].append(texto(via._fim))
+        colunas[13].append(via._distancia)
+        colunas[14].append(via._velocidade_minima)
+        colunas[15].append(via._velocidade_maxima)
+    for v, adjacentes in st._grafo._vertices.items():
+        colunas[16].append(texto(v))
+        for adj, peso in adjacentes.items():
+            colunas[17].append(ids[v])
+            colunas[18].append(texto(adj))
+            colunas[19].append(peso)
+    textos: bytes = "\0".join(ids).encode("UTF-8")
+    with open(caminho, "wb") as f:
+        f.write(
+            CABECALHO.pack(
+                MAGICO,
+                VERSAO,
+                geracao,
+                len(ids),
+                len(textos),
+                len(colunas[0]),
+                len(colunas[11]),
+                len(colunas[16]),
+                len(colunas[17]),
+            )
+        )
+        f.write(textos)
+        for coluna in colunas:
+            if sys.byteorder == "big":
+                coluna.byteswap()
+            coluna.tofile(f)
+
+
+def carregar_binario(st: SistemaTuristico, caminho: str) -> int:
+    """
+    Carrega um snapshot binário para o objeto da classe SistemaTuristico.
+    O ficheiro é mapeado em memória e cada coluna é lida de uma só vez.
+    A recolha de lixo cíclica fica suspensa enquanto são criados os objetos,
+    que não formam ciclos por libertar
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param caminho: ficheiro a carregar
+    :type caminho: str
+    :return: geração do snapshot
+    :rtype: int
+    """
+    with open(caminho, "rb") as f:
+        if os.fstat(f.fileno()).st_size < CABECALHO.size:
+            raise ErroSnapshot(f"Snapshot truncado: {caminho}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa, memoryview(
+            mapa
+        ) as dados:
+            (
+                magico,
+                versao,
+                geracao,
+                n_textos,
+                n_bytes,
+                n_pontos,
+                n_vias,
+                n_vertices,
+                n_arestas,
+            ) = CABECALHO.unpack_from(dados)
+            if magico != MAGICO or versao != VERSAO:
+                raise ErroSnapshot(f"Formato de snapshot desconhecido: {caminho}")
+            posicao: int = CABECALHO.size + n_bytes
+            textos: List[str] = (
+                str(dados[CABECALHO.size : posicao], "UTF-8").split("\0")
+                if n_textos
+                else []
+            )
+            colunas: List[array] = []
+            for tipo, tamanho in _colunas(n_pontos, n_vias, n_vertices, n_arestas):
+                coluna: array = array(tipo)
+                fim: int = posicao + tamanho * coluna.itemsize
+                if fim > len(dados):
+                    raise ErroSnapshot(f"Snapshot truncado: {caminho}")
+                coluna.frombytes(dados[posicao:fim])
+                if sys.byteorder == "big":
+                    coluna.byteswap()
+                colunas.append(coluna)
+                posicao = fim
+    if len(textos) != n_textos:
+        raise ErroSnapshot(f"Tabela de textos inválida: {caminho}")
+    for i in COLUNAS_TEXTOS:
+        if colunas[i] and max(colunas[i]) >= n_textos:
+            raise ErroSnapshot(f"Índice de texto inválido: {caminho}")
+    recolha: bool = gc.isenabled()
+    gc.disable()
+    try:
+        _construir(st, textos, colunas)
+    except (IndexError, KeyError) as erro:
+        raise ErroSnapshot(f"Snapshot inconsistente: {caminho}") from erro
+    finally:
+        if recolha:
+            gc.enable()
+    return geracao
+
+
+def _construir(st: SistemaTuristico, textos: List[str], colunas: List[array]) -> None:
+    """
+    Cria os objetos do sistema a partir das colunas lidas do snapshot
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param textos: tabela de textos
+    :type textos: List[str]
+    :param colunas: colunas do snapshot, pela ordem de _colunas
+    :type colunas: List[array]
+    """
+    histogramas: List[int] = colunas[9].tolist()
+    pontos: List[PontoInteresse] = []
+    for i, (d, m, c, a, t, x, y, contagem, soma, visitas) in enumerate(
+        zip(*colunas[:9], colunas[10])
+    ):
+        ponto_interesse: PontoInteresse = PontoInteresse(
+            textos[d], textos[m], Ponto2D(x, y), textos[c], textos[a], textos[t]
+        )
+        ponto_interesse._contagem_avaliacoes = contagem
+        ponto_interesse._soma_avaliacoes = soma
+        ponto_interesse._histograma = histogramas[4 * i : 4 * i + 4]
+        ponto_interesse._visitas = visitas
+        pontos.append(ponto_interesse)
+    st.carregar_pontos(pontos)
+    st._grafo.carregar_arestas(
+        [textos[v] for v in colunas[16]],
+        zip(
+            [textos[v] for v in colunas[17]],
+            [textos[v] for v in colunas[18]],
+            colunas[19],
+        ),
+    )
+    st.carregar_vias(
+        ViaCirculacao(textos[inicio], textos[fim], distancia, minima, maxima)
+        for inicio, fim, distancia, minima, maxima in zip(*colunas[11:16])
+    )
@@ -1,24 +1,96 @@
+import sys
 import webbrowser
-from os import path
-from json import load, dump
-from typing import List, Tuple, Union
+from os import path, replace
+from json import load, dump, loads, dumps
+from typing import List, Optional
 from math import floor
 from sistema.sistema_turistico import SistemaTuristico
-from sistema.ponto_interesse import PontoInteresse
+from sistema.ponto_interesse import ESCALA, PontoInteresse
 from sistema.via_circulacao import ViaCirculacao
 from sistema.Ponto2D import Ponto2D
+from interface.binario import carregar_binario, gravar_binario
+from sistema.instrumentacao import contar
 
+SNAPSHOT: str = "sistema_turistico.json"
+SNAPSHOT_BINARIO: str = "sistema_turistico.bin"
+DIARIO: str = "sistema_turistico.diario"
+LIMITE_DIARIO: int = 1024 * 1024
+PASTA_DADOS: str = path.join(path.dirname(path.abspath(__file__)), "..", "sistema")
 
-def carregar_sistema_turistico(st: SistemaTuristico) -> None:
+
+def ler_avaliacoes(ponto_interesse: PontoInteresse, ponto: dict) -> None:
+    """
+    Lê os agregados das avaliações de um ponto de interesse gravado.
+    Os ficheiros antigos guardam a lista de todas as avaliações,
+    que é convertida nos agregados, ignorando os valores fora da escala
+
+    :param ponto_interesse: ponto de interesse a preencher
+    :type ponto_interesse: PontoInteresse
+    :param ponto: dados gravados do ponto de interesse
+    :type ponto: dict
+    """
+    if "avaliacoes" in ponto:
+        ponto_interesse._contagem_avaliacoes = ponto["avaliacoes"]["contagem"]
+        ponto_interesse._soma_avaliacoes = ponto["avaliacoes"]["soma"]
+        ponto_interesse._histograma = list(ponto["avaliacoes"]["histograma"])
+        return None
+    for avaliacao in ponto.get("avaliacao", []):
+        if isinstance(avaliacao, int) and avaliacao in ESCALA:
+            ponto_interesse._contagem_avaliacoes += 1
+            ponto_interesse._soma_avaliacoes += avaliacao
+            ponto_interesse._histograma[avaliacao - 1] += 1
+
+
+def caminho_ficheiro(nome: str) -> str:
+    """
+    Obtém o caminho de um ficheiro de dados do sistema
+
+    :param nome: nome do ficheiro na pasta PASTA_DADOS
+    :type nome: str
+    :return: caminho do ficheiro
+    :rtype: str
+    """
+    return path.join(PASTA_DADOS, nome)
+
+
+def ler_geracao_diario() -> int:
+    """
+    Lê a geração do diário de alterações, guardada na sua primeira linha
+
+    :return: geração do diário, ou -1 se não existir
+    :rtype: int
     """
-    Carrega os dados do ficheiro json para o objeto da classe SistemaTuristico
+    try:
+        with open(caminho_ficheiro(DIARIO), "r", encoding="UTF-8") as f:
+            return loads(f.readline())["geracao"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return -1
+
+
+def iniciar_diario(geracao: int) -> None:
+    """
+    Substitui o diário de alterações por um diário vazio
+
+    :param geracao: geração do snapshot a que o diário se aplica
+    :type geracao: int
+    """
+    file_path: str = caminho_ficheiro(DIARIO)
+    with open(file_path + ".tmp", "w", encoding="UTF-8") as f:
+        f.write(dumps({"geracao": geracao}) + "\n")
+    replace(file_path + ".tmp", file_path)
+
+
+def importar_json(st: SistemaTuristico, file_path: str) -> int:
+    """
+    Carrega os dados de um ficheiro json para o objeto da classe SistemaTuristico
 
     :param st: objeto que caracteriza o sistema
     :type st: SistemaTuristico
+    :param file_path: ficheiro json a carregar
+    :type file_path: str
+    :return: geração do snapshot, ou 0 se não estiver indicada no ficheiro
+    :rtype: int
     """
-    current_dir = path.dirname(path.abspath(__file__))
-    relative_path = path.join("..", "sistema", "sistema_turistico.json")
-    file_path = path.join(current_dir, relative_path)
     with open(file_path, "r", encoding="UTF-8") as f:
         dados: dict = load(f)
         for ponto in dados["pontos"]:
@@ -30,30 +102,36 @@ def carregar_sistema_turistico(st: SistemaTuristico) -> None:
                 ponto["acessibilidade"],
                 ponto["atividades"],
             )
-            ponto_interesse._avaliacao = ponto["avaliacao"]
+            ler_avaliacoes(ponto_interesse, ponto)
             ponto_interesse._visitas = ponto["visitas"]
             st.adicionar_ponto(ponto_interesse)
-        for via in dados["rede"]:
-            via_circulacao: ViaCirculacao = ViaCirculacao(
+        st._grafo.carregar_vertices(dados["grafo"])
+        st.carregar_vias(
+            ViaCirculacao(
                 via["inicio"],
                 via["fim"],
                 via["distancia"],
                 via["velocidade_minima"],
                 via["velocidade_maxima"],
             )
-            st._rede.append(via_circulacao)
-        for p, a in dados["grafo"].items():
-            st._grafo._vertices[p] = a
+            for via in dados["rede"]
+        )
+    return dados.get("geracao", 0)
 
 
-def gravar_sistema_turistico(st: SistemaTuristico) -> None:
+def exportar_json(st: SistemaTuristico, file_path: str, geracao: int = 0) -> None:
     """
-    Grava os dados do objeto da classe SistemaTuristico no ficheiro json
+    Grava os dados do objeto da classe SistemaTuristico num ficheiro json
 
     :param st: objeto que caracteriza o sistema
     :type st: SistemaTuristico
+    :param file_path: ficheiro json a gravar
+    :type file_path: str
+    :param geracao: geração do snapshot
+    :type geracao: int
     """
     sistema_turistico: dict = {
+        "geracao": geracao,
         "pontos": [
             {
                 "designacao": ponto_interesse._designacao,
@@ -65,7 +143,11 @@ def gravar_sistema_turistico(st: SistemaTuristico) -> None:
                 "categoria": ponto_interesse._categoria,
                 "acessibilidade": ponto_interesse._acessibilidade,
                 "atividades": ponto_interesse._atividades,
-                "avaliacao": ponto_interesse._avaliacao,
+                "avaliacoes": {
+                    "contagem": ponto_interesse._contagem_avaliacoes,
+                    "soma": ponto_interesse._soma_avaliacoes,
+                    "histograma": ponto_interesse._histograma,
+                },
                 "visitas": ponto_interesse._visitas,
             }
             for ponto_interesse in st._pontos
@@ -78,15 +160,146 @@ def gravar_sistema_turistico(st: SistemaTuristico) -> None:
                 "velocidade_minima": via._velocidade_minima,
                 "velocidade_maxima": via._velocidade_maxima,
             }
-            for via in st._rede
+            for via in st._rede.values()
         ],
         "grafo": st._grafo._vertices,
     }
-    current_dir = path.dirname(path.abspath(__file__))
-    relative_path = path.join("..", "sistema", "sistema_turistico.json")
-    file_path = path.join(current_dir, relative_path)
-    with open(file_path, "w", encoding="UTF-8") as f:
+    with open(file_path + ".tmp", "w", encoding="UTF-8") as f:
         dump(sistema_turistico, f, indent=4)
+    replace(file_path + ".tmp", file_path)
+
+
+def carregar_sistema_turistico(st: SistemaTuristico) -> None:
+    """
+    Carrega os dados do snapshot binário, ou do ficheiro json se ainda não
+    existir snapshot binário, para o objeto da classe SistemaTuristico
+    e repete as alterações registadas no diário desde a última compactação.
+    Uma alteração que não pode ser aplicada é ignorada e descrita na saída
+    de erro, para que as restantes continuem a ser carregadas
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    """
+    if path.exists(caminho_ficheiro(SNAPSHOT_BINARIO)):
+        geracao: int = carregar_binario(st, caminho_ficheiro(SNAPSHOT_BINARIO))
+    else:
+        geracao: int = importar_json(st, caminho_ficheiro(SNAPSHOT))
+    if ler_geracao_diario() != geracao:
+        iniciar_diario(geracao)
+        return None
+    with open(caminho_ficheiro(DIARIO), "r", encoding="UTF-8") as f:
+        f.readline()
+        for numero, linha in enumerate(f, 2):
+            try:
+                registo: dict = loads(linha)
+            except ValueError:
+                break
+            try:
+                aplicar_alteracao(st, registo)
+            except (KeyError, TypeError, ValueError) as erro:
+                print(
+                    f"Alteração {numero} do diário ignorada: {erro!r}",
+                    file=sys.stderr,
+                )
+
+
+def gravar_sistema_turistico(st: SistemaTuristico) -> None:
+    """
+    Grava os dados do objeto da classe SistemaTuristico no snapshot binário
+    e esvazia o diário de alterações, cujo conteúdo passa a estar no snapshot
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    """
+    geracao: int = max(ler_geracao_diario(), 0) + 1
+    file_path: str = caminho_ficheiro(SNAPSHOT_BINARIO)
+    gravar_binario(st, file_path + ".tmp", geracao)
+    contar("bytes_escritos", path.getsize(file_path + ".tmp"))
+    replace(file_path + ".tmp", file_path)
+    iniciar_diario(geracao)
+
+
+def registar_alteracao(st: SistemaTuristico, registo: dict) -> None:
+    """
+    Acrescenta uma alteração ao diário, em vez de gravar todo o sistema.
+    Quando o diário excede LIMITE_DIARIO bytes, é compactado no snapshot binário
+
+    :param st: objeto que caracteriza o sistema, já com a alteração feita
+    :type st: SistemaTuristico
+    :param registo: operação e respetivos argumentos
+    :type registo: dict
+    """
+    with open(caminho_ficheiro(DIARIO), "a", encoding="UTF-8") as f:
+        inicio: int = f.tell()
+        f.write(dumps(registo, ensure_ascii=False, separators=(",", ":")) + "\n")
+        tamanho: int = f.tell()
+    contar("bytes_escritos", tamanho - inicio)
+    if tamanho > LIMITE_DIARIO:
+        gravar_sistema_turistico(st)
+
+
+def aplicar_alteracao(st: SistemaTuristico, registo: dict) -> None:
+    """
+    Aplica ao sistema uma alteração lida do diário. As alterações de
+    pontos de interesse e vias que já não existem são ignoradas
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param registo: operação e respetivos argumentos
+    :type registo: dict
+    :raises ValueError: se a operação for desconhecida ou os argumentos
+    forem inválidos
+    """
+    operacao: str = registo["op"]
+    if operacao == "adicionar_ponto":
+        st.adicionar_ponto(
+            PontoInteresse(
+                registo["designacao"],
+                registo["morada"],
+                Ponto2D(registo["x"], registo["y"]),
+                registo["categoria"],
+                registo["acessibilidade"],
+                registo["atividades"],
+            )
+        )
+    elif operacao == "remover_ponto":
+        st.remover_ponto(registo["designacao"])
+    elif operacao == "alterar_ponto":
+        ponto_interesse: Optional[PontoInteresse] = st.obter_ponto(
+            registo["designacao"]
+        )
+        if ponto_interesse is not None:
+            st.alterar_ponto(
+                ponto_interesse, registo["categoria"], registo["acessibilidade"]
+            )
+    elif operacao == "avaliar_ponto":
+        ponto_interesse: Optional[PontoInteresse] = st.obter_ponto(
+            registo["designacao"]
+        )
+        if ponto_interesse is not None:
+            st.avaliar_ponto(registo["avaliacao"], ponto_interesse)
+    elif operacao == "avaliar_pontos":
+        st.avaliar_pontos(registo["contagens"])
+    elif operacao == "acrescentar_vertice":
+        st.acrescentar_vertice(registo["vertice"])
+    elif operacao == "remover_vertice":
+        st.remover_vertice(registo["vertice"])
+    elif operacao == "acrescentar_aresta":
+        st.acrescentar_aresta(
+            ViaCirculacao(
+                registo["inicio"],
+                registo["fim"],
+                registo["distancia"],
+                registo["velocidade_minima"],
+                registo["velocidade_maxima"],
+            )
+        )
+    elif operacao == "remover_aresta":
+        via: Optional[ViaCirculacao] = st.obter_via(registo["inicio"], registo["fim"])
+        if via is not None:
+            st.remover_aresta(via)
+    else:
+        raise ValueError(f"Operação desconhecida no diário: {operacao}")
 
 
 def apresentacao_concelho() -> None:
@@ -127,9 +340,8 @@ def adicionar_ponto_interesse(st: SistemaTuristico) -> str:
     :rtype: str
     """
     designacao: str = str(input("Insira a designação do ponto de interesse: "))
-    for pontos_interesse in st._pontos:
-        if designacao == pontos_interesse._designacao:
-            return "Já existe um ponto de interesse com esta designação\n"
+    if st.existe_ponto(designacao):
+        return "Já existe um ponto de interesse com esta designação\n"
     morada: str = str(input("Insira a morada do ponto de interesse: "))
     latitude: float = float(input("Insira a latitude do ponto de interesse: "))
     longitude: float = float(input("Insira a longitude do ponto de interesse: "))
@@ -156,7 +368,19 @@ def adicionar_ponto_interesse(st: SistemaTuristico) -> str:
             atividades,
         )
     )
-    gravar_sistema_turistico(st)
+    registar_alteracao(
+        st,
+        {
+            "op": "adicionar_ponto",
+            "designacao": designacao,
+            "morada": morada,
+            "x": latitude,
+            "y": longitude,
+            "categoria": categoria.lower(),
+            "acessibilidade": acessibilidade,
+            "atividades": atividades,
+        },
+    )
     return "Ponto de interesse adicionado com sucesso\n"
 
 
@@ -173,23 +397,29 @@ def alterar_ponto_interesse(st: SistemaTuristico) -> str:
     designacao: str = str(
         input("Insira a designação do ponto de interesse que deseja alterar: ")
     )
-    for ponto_interesse in st._pontos:
-        if designacao == ponto_interesse._designacao:
-            categoria: str = str(
-                input("Insira a nova categoria do ponto de interesse: ")
-            )
-            if categoria.lower() not in st._categorias:
-                return "Categoria não existente no sistema\n"
-            acessibilidade: str = str(
-                input(
-                    "Insira informação sobre as novas "
-                    "acessibilidades do ponto de interesse: "
-                )
-            )
-            st.alterar_ponto(ponto_interesse, categoria, acessibilidade)
-            gravar_sistema_turistico(st)
-            return "Ponto de interesse alterado com sucesso\n"
-    return "Não foi encontrado nenhum ponto de interesse com esta designação\n"
+    ponto_interesse: Optional[PontoInteresse] = st.obter_ponto(designacao)
+    if ponto_interesse is None:
+        return "Não foi encontrado nenhum ponto de interesse com esta designação\n"
+    categoria: str = str(input("Insira a nova categoria do ponto de interesse: "))
+    if categoria.lower() not in st._categorias:
+        return "Categoria não existente no sistema\n"
+    acessibilidade: str = str(
+        input(
+            "Insira informação sobre as novas "
+            "acessibilidades do ponto de interesse: "
+        )
+    )
+    st.alterar_ponto(ponto_interesse, categoria.lower(), acessibilidade)
+    registar_alteracao(
+        st,
+        {
+            "op": "alterar_ponto",
+            "designacao": designacao,
+            "categoria": categoria.lower(),
+            "acessibilidade": acessibilidade,
+        },
+    )
+    return "Ponto de interesse alterado com sucesso\n"
 
 
 def pesquisar_pontos_interesse(st: SistemaTuristico) -> str:
@@ -211,7 +441,7 @@ def pesquisar_pontos_interesse(st: SistemaTuristico) -> str:
         return "Categoria não existente no sistema\n"
     return (
         f"Pontos de interesse da categoria {categoria}:\n\n"
-        f"{st.pesquisar_pontos(categoria)}"
+        f"{st.pesquisar_pontos(categoria.lower())}"
     )
 
 
@@ -230,22 +460,24 @@ def avaliar_ponto_interesse(st: SistemaTuristico) -> str:
     designacao: str = str(
         input("Insira a designação do ponto turístico que quer avaliar: ")
     )
-    for ponto_interesse in st._pontos:
-        if ponto_interesse._designacao == designacao:
-            print(
-                "1 - Nada Satisfeito\n"
-                "2 - Pouco Satisfeito\n"
-                "3 - Satisfeito\n"
-                "4 - Muito Satisfeito\n"
-            )
-            avaliacao: int = int(input("Avalie a sua visita: "))
-            while avaliacao not in escala:
-                print("Insira um número que esteja na escala numérica\n")
-                avaliacao: int = int(input("Avalie a sua visita: "))
-            st.avaliar_ponto(avaliacao, ponto_interesse)
-            gravar_sistema_turistico(st)
-            return "Avaliação feita com sucesso!\n"
-    return "Não foi encontrado nenhum ponto de interesse com esta designação\n"
+    ponto_interesse: Optional[PontoInteresse] = st.obter_ponto(designacao)
+    if ponto_interesse is None:
+        return "Não foi encontrado nenhum ponto de interesse com esta designação\n"
+    print(
+        "1 - Nada Satisfeito\n"
+        "2 - Pouco Satisfeito\n"
+        "3 - Satisfeito\n"
+        "4 - Muito Satisfeito\n"
+    )
+    avaliacao: int = int(input("Avalie a sua visita: "))
+    while avaliacao not in escala:
+        print("Insira um número que esteja na escala numérica\n")
+        avaliacao: int = int(input("Avalie a sua visita: "))
+    st.avaliar_ponto(avaliacao, ponto_interesse)
+    registar_alteracao(
+        st, {"op": "avaliar_ponto", "designacao": designacao, "avaliacao": avaliacao}
+    )
+    return "Avaliação feita com sucesso!\n"
 
 
 def consultar_estatisticas_visitas(st: SistemaTuristico) -> str:
@@ -277,11 +509,9 @@ def sugestoes_pontos_interesse(st: SistemaTuristico) -> str:
     """
     latitude: float = float(input("Insira uma latitude: "))
     longitude: float = float(input("Insira uma longitude: "))
-    if st.sugestoes_visitas(latitude, longitude):
-        return (
-            f"Pontos de interesse próximos da localização:\n\n"
-            f"{st.sugestoes_visitas(latitude, longitude)}"
-        )
+    sugestoes: str = st.sugestoes_visitas(latitude, longitude)
+    if sugestoes:
+        return f"Pontos de interesse próximos da localização:\n\n{sugestoes}"
     return "Não foram encontrados pontos de interesse " "próximos desta localização\n"
 
 
@@ -314,14 +544,13 @@ def acrescentar_ponto_rede(st: SistemaTuristico) -> str:
             "que deseja acrescentar à rede: "
         )
     )
-    for ponto_interesse in st._pontos:
-        if designacao == ponto_interesse._designacao:
-            if designacao not in st._grafo._vertices:
-                st.acrescentar_vertice(designacao)
-                gravar_sistema_turistico(st)
-                return "Ponto de interesse adicionado à rede com sucesso\n"
-            return "Já existe um ponto de interesse com esta designação na rede\n"
-    return "Não foi encontrado nenhum ponto de interesse com esta designação \n"
+    if not st.existe_ponto(designacao):
+        return "Não foi encontrado nenhum ponto de interesse com esta designação \n"
+    if designacao not in st._grafo._vertices:
+        st.acrescentar_vertice(designacao)
+        registar_alteracao(st, {"op": "acrescentar_vertice", "vertice": designacao})
+        return "Ponto de interesse adicionado à rede com sucesso\n"
+    return "Já existe um ponto de interesse com esta designação na rede\n"
 
 
 def remover_ponto_rede(st: SistemaTuristico) -> str:
@@ -340,7 +569,7 @@ def remover_ponto_rede(st: SistemaTuristico) -> str:
     )
     if designacao in st._grafo._vertices:
         st.remover_vertice(designacao)
-        gravar_sistema_turistico(st)
+        registar_alteracao(st, {"op": "remover_vertice", "vertice": designacao})
         return "Ponto de interesse removido da rede com sucesso\n"
     return (
         "Não foi encontrado nenhum ponto de interesse " "com esta designação na rede\n"
@@ -382,21 +611,10 @@ def acrescentar_via_rede(st: SistemaTuristico) -> str:
     )
     if inicio == fim:
         return "Pontos da via não podem ser iguais\n"
-    inicio_encontrado: bool = False
-    fim_encontrado: bool = False
-    lat_inicio: float = 0
-    lon_inicio: float = 0
-    lat_fim: float = 0
-    lon_fim: float = 0
-    for ponto_interesse in st._pontos:
-        if inicio == ponto_interesse._designacao:
-            inicio_encontrado: bool = True
-            lat_inicio: float = ponto_interesse._coordenadas._x
-            lon_inicio: float = ponto_interesse._coordenadas._y
-        elif fim == ponto_interesse._designacao:
-            fim_encontrado: bool = True
-            lat_fim: float = ponto_interesse._coordenadas._x
-            lon_fim: float = ponto_interesse._coordenadas._y
+    ponto_inicio: Optional[PontoInteresse] = st.obter_ponto(inicio)
+    ponto_fim: Optional[PontoInteresse] = st.obter_ponto(fim)
+    inicio_encontrado: bool = ponto_inicio is not None
+    fim_encontrado: bool = ponto_fim is not None
     if inicio_encontrado and fim_encontrado:
         if inicio in st._grafo._vertices and fim in st._grafo._vertices:
             if (
@@ -404,7 +622,10 @@ def acrescentar_via_rede(st: SistemaTuristico) -> str:
                 and fim not in st._grafo._vertices[inicio]
             ):
                 distancia_coordenadas: float = st.distancia_terra(
-                    lat_inicio, lon_inicio, lat_fim, lon_fim
+                    ponto_inicio._coordenadas._x,
+                    ponto_inicio._coordenadas._y,
+                    ponto_fim._coordenadas._x,
+                    ponto_fim._coordenadas._y,
                 )
                 distancia: float = float(input("Insira a distância da via (km): "))
                 if distancia <= 0:
@@ -434,7 +655,17 @@ def acrescentar_via_rede(st: SistemaTuristico) -> str:
                         inicio, fim, distancia, velocidade_minima, velocidade_maxima
                     )
                 )
-                gravar_sistema_turistico(st)
+                registar_alteracao(
+                    st,
+                    {
+                        "op": "acrescentar_aresta",
+                        "inicio": inicio,
+                        "fim": fim,
+                        "distancia": distancia,
+                        "velocidade_minima": velocidade_minima,
+                        "velocidade_maxima": velocidade_maxima,
+                    },
+                )
                 return "Via adicionada à rede com sucesso\n"
             return "Via já existe na rede\n"
         return "Pontos de interesse não estão via de circulação"
@@ -466,11 +697,11 @@ def remover_via_rede(st: SistemaTuristico) -> str:
             "Insira a designação do ponto do fim da via " "que deseja remover da rede: "
         )
     )
-    for via in st._rede:
-        if via._inicio == inicio and via._fim == fim:
-            st.remover_aresta(via)
-            gravar_sistema_turistico(st)
-            return "Via removida da rede de circulação com sucesso\n"
+    via: Optional[ViaCirculacao] = st.obter_via(inicio, fim)
+    if via is not None:
+        st.remover_aresta(via)
+        registar_alteracao(st, {"op": "remover_aresta", "inicio": inicio, "fim": fim})
+        return "Via removida da rede de circulação com sucesso\n"
     return "Via não existe na rede de circulação \n"
 
 
@@ -513,18 +744,44 @@ def pontos_criticos_grau_interno(st: SistemaTuristico) -> str:
 
 
 def pontos_criticos_proximidade(st: SistemaTuristico) -> str:
+    """
+    Pontos da rede mais críticos, considerando
+    a métrica de centralidade proximidade,
+    ordenados por ordem decrescente
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :return: pontos ordenados por ordem decrescente da proximidade
+    :rtype: str
+    """
     return st.proximidade()
 
 
-def interromper_via_circulacao(st: SistemaTuristico) -> str:
+def pontos_criticos_intermediacao(st: SistemaTuristico) -> str:
+    """
+    Pontos da rede mais críticos, considerando
+    a métrica de centralidade intermediação,
+    ordenados por ordem decrescente
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :return: pontos ordenados por ordem decrescente da intermediação
+    :rtype: str
+    """
+    return st.intermediacao()
+
+
+def interromper_via_circulacao(st: SistemaTuristico, k: int = 5) -> str:
     """
     Seleciona uma ou mais vias de circulação para interromper
-    temporariamente a circulação viária, indicando os
+    temporariamente a circulação viária, indicando os k melhores
     caminhos alternativos entre os dois pontos da via interrompida,
     ordenados por ordem crescente da distância
 
     :param st: objeto que caracteriza o sistema
     :type st: SistemaTuristico
+    :param k: número máximo de caminhos alternativos
+    :type k: int
     :return: caminhos alternativos entre os dois pontos da via interrompida
     ordenados por ordem crescente da distância
     :rtype: str
@@ -537,46 +794,37 @@ def interromper_via_circulacao(st: SistemaTuristico) -> str:
     fim: str = str(
         input("Insira a designação do ponto do fim da via " "que deseja interromper: ")
     )
-    for via in st._rede:
-        if via._inicio == inicio and via._fim == fim:
-            st.remover_aresta(via)
-            while len(st._rede) > 0:
-                decisao: str = str(input("Deseja interromper mais alguma via? (S/N): "))
-                if decisao.upper() != "S":
-                    break
-                inicio_extra: str = str(
-                    input(
-                        "Insira a designação do ponto do inicio da via "
-                        "que deseja interromper: "
-                    )
-                )
-                fim_extra: str = str(
-                    input(
-                        "Insira a designação do ponto do fim da via "
-                        "que deseja interromper: "
-                    )
-                )
-                removido: bool = False
-                for vias in st._rede:
-                    if vias._inicio == inicio_extra and vias._fim == fim_extra:
-                        st.remover_aresta(vias)
-                        removido: bool = True
-                if not removido:
-                    return "Via não existe na rede de circulação\n"
-            if st._grafo.total_caminhos(inicio, fim):
-                caminhos: List[Tuple[Union[int, float], List[str]]] = st.quick_sort(
-                    st._grafo.distancia_caminhos(st._grafo.total_caminhos(inicio, fim))
-                )
-                caminhos.reverse()
-                caminhos_ordenados: str = ""
-                for c in caminhos:
-                    caminhos_ordenados += (
-                        f"Caminho: {str(c[1])}\n" f"Distância: {str(c[0])}\n\n"
-                    )
-                return caminhos_ordenados
-            else:
-                return "Não existem caminhos\n"
-    return "Via não existe na rede de circulação\n"
+    via: Optional[ViaCirculacao] = st.obter_via(inicio, fim)
+    if via is None:
+        return "Via não existe na rede de circulação\n"
+    st.remover_aresta(via)
+    while len(st._rede) > 0:
+        decisao: str = str(input("Deseja interromper mais alguma via? (S/N): "))
+        if decisao.upper() != "S":
+            break
+        inicio_extra: str = str(
+            input(
+                "Insira a designação do ponto do inicio da via "
+                "que deseja interromper: "
+            )
+        )
+        fim_extra: str = str(
+            input(
+                "Insira a designação do ponto do fim da via " "que deseja interromper: "
+            )
+        )
+        via_extra: Optional[ViaCirculacao] = st.obter_via(inicio_extra, fim_extra)
+        if via_extra is None:
+            return "Via não existe na rede de circulação\n"
+        st.remover_aresta(via_extra)
+    caminhos_ordenados: str = ""
+    for distancia, caminho in st._grafo.caminhos_mais_curtos(inicio, fim, k):
+        caminhos_ordenados += (
+            f"Caminho: {str(caminho)}\n" f"Distância: {str(distancia)}\n\n"
+        )
+    if caminhos_ordenados:
+        return caminhos_ordenados
+    return "Não existem caminhos\n"
 
 
 def obter_itinerario(st: SistemaTuristico) -> str:
@@ -595,23 +843,16 @@ def obter_itinerario(st: SistemaTuristico) -> str:
     inicio: str = str(input("Insira a designação do ponto de origem: "))
     fim: str = str(input("Insira a designação do ponto de destino: "))
     if inicio in st._grafo._vertices and fim in st._grafo._vertices:
-        caminho: Tuple[Union[int, float], List[str]] = st.quick_sort(
-            st._grafo.distancia_caminhos(st._grafo.total_caminhos(inicio, fim))
-        )[-1]
-        tempo_a_pe: float = 0.0
-        tempo_carro: float = 0.0
-        for i in range(len(caminho[1]) - 1):
-            for v in st._rede:
-                if caminho[1][i] == v._inicio and caminho[1][i + 1] == v._fim:
-                    tempo_a_pe += v._tempo_a_pe
-                    tempo_carro += v._tempo_carro
+        distancia, caminho, tempo_a_pe, tempo_carro = st.itinerario(inicio, fim)
+        if not caminho:
+            return "Não existem caminhos\n"
         horas_a_pe: int = floor(tempo_a_pe)
         minutos_a_pe: int = round((tempo_a_pe - horas_a_pe) * 60)
         horas_carro: int = floor(tempo_carro)
         minutos_carro: int = round((tempo_carro - horas_carro) * 60)
         return (
-            f"Caminho: {str(caminho[1])}\n"
-            f"Distância (km): {str(caminho[0])}\n"
+            f"Caminho: {str(caminho)}\n"
+            f"Distância (km): {str(distancia)}\n"
             f"Tempo a percorrer a pé: {horas_a_pe}h {minutos_a_pe}m\n"
             f"Tempo a percorrer de carro: {horas_carro}h {minutos_carro}m\n"
         )
@@ -0,0 +1,471 @@
+import math
+from json import loads, dumps
+from typing import Callable, Iterable, Optional, TextIO
+from sistema.sistema_turistico import SistemaTuristico
+from sistema.ponto_interesse import PontoInteresse
+from interface.input_output import aplicar_alteracao, registar_alteracao
+from interface.avaliacoes import importar_avaliacoes, validar_avaliacao
+from sistema import instrumentacao
+
+METRICAS: tuple = ("grau_externo", "grau_interno", "proximidade", "intermediacao")
+
+
+class ErroComando(Exception):
+    """Comando do modo de lote que não pode ser executado"""
+
+
+def ponto_para_dict(ponto_interesse: PontoInteresse) -> dict:
+    """
+    Converte um ponto de interesse num dicionário serializável em JSON
+
+    :param ponto_interesse: ponto de interesse a converter
+    :type ponto_interesse: PontoInteresse
+    :return: atributos do ponto de interesse
+    :rtype: dict
+    """
+    return {
+        "designacao": ponto_interesse._designacao,
+        "morada": ponto_interesse._morada,
+        "x": ponto_interesse._coordenadas._x,
+        "y": ponto_interesse._coordenadas._y,
+        "categoria": ponto_interesse._categoria,
+        "acessibilidade": ponto_interesse._acessibilidade,
+        "atividades": ponto_interesse._atividades,
+        "visitas": ponto_interesse._visitas,
+        "media": ponto_interesse.media_avaliacao(),
+    }
+
+
+def _obter_categoria(st: SistemaTuristico, comando: dict) -> str:
+    """
+    Obtém a categoria de um comando, verificando se existe no sistema
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param comando: operação e respetivos argumentos
+    :type comando: dict
+    :return: categoria em minúsculas
+    :rtype: str
+    """
+    categoria: str = str(comando["categoria"]).lower()
+    if categoria not in st._categorias:
+        raise ErroComando("Categoria não existente no sistema")
+    return categoria
+
+
+def _inteiro(
+    comando: dict, chave: str, minimo: int, omissao: Optional[int] = None
+) -> Optional[int]:
+    """
+    Obtém um argumento inteiro de um comando, verificando o valor mínimo
+
+    :param comando: operação e respetivos argumentos
+    :type comando: dict
+    :param chave: nome do argumento
+    :type chave: str
+    :param minimo: menor valor aceite
+    :type minimo: int
+    :param omissao: valor devolvido se o argumento não existir
+    :type omissao: Optional[int]
+    :return: valor do argumento, ou omissao
+    :rtype: Optional[int]
+    """
+    valor: object = comando.get(chave)
+    if valor is None:
+        return omissao
+    if isinstance(valor, (bool, float)):
+        raise ErroComando(f"O argumento {chave} tem de ser um número inteiro")
+    inteiro: int = int(valor)
+    if inteiro < minimo:
+        raise ErroComando(f"O argumento {chave} tem de ser pelo menos {minimo}")
+    return inteiro
+
+
+def _real(comando: dict, chave: str, omissao: Optional[float] = None) -> float:
+    """
+    Obtém um argumento real e finito de um comando
+
+    :param comando: operação e respetivos argumentos
+    :type comando: dict
+    :param chave: nome do argumento
+    :type chave: str
+    :param omissao: valor usado se o argumento não existir, ou None
+    se o argumento for obrigatório
+    :type omissao: Optional[float]
+    :return: valor do argumento
+    :rtype: float
+    """
+    valor: float = float(
+        comando[chave] if omissao is None else comando.get(chave, omissao)
+    )
+    if not math.isfinite(valor):
+        raise ErroComando(f"O argumento {chave} tem de ser um número finito")
+    return valor
+
+
+def _obter_ponto(st: SistemaTuristico, designacao: str) -> PontoInteresse:
+    """
+    Obtém um ponto de interesse pela designação
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param designacao: designação do ponto de interesse
+    :type designacao: str
+    :return: ponto de interesse
+    :rtype: PontoInteresse
+    """
+    ponto_interesse: Optional[PontoInteresse] = st.obter_ponto(designacao)
+    if ponto_interesse is None:
+        raise ErroComando(
+            "Não foi encontrado nenhum ponto de interesse com esta designação"
+        )
+    return ponto_interesse
+
+
+def _adicionar_ponto(st: SistemaTuristico, comando: dict) -> dict:
+    """
+    Adiciona um ponto de interesse ao sistema
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param comando: designacao, morada, x, y, categoria,
+    acessibilidade e atividades do ponto de interesse
+    :type comando: dict
+    :return: ponto de interesse adicionado
+    :rtype: dict
+    """
+    designacao: str = str(comando["designacao"])
+    if st.existe_ponto(designacao):
+        raise ErroComando("Já existe um ponto de interesse com esta designação")
+    registo: dict = {
+        "op": "adicionar_ponto",
+        "designacao": designacao,
+        "morada": str(comando.get("morada", "")),
+        "x": _real(comando, "x"),
+        "y": _real(comando, "y"),
+        "categoria": _obter_categoria(st, comando),
+        "acessibilidade": str(comando.get("acessibilidade", "")),
+        "atividades": str(comando.get("atividades", "")),
+    }
+    aplicar_alteracao(st, registo)
+    registar_alteracao(st, registo)
+    return ponto_para_dict(st.obter_ponto(designacao))
+
+
+def _alterar_ponto(st: SistemaTuristico, comando: dict) -> dict:
+    """
+    Altera a categoria e a acessibilidade de um ponto de interesse
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param comando: designacao, categoria e acessibilidade
+    :type comando: dict
+    :return: ponto de interesse alterado
+    :rtype: dict
+    """
+    ponto_interesse: PontoInteresse = _obter_ponto(st, str(comando["designacao"]))
+    registo: dict = {
+        "op": "alterar_ponto",
+        "designacao": ponto_interesse._designacao,
+        "categoria": _obter_categoria(st, comando),
+        "acessibilidade": str(comando["acessibilidade"]),
+    }
+    aplicar_alteracao(st, registo)
+    registar_alteracao(st, registo)
+    return ponto_para_dict(ponto_interesse)
+
+
+def _remover_ponto(st: SistemaTuristico, comando: dict) -> dict:
+    """
+    Remove um ponto de interesse do sistema e da rede de circulação
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param comando: designacao
+    :type comando: dict
+    :return: ponto de interesse removido
+    :rtype: dict
+    """
+    ponto_interesse: PontoInteresse = _obter_ponto(st, str(comando["designacao"]))
+    registo: dict = {"op": "remover_ponto", "designacao": ponto_interesse._designacao}
+    aplicar_alteracao(st, registo)
+    registar_alteracao(st, registo)
+    return ponto_para_dict(ponto_interesse)
+
+
+def _avaliar(st: SistemaTuristico, comando: dict) -> dict:
+    """
+    Avalia um ponto de interesse na escala de 1 a 4
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param comando: designacao e avaliacao
+    :type comando: dict
+    :return: ponto de interesse avaliado
+    :rtype: dict
+    """
+    ponto_interesse: PontoInteresse = _obter_ponto(st, str(comando["designacao"]))
+    try:
+        avaliacao: int = validar_avaliacao(comando["avaliacao"])
+    except (TypeError, ValueError):
+        raise ErroComando("A avaliação tem de estar na escala numérica de 1 a 4")
+    registo: dict = {
+        "op": "avaliar_ponto",
+        "designacao": ponto_interesse._designacao,
+        "avaliacao": avaliacao,
+    }
+    aplicar_alteracao(st, registo)
+    registar_alteracao(st, registo)
+    return ponto_para_dict(ponto_interesse)
+
+
+def _avaliar_varios(st: SistemaTuristico, comando: dict) -> dict:
+    """
+    Avalia vários pontos de interesse de uma só vez, ignorando as
+    avaliações inválidas
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param comando: avaliacoes, lista de pares [designacao, avaliacao]
+    :type comando: dict
+    :return: número de avaliações aplicadas e erros
+    :rtype: dict
+    """
+    aplicadas, erros = importar_avaliacoes(
+        st, ((str(d), a) for d, a in comando["avaliacoes"])
+    )
+    return {"aplicadas": aplicadas, "erros": erros}
+
+
+def _pesquisar(st: SistemaTuristico, comando: dict) -> list:
+    """
+    Pesquisa os pontos de interesse de uma categoria por ordem alfabética
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param comando: categoria e, opcionalmente, inicio e limite
+    :type comando: dict
+    :return: pontos de interesse da categoria
+    :rtype: list
+    """
+    return [
+        ponto_para_dict(p)
+        for p in st.iterar_categoria(
+            _obter_categoria(st, comando),
+            _inteiro(comando, "inicio", 0, 0),
+            _inteiro(comando, "limite", 0),
+        )
+    ]
+
+
+def _itinerario(st: SistemaTuristico, comando: dict) -> Optional[dict]:
+    """
+    Calcula o caminho mais curto entre dois pontos da rede
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param comando: inicio e fim
+    :type comando: dict
+    :return: caminho, distância (km) e tempos estimados (h) a pé e de carro,
+    ou None se não existir caminho
+    :rtype: Optional[dict]
+    """
+    inicio: str = str(comando["inicio"])
+    fim: str = str(comando["fim"])
+    if inicio not in st._grafo._vertices or fim not in st._grafo._vertices:
+        raise ErroComando("Pontos de interesse não encontrados")
+    distancia, caminho, tempo_a_pe, tempo_carro = st.itinerario(inicio, fim)
+    if not caminho:
+        return None
+    return {
+        "caminho": caminho,
+        "distancia": distancia,
+        "tempo_a_pe": tempo_a_pe,
+        "tempo_carro": tempo_carro,
+    }
+
+
+def _sugestoes(st: SistemaTuristico, comando: dict) -> list:
+    """
+    Obtém os pontos de interesse próximos de uma coordenada
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param comando: x, y e, opcionalmente, raio (m)
+    :type comando: dict
+    :return: pontos de interesse por ordem decrescente do número de visitas
+    :rtype: list
+    """
+    return [
+        ponto_para_dict(p)
+        for p in st.pontos_proximos(
+            _real(comando, "x"), _real(comando, "y"), _real(comando, "raio", 5000)
+        )
+    ]
+
+
+def _pontos_criticos(st: SistemaTuristico, comando: dict) -> list:
+    """
+    Obtém os pontos da rede por ordem decrescente de uma métrica de centralidade
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param comando: metrica e, para a proximidade e a intermediação,
+    opcionalmente amostra
+    :type comando: dict
+    :return: ponto da rede e valor da métrica
+    :rtype: list
+    """
+    metrica: str = str(comando.get("metrica", "grau_externo"))
+    if metrica not in METRICAS:
+        raise ErroComando(f"Métrica desconhecida: {metrica}")
+    return [
+        {"ponto": v, "valor": valor}
+        for valor, v in st.pontos_criticos(metrica, _inteiro(comando, "amostra", 1))
+    ]
+
+
+def _estatisticas(st: SistemaTuristico, comando: dict) -> dict:
+    """
+    Obtém o número de visitas e a classificação média de cada ponto
+    de interesse e o número total de avaliações por valor da escala
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param comando: sem argumentos
+    :type comando: dict
+    :return: estatísticas dos pontos de interesse
+    :rtype: dict
+    """
+    return {
+        "pontos": [
+            {
+                "designacao": p._designacao,
+                "categoria": p._categoria,
+                "visitas": p._visitas,
+                "media": p.media_avaliacao(),
+            }
+            for p in st._pontos
+        ],
+        "avaliacoes": st.histograma_avaliacoes(),
+    }
+
+
+def _instrumentacao(st: SistemaTuristico, comando: dict) -> dict:
+    """
+    Obtém o relatório da instrumentação, se estiver ativa
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param comando: "limpar" opcional, que descarta os registos
+    depois de obtido o relatório
+    :type comando: dict
+    :return: chamadas de cada operação e contadores de trabalho
+    :rtype: dict
+    """
+    if not instrumentacao.ativa():
+        raise ErroComando("Instrumentação não ativa (opção --instrumentar)")
+    relatorio: dict = instrumentacao.relatorio()
+    if comando.get("limpar"):
+        instrumentacao.limpar()
+    return relatorio
+
+
+COMANDOS: dict[str, Callable[[SistemaTuristico, dict], object]] = {
+    "adicionar_ponto": _adicionar_ponto,
+    "alterar_ponto": _alterar_ponto,
+    "remover_ponto": _remover_ponto,
+    "avaliar": _avaliar,
+    "avaliar_varios": _avaliar_varios,
+    "pesquisar": _pesquisar,
+    "itinerario": _itinerario,
+    "sugestoes": _sugestoes,
+    "pontos_criticos": _pontos_criticos,
+    "estatisticas": _estatisticas,
+    "instrumentacao": _instrumentacao,
+}
+
+ESCRITAS: frozenset = frozenset(
+    ("adicionar_ponto", "alterar_ponto", "remover_ponto", "avaliar", "avaliar_varios")
+)
+"""comandos que alteram o sistema e o diário"""
+
+
+def executar_comando(st: SistemaTuristico, comando: dict) -> dict:
+    """
+    Executa um comando sobre o sistema, sem pedir dados ao utilizador
+    nem abrir janelas de gráficos
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param comando: operação ("op") e respetivos argumentos; um
+    "id" opcional é devolvido na resposta
+    :type comando: dict
+    :return: {"ok": True, "resultado": ...} ou {"ok": False, "erro": ...}
+    :rtype: dict
+    """
+    resposta: dict = {}
+    if "id" in comando:
+        resposta["id"] = comando["id"]
+    try:
+        operacao: Callable[[SistemaTuristico, dict], object] = COMANDOS[comando["op"]]
+    except (KeyError, TypeError):
+        resposta.update(ok=False, erro=f"Operação desconhecida: {comando.get('op')}")
+        return resposta
+    try:
+        resposta.update(ok=True, resultado=operacao(st, comando))
+    except ErroComando as erro:
+        resposta.update(ok=False, erro=str(erro))
+    except KeyError as erro:
+        resposta.update(ok=False, erro=f"Argumento em falta: {erro.args[0]}")
+    except (TypeError, ValueError) as erro:
+        resposta.update(ok=False, erro=f"Argumento inválido: {erro}")
+    except Exception as erro:
+        resposta.update(ok=False, erro=f"Erro interno: {type(erro).__name__}: {erro}")
+    return resposta
+
+
+def executar_linha(st: SistemaTuristico, linha: str) -> dict:
+    """
+    Executa um comando escrito numa linha em JSON
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param linha: comando em JSON
+    :type linha: str
+    :return: resposta ao comando
+    :rtype: dict
+    """
+    try:
+        comando = loads(linha)
+    except ValueError as erro:
+        return {"ok": False, "erro": f"JSON inválido: {erro}"}
+    if not isinstance(comando, dict):
+        return {"ok": False, "erro": "O comando tem de ser um objeto JSON"}
+    return executar_comando(st, comando)
+
+
+def executar_lote(st: SistemaTuristico, entrada: Iterable[str], saida: TextIO) -> int:
+    """
+    Executa uma sequência de comandos em JSON, um por linha, escrevendo
+    uma resposta em JSON por linha. As linhas vazias são ignoradas
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param entrada: linhas com os comandos
+    :type entrada: Iterable[str]
+    :param saida: destino das respostas
+    :type saida: TextIO
+    :return: número de comandos que falharam
+    :rtype: int
+    """
+    falhas: int = 0
+    for linha in entrada:
+        if not linha.strip():
+            continue
+        resposta: dict = executar_linha(st, linha)
+        if not resposta["ok"]:
+            falhas += 1
+        saida.write(dumps(resposta, ensure_ascii=False) + "\n")
+    saida.flush()
+    return falhas
@@ -128,7 +128,8 @@ def opcoes_menu3() -> str:
         "1 - Consultar pontos críticos pelo seu grau externo\n"
         "2 - Consultar pontos críticos pelo seu grau interno\n"
         "3 - Consultar pontos críticos pela sua proximidade\n"
-        "4 - Voltar atrás\n"
+        "4 - Consultar pontos críticos pela sua intermediação\n"
+        "5 - Voltar atrás\n"
     )
 
 
@@ -149,5 +150,7 @@ def menu3(st: SistemaTuristico) -> None:
             print(io.pontos_criticos_grau_interno(st))
         elif op == 3:
             print(io.pontos_criticos_proximidade(st))
+        elif op == 4:
+            print(io.pontos_criticos_intermediacao(st))
         else:
             fim = True
@@ -0,0 +1,210 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from json import dumps, loads
+from typing import Optional
+from sistema.sistema_turistico import SistemaTuristico
+from sistema.concorrencia import TrancaLeituraEscrita
+from interface.lote import ESCRITAS, executar_comando
+
+LIMITE_LINHA: int = 16 * 1024 * 1024
+"""tamanho máximo (bytes) de um pedido"""
+
+
+def _erro_interno(erro: Exception) -> dict:
+    """
+    Resposta a um comando que falhou com uma exceção inesperada
+
+    :param erro: exceção
+    :type erro: Exception
+    :return: resposta de erro
+    :rtype: dict
+    """
+    return {"ok": False, "erro": f"Erro interno: {type(erro).__name__}: {erro}"}
+
+
+class Servidor:
+    """
+    Servidor local que executa comandos do modo de lote recebidos em JSON,
+    um por linha, por TCP ou por um socket Unix. Os comandos são executados
+    numa pool de threads: as consultas em simultâneo e as alterações em
+    exclusivo. Consultas idênticas que chegam enquanto uma igual está a ser
+    executada partilham o seu resultado em vez de serem repetidas
+    """
+
+    def __init__(self, st: SistemaTuristico, threads: int = 4, agrupar: bool = True):
+        """
+        Define o estado inicial de self
+
+        :param st: objeto que caracteriza o sistema
+        :type st: SistemaTuristico
+        :param threads: número de threads que executam os comandos
+        :type threads: int
+        :param agrupar: se False, as consultas iguais não são agrupadas
+        :type agrupar: bool
+        """
+        self._agrupar: bool = agrupar
+        self._st: SistemaTuristico = st
+        self._tranca: TrancaLeituraEscrita = TrancaLeituraEscrita()
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(threads)
+        self._em_curso: dict[str, asyncio.Future] = {}
+        self.pedidos: int = 0
+        """número de comandos recebidos"""
+        self.agrupados: int = 0
+        """número de consultas respondidas com o resultado de outra igual"""
+
+    def _executar(self, comando: dict) -> dict:
+        """
+        Executa um comando com a tranca adequada, numa thread da pool
+
+        :param comando: operação e respetivos argumentos, sem "id"
+        :type comando: dict
+        :return: resposta ao comando; uma exceção inesperada também é
+        devolvida como resposta, para que as consultas agrupadas recebam
+        sempre um resultado
+        :rtype: dict
+        """
+        try:
+            if comando.get("op") in ESCRITAS:
+                with self._tranca.escrita():
+                    return executar_comando(self._st, comando)
+            with self._tranca.leitura():
+                return executar_comando(self._st, comando)
+        except Exception as erro:
+            return _erro_interno(erro)
+
+    def _terminado(self, chave: str, futuro: asyncio.Future) -> None:
+        """
+        Deixa de agrupar pedidos com uma consulta que terminou
+
+        :param chave: comando da consulta em JSON
+        :type chave: str
+        :param futuro: resultado da consulta
+        :type futuro: asyncio.Future
+        """
+        if self._em_curso.get(chave) is futuro:
+            del self._em_curso[chave]
+
+    async def executar(self, comando: dict) -> dict:
+        """
+        Executa um comando, agrupando-o com uma consulta igual em curso.
+        Depois de cada alteração, as consultas seguintes já não são
+        agrupadas com as que começaram antes dela
+
+        :param comando: operação ("op") e respetivos argumentos; um
+        "id" opcional é devolvido na resposta
+        :type comando: dict
+        :return: resposta ao comando
+        :rtype: dict
+        """
+        self.pedidos += 1
+        identificador: Optional[object] = comando.pop("id", None)
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if comando.get("op") in ESCRITAS or not self._agrupar:
+            resposta: dict = await loop.run_in_executor(
+                self._executor, self._executar, comando
+            )
+            self._em_curso.clear()
+        else:
+            chave: str = dumps(comando, sort_keys=True)
+            futuro: Optional[asyncio.Future] = self._em_curso.get(chave)
+            if futuro is None:
+                futuro = loop.run_in_executor(self._executor, self._executar, comando)
+                self._em_curso[chave] = futuro
+                futuro.add_done_callback(lambda f: self._terminado(chave, f))
+            else:
+                self.agrupados += 1
+            resposta = await asyncio.shield(futuro)
+        if identificador is not None:
+            resposta = {"id": identificador, **resposta}
+        return resposta
+
+    async def tratar_cliente(
+        self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter
+    ) -> None:
+        """
+        Responde aos comandos de uma ligação, pela ordem em que chegam,
+        até o cliente fechar a ligação
+
+        :param leitor: pedidos do cliente
+        :type leitor: asyncio.StreamReader
+        :param escritor: respostas ao cliente
+        :type escritor: asyncio.StreamWriter
+        """
+        try:
+            while True:
+                try:
+                    linha: bytes = await leitor.readline()
+                except ValueError:
+                    resposta: dict = {"ok": False, "erro": "Pedido demasiado grande"}
+                    escritor.write((dumps(resposta) + "\n").encode())
+                    break
+                if not linha:
+                    break
+                if not linha.strip():
+                    continue
+                try:
+                    comando = loads(linha)
+                except ValueError as erro:
+                    resposta = {"ok": False, "erro": f"JSON inválido: {erro}"}
+                else:
+                    if not isinstance(comando, dict):
+                        resposta = {
+                            "ok": False,
+                            "erro": "O comando tem de ser um objeto JSON",
+                        }
+                    else:
+                        try:
+                            resposta = await self.executar(comando)
+                        except Exception as erro:
+                            resposta = _erro_interno(erro)
+                escritor.write((dumps(resposta, ensure_ascii=False) + "\n").encode())
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    async def iniciar(self, endereco: str) -> asyncio.AbstractServer:
+        """
+        Começa a aceitar ligações
+
+        :param endereco: "anfitrião:porta" para TCP, ou caminho de um
+        socket Unix
+        :type endereco: str
+        :return: servidor asyncio
+        :rtype: asyncio.AbstractServer
+        """
+        anfitriao, separador, porta = endereco.rpartition(":")
+        if separador and porta.isdigit():
+            return await asyncio.start_server(
+                self.tratar_cliente,
+                anfitriao or "127.0.0.1",
+                int(porta),
+                limit=LIMITE_LINHA,
+            )
+        return await asyncio.start_unix_server(
+            self.tratar_cliente, endereco, limit=LIMITE_LINHA
+        )
+
+    def fechar(self) -> None:
+        """Termina as threads que executam os comandos"""
+        self._executor.shutdown()
+
+
+async def servir(st: SistemaTuristico, endereco: str, threads: int = 4) -> None:
+    """
+    Executa o servidor até o processo ser interrompido
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param endereco: "anfitrião:porta" para TCP, ou caminho de um socket Unix
+    :type endereco: str
+    :param threads: número de threads que executam os comandos
+    :type threads: int
+    """
+    servidor: Servidor = Servidor(st, threads)
+    try:
+        async with await servidor.iniciar(endereco) as servidor_asyncio:
+            await servidor_asyncio.serve_forever()
+    finally:
+        servidor.fechar()
@@ -1,21 +1,129 @@
 import sys
 import os
+from argparse import ArgumentParser, Namespace
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from sistema.sistema_turistico import SistemaTuristico
-from interface.input_output import carregar_sistema_turistico
+from interface.input_output import (
+    carregar_sistema_turistico,
+    gravar_sistema_turistico,
+    importar_json,
+    exportar_json,
+    ler_geracao_diario,
+)
 from interface.menu import menu
+from interface.lote import executar_lote
+from interface.avaliacoes import importar_avaliacoes, ler_eventos
+from sistema import instrumentacao
+
+
+def argumentos() -> Namespace:
+    """
+    Interpreta os argumentos da linha de comandos
+
+    :return: argumentos interpretados
+    :rtype: Namespace
+    """
+    parser: ArgumentParser = ArgumentParser(
+        description="Sistema turístico do concelho de Angra do Heroísmo"
+    )
+    parser.add_argument(
+        "--lote",
+        nargs="?",
+        const="-",
+        metavar="FICHEIRO",
+        help="executa os comandos em JSON, um por linha, do ficheiro indicado "
+        "(ou da entrada padrão) e escreve as respostas em JSON na saída padrão",
+    )
+    parser.add_argument(
+        "--importar",
+        metavar="FICHEIRO",
+        help="substitui os dados do sistema pelos de um ficheiro json e termina",
+    )
+    parser.add_argument(
+        "--exportar",
+        metavar="FICHEIRO",
+        help="grava os dados do sistema num ficheiro json e termina",
+    )
+    parser.add_argument(
+        "--avaliacoes",
+        metavar="FICHEIRO",
+        help="aplica as avaliações de um ficheiro CSV (designacao,avaliacao) "
+        "ou JSON, uma por linha, ou da entrada padrão se for -, e termina",
+    )
+    parser.add_argument(
+        "--servidor",
+        nargs="?",
+        const="127.0.0.1:8765",
+        metavar="ENDERECO",
+        help="aceita comandos em JSON, um por linha, em anfitrião:porta "
+        "(por omissão 127.0.0.1:8765) ou num socket Unix",
+    )
+    parser.add_argument(
+        "--instrumentar",
+        nargs="?",
+        const="-",
+        metavar="FICHEIRO",
+        help="regista o número e a duração das chamadas às operações e grava "
+        "o relatório em json no ficheiro indicado (ou na saída de erro) "
+        "quando o programa termina",
+    )
+    return parser.parse_args()
 
 
 def main() -> None:
     """
     Função principal do programa que cria um objeto
     que caracteriza o sistema, carrega dados nele
-    e chama o menu principal
+    e chama o menu principal, ou executa os comandos
+    em lote se for usada a opção --lote. As opções --importar
+    e --exportar convertem os dados de e para json, a opção --avaliacoes
+    aplica avaliações em massa e a opção --instrumentar ativa a
+    instrumentação das operações. A opção --servidor aceita os comandos
+    do modo em lote através da rede
     """
+    args: Namespace = argumentos()
+    if args.instrumentar is not None:
+        instrumentacao.ativar(args.instrumentar)
     st: SistemaTuristico = SistemaTuristico()
+    if args.importar is not None:
+        importar_json(st, args.importar)
+        gravar_sistema_turistico(st)
+        return
     carregar_sistema_turistico(st)
-    menu(st)
+    if args.exportar is not None:
+        exportar_json(st, args.exportar, ler_geracao_diario())
+        return
+    if args.avaliacoes is not None:
+        if args.avaliacoes == "-":
+            aplicadas, erros = importar_avaliacoes(st, ler_eventos(sys.stdin))
+        else:
+            with open(args.avaliacoes, "r", encoding="utf-8") as ficheiro:
+                aplicadas, erros = importar_avaliacoes(st, ler_eventos(ficheiro))
+        for erro in erros:
+            print(erro, file=sys.stderr)
+        print(f"{aplicadas} avaliações aplicadas, {len(erros)} ignoradas")
+        sys.exit(1 if erros else 0)
+    if args.servidor is not None:
+        import asyncio
+        from interface.servidor import servir
+
+        os.environ["MPLBACKEND"] = "Agg"
+        try:
+            asyncio.run(servir(st, args.servidor))
+        except KeyboardInterrupt:
+            pass
+        return
+    if args.lote is None:
+        menu(st)
+        return
+    os.environ["MPLBACKEND"] = "Agg"
+    if args.lote == "-":
+        falhas: int = executar_lote(st, sys.stdin, sys.stdout)
+    else:
+        with open(args.lote, "r", encoding="utf-8") as ficheiro:
+            falhas: int = executar_lote(st, ficheiro, sys.stdout)
+    sys.exit(1 if falhas else 0)
 
 
 if __name__ == "__main__":
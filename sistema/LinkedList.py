@@ -1,4 +1,4 @@
-from typing import TypeVar, Generic, Optional
+from typing import TypeVar, Generic, Iterator, Optional
 
 
 T = TypeVar("T")
@@ -7,6 +7,8 @@ T = TypeVar("T")
 class DoubleNode(Generic[T]):
     """Nó duplamente ligado"""
 
+    __slots__ = ("_data", "_next", "_prev", "_list")
+
     def __init__(self, data: T):
         """
         Define o estado inicial de self
@@ -17,15 +19,28 @@ class DoubleNode(Generic[T]):
         self._data: T = data
         self._next: Optional[DoubleNode] = None
         self._prev: Optional[DoubleNode] = None
+        self._list: Optional[LinkedList] = None
 
 
 class LinkedList(Generic[T]):
     """TDA Lista baseado em estruturas duplamente ligadas"""
 
+    __slots__ = ("_head", "_tail", "_size")
+
     def __init__(self):
         """Define o estado inicial de self"""
         self._head: Optional[DoubleNode] = None
         self._tail: Optional[DoubleNode] = None
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        """
+        Verifica o número de nós da lista
+
+        :return: número de nós
+        :rtype: int
+        """
+        return self._size
 
     def __iter__(self):
         """
@@ -39,14 +54,30 @@ class LinkedList(Generic[T]):
             yield current._data
             current: Optional[DoubleNode] = current._next
 
-    def add(self, data: T) -> None:
+    def __reversed__(self) -> Iterator[T]:
         """
-        Adiciona um novo nó com determinados dados
+        Itera sobre a lista do fim para o início
+
+        :yield: dados do nó atual
+        :rtype: T
+        """
+        current: Optional[DoubleNode] = self._tail
+        while current:
+            yield current._data
+            current = current._prev
+
+    def add(self, data: T) -> DoubleNode[T]:
+        """
+        Adiciona um novo nó com determinados dados no fim da lista
 
         :param data: dados a adicionar
         :type data: T
+        :return: nó adicionado, que pode ser usado para o remover ou
+        alterar sem percorrer a lista
+        :rtype: DoubleNode[T]
         """
         new_node: DoubleNode = DoubleNode(data)
+        new_node._list = self
         if self._head is None:
             self._head = new_node
             self._tail = new_node
@@ -54,6 +85,60 @@ class LinkedList(Generic[T]):
             new_node._prev = self._tail
             self._tail._next = new_node
             self._tail = new_node
+        self._size += 1
+        return new_node
+
+    def _check_node(self, node: DoubleNode[T]) -> None:
+        """
+        Verifica que um nó pertence à lista
+
+        :param node: nó a verificar
+        :type node: DoubleNode[T]
+        :raises ValueError: se o nó já tiver sido removido ou
+        pertencer a outra lista
+        """
+        if node._list is not self:
+            raise ValueError("O nó não pertence a esta lista")
+
+    def unlink(self, node: DoubleNode[T]) -> T:
+        """
+        Remove um nó da lista em tempo constante
+
+        :param node: nó devolvido por add
+        :type node: DoubleNode[T]
+        :return: dados do nó removido
+        :rtype: T
+        :raises ValueError: se o nó já tiver sido removido ou
+        pertencer a outra lista
+        """
+        self._check_node(node)
+        if node._prev:
+            node._prev._next = node._next
+        else:
+            self._head = node._next
+        if node._next:
+            node._next._prev = node._prev
+        else:
+            self._tail = node._prev
+        node._prev = None
+        node._next = None
+        node._list = None
+        self._size -= 1
+        return node._data
+
+    def update_node(self, node: DoubleNode[T], new_data: T) -> None:
+        """
+        Altera os dados de um nó da lista em tempo constante
+
+        :param node: nó devolvido por add
+        :type node: DoubleNode[T]
+        :param new_data: dados a serem inseridos no nó
+        :type new_data: T
+        :raises ValueError: se o nó já tiver sido removido ou
+        pertencer a outra lista
+        """
+        self._check_node(node)
+        node._data = new_data
 
     def remove(self, data: T) -> None:
         """
@@ -65,14 +150,7 @@ class LinkedList(Generic[T]):
         current: Optional[DoubleNode] = self._head
         while current:
             if current._data == data:
-                if current._prev:
-                    current._prev._next = current._next
-                else:
-                    self._head = current._next
-                if current._next:
-                    current._next._prev = current._prev
-                else:
-                    self._tail = current._prev
+                self.unlink(current)
                 return None
             current: Optional[DoubleNode] = current._next
 
@@ -4,6 +4,8 @@ from typing import Union
 class Ponto2D:
     """Classe que representa um Ponto 2D, com duas cooordenadas"""
 
+    __slots__ = ("_x", "_y")
+
     def __init__(self, x: Union[int, float], y: Union[int, float]):
         """
         Define o estado inicial de self
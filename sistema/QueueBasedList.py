@@ -1,27 +1,66 @@
-from typing import TypeVar, Generic, List, Iterator
+from typing import TypeVar, Generic, Iterable, List, Iterator, Optional
 
 
 T = TypeVar("T")
 
 
 class QueueBasedList(Generic[T]):
-    """Implementation of ADT Queue based on Python type list."""
+    """
+    Implementation of ADT Queue based on a growable ring buffer stored in a
+    Python list, so that add and pop take O(1) amortized time. The queue
+    may be given a maximum capacity, in which case the buffer never grows
+    beyond it and adding to a full queue raises OverflowError.
+    """
 
-    def __init__(self, source_collection=None):
+    __slots__ = ("_items", "_head", "_size", "_capacity")
+
+    _MIN_BUFFER: int = 8
+    """initial length of the ring buffer"""
+
+    def __init__(self, source_collection=None, capacity: Optional[int] = None):
         """
         Sets the initial state of self, which includes the
         contents of source_collection, if it's present.
         :param source_collection: initial content of self
+        :param capacity: maximum number of items, or None for no limit
         """
-        self._items: List[T] = list()
-        """current elements in queue"""
+        if capacity is not None and capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self._capacity: Optional[int] = capacity
+        """maximum size of queue, or None if unbounded"""
+
+        self._items: List[Optional[T]] = [None] * self._initial_buffer()
+        """ring buffer with the current elements in queue"""
+
+        self._head: int = 0
+        """position of the first element in the ring buffer"""
 
         self._size: int = 0
         """current size of queue"""
 
         if source_collection:
-            for item in source_collection:
-                self.add(item)
+            self.extend(source_collection)
+
+    def _initial_buffer(self) -> int:
+        """
+        Gets the length of the ring buffer of an empty queue.
+        :return: the initial buffer length
+        """
+        if self._capacity is None:
+            return self._MIN_BUFFER
+        return min(self._MIN_BUFFER, self._capacity)
+
+    def _resize(self, length: int) -> None:
+        """
+        Copies the items to a new ring buffer, starting at position 0.
+        :param length: length of the new buffer, at least len(self)
+        :return: None
+        """
+        items: List[Optional[T]] = list(self)
+        items.extend([None] * (length - self._size))
+        self._items = items
+        self._head = 0
 
     # collection accessor methods
 
@@ -30,7 +69,21 @@ class QueueBasedList(Generic[T]):
         Tests if self is empty.
         :return: True if len(self) is 0, otherwise False
         """
-        return len(self) == 0
+        return self._size == 0
+
+    def is_full(self) -> bool:
+        """
+        Tests if self is bounded and has reached its capacity.
+        :return: True if len(self) is the capacity, otherwise False
+        """
+        return self._size == self._capacity
+
+    def capacity(self) -> Optional[int]:
+        """
+        Gets the maximum number of items in self.
+        :return: the capacity, or None if self is unbounded
+        """
+        return self._capacity
 
     def __len__(self) -> int:
         """
@@ -48,10 +101,13 @@ class QueueBasedList(Generic[T]):
 
     def __iter__(self) -> Iterator:
         """
-        Supports iteration over a view of self.
+        Supports iteration over a view of self, from the top to the rear.
         :return: an iteration of self
         """
-        return iter(self._items)
+        end: int = self._head + self._size
+        if end <= len(self._items):
+            return iter(self._items[self._head : end])
+        return iter(self._items[self._head :] + self._items[: end - len(self._items)])
 
     # collection mutator methods
 
@@ -60,7 +116,8 @@ class QueueBasedList(Generic[T]):
         Makes self become empty.
         :return: None
         """
-        self._items = list()
+        self._items = [None] * self._initial_buffer()
+        self._head = 0
         self._size = 0
 
     # Queue accessor methods
@@ -70,7 +127,9 @@ class QueueBasedList(Generic[T]):
         Gets the item at the top of the queue, assuming the queue is not empty.
         :return: the top item
         """
-        return self._items[0]
+        if self._size == 0:
+            raise IndexError("peek from empty queue")
+        return self._items[self._head]
 
     # Queue mutator methods
 
@@ -80,7 +139,18 @@ class QueueBasedList(Generic[T]):
         :param item: the item to insert
         :return: None
         """
-        self._items.append(item)
+        length: int = len(self._items)
+        if self._size == length:
+            if self._size == self._capacity:
+                raise OverflowError("add to full queue")
+            length *= 2
+            if self._capacity is not None:
+                length = min(length, self._capacity)
+            self._resize(length)
+        rear: int = self._head + self._size
+        if rear >= length:
+            rear -= length
+        self._items[rear] = item
         self._size += 1
 
     def pop(self) -> T:
@@ -88,5 +158,54 @@ class QueueBasedList(Generic[T]):
         Removes the item at top of the queue, assuming the queue is not empty
         :return: the item removed
         """
+        if self._size == 0:
+            raise IndexError("pop from empty queue")
+        item: T = self._items[self._head]
+        self._items[self._head] = None
+        self._head += 1
+        if self._head == len(self._items):
+            self._head = 0
         self._size -= 1
-        return self._items.pop(0)
+        if self._MIN_BUFFER < self._size * 4 < len(self._items):
+            self._resize(len(self._items) // 2)
+        return item
+
+    def extend(self, items: Iterable[T]) -> None:
+        """
+        Inserts several items at the rear of the queue, in order. If the
+        queue is bounded and becomes full, the remaining items are not
+        inserted and OverflowError is raised.
+        :param items: the items to insert
+        :return: None
+        """
+        items = list(items)
+        length: int = len(self._items)
+        needed: int = self._size + len(items)
+        if needed > length:
+            length = max(needed, 2 * length)
+            if self._capacity is not None:
+                length = min(length, self._capacity)
+            self._resize(length)
+        for item in items[: length - self._size]:
+            rear: int = self._head + self._size
+            if rear >= length:
+                rear -= length
+            self._items[rear] = item
+            self._size += 1
+        if needed > length:
+            raise OverflowError("add to full queue")
+
+    def drain(self, count: Optional[int] = None) -> List[T]:
+        """
+        Removes several items from the top of the queue.
+        :param count: maximum number of items to remove, or None for all
+        :return: the items removed, from the top to the rear
+        """
+        if count is None or count >= self._size:
+            items: List[T] = list(self)
+            self.clear()
+            return items
+        items = []
+        for _ in range(max(count, 0)):
+            items.append(self.pop())
+        return items
@@ -7,6 +7,8 @@ T = TypeVar("T")
 class StackListBased(Generic[T]):
     """Implementation of ADT Stack based on Python type list."""
 
+    __slots__ = ("_items",)
+
     def __init__(self):
         """
         Sets the initial state of self.
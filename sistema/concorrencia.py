@@ -0,0 +1,231 @@
+import inspect
+from contextlib import contextmanager
+from functools import wraps
+from threading import Condition, get_ident
+from typing import Callable, ContextManager, Iterator, Optional
+from sistema.sistema_turistico import SistemaTuristico
+
+ESCRITAS: frozenset = frozenset(
+    (
+        "adicionar_ponto",
+        "carregar_pontos",
+        "remover_ponto",
+        "alterar_ponto",
+        "avaliar_ponto",
+        "avaliar_pontos",
+        "acrescentar_vertice",
+        "remover_vertice",
+        "acrescentar_aresta",
+        "carregar_vias",
+        "remover_aresta",
+    )
+)
+"""métodos de SistemaTuristico que alteram o sistema"""
+
+
+class TrancaLeituraEscrita:
+    """
+    Tranca que permite vários leitores em simultâneo ou um único escritor.
+    Os escritores têm prioridade: enquanto um escritor espera, não entram
+    novos leitores, mas um leitor que já tem a tranca pode voltar a
+    adquiri-la para leitura. O escritor pode voltar a adquirir a tranca,
+    para leitura ou escrita, sem bloquear. Um leitor não pode adquirir a
+    tranca para escrita sem antes a libertar
+    """
+
+    __slots__ = ("_condicao", "_leitores", "_escritor", "_profundidade", "_espera")
+
+    def __init__(self):
+        """Define o estado inicial de self"""
+        self._condicao: Condition = Condition()
+        self._leitores: dict[int, int] = {}
+        """profundidade de leitura de cada thread leitora"""
+        self._escritor: Optional[int] = None
+        self._profundidade: int = 0
+        self._espera: int = 0
+
+    def adquirir_leitura(self) -> None:
+        """
+        Espera até não haver escritores ativos nem à espera, exceto se a
+        thread já tiver a tranca
+        """
+        with self._condicao:
+            thread: int = get_ident()
+            if self._escritor == thread:
+                self._profundidade += 1
+                return
+            profundidade: int = self._leitores.get(thread, 0)
+            if not profundidade:
+                while self._escritor is not None or self._espera:
+                    self._condicao.wait()
+            self._leitores[thread] = profundidade + 1
+
+    def libertar_leitura(self) -> None:
+        """Liberta a tranca adquirida para leitura"""
+        with self._condicao:
+            thread: int = get_ident()
+            if self._escritor == thread:
+                self._profundidade -= 1
+                return
+            if self._leitores[thread] > 1:
+                self._leitores[thread] -= 1
+                return
+            del self._leitores[thread]
+            if not self._leitores:
+                self._condicao.notify_all()
+
+    def adquirir_escrita(self) -> None:
+        """
+        Espera até não haver leitores nem outro escritor
+
+        :raises RuntimeError: se a thread tiver a tranca para leitura
+        """
+        with self._condicao:
+            if self._escritor == get_ident():
+                self._profundidade += 1
+                return
+            if get_ident() in self._leitores:
+                raise RuntimeError(
+                    "A tranca de leitura tem de ser libertada antes de adquirir "
+                    "a de escrita"
+                )
+            self._espera += 1
+            while self._escritor is not None or self._leitores:
+                self._condicao.wait()
+            self._espera -= 1
+            self._escritor = get_ident()
+            self._profundidade = 1
+
+    def libertar_escrita(self) -> None:
+        """Liberta a tranca adquirida para escrita"""
+        with self._condicao:
+            self._profundidade -= 1
+            if self._profundidade == 0:
+                self._escritor = None
+                self._condicao.notify_all()
+
+    @contextmanager
+    def leitura(self) -> Iterator[None]:
+        """
+        Mantém a tranca adquirida para leitura durante um bloco with
+
+        :yield: None
+        :rtype: Iterator[None]
+        """
+        self.adquirir_leitura()
+        try:
+            yield
+        finally:
+            self.libertar_leitura()
+
+    @contextmanager
+    def escrita(self) -> Iterator[None]:
+        """
+        Mantém a tranca adquirida para escrita durante um bloco with
+
+        :yield: None
+        :rtype: Iterator[None]
+        """
+        self.adquirir_escrita()
+        try:
+            yield
+        finally:
+            self.libertar_escrita()
+
+
+class SistemaConcorrente:
+    """
+    Acesso a um SistemaTuristico partilhado por várias threads. Os métodos
+    em ESCRITAS são executados com a tranca exclusiva e os restantes
+    métodos públicos com a tranca partilhada, pelo que as consultas podem
+    decorrer em simultâneo. Os geradores são esgotados dentro da tranca.
+    Para agrupar várias operações, por exemplo uma alteração e o seu
+    registo no diário, usam-se os blocos with leitura() e escrita()
+    """
+
+    __slots__ = ("_sistema", "_tranca", "_metodos")
+
+    def __init__(self, sistema: SistemaTuristico):
+        """
+        Define o estado inicial de self
+
+        :param sistema: sistema a partilhar
+        :type sistema: SistemaTuristico
+        """
+        self._sistema: SistemaTuristico = sistema
+        self._tranca: TrancaLeituraEscrita = TrancaLeituraEscrita()
+        self._metodos: dict[str, Callable] = {}
+
+    @property
+    def sistema(self) -> SistemaTuristico:
+        """
+        Obtém o sistema partilhado, para ser usado dentro de um bloco
+        with leitura() ou escrita()
+
+        :return: sistema partilhado
+        :rtype: SistemaTuristico
+        """
+        return self._sistema
+
+    def leitura(self) -> ContextManager[None]:
+        """
+        Bloco with em que o sistema pode ser consultado
+
+        :return: gestor de contexto da tranca partilhada
+        :rtype: ContextManager[None]
+        """
+        return self._tranca.leitura()
+
+    def escrita(self) -> ContextManager[None]:
+        """
+        Bloco with em que o sistema pode ser alterado
+
+        :return: gestor de contexto da tranca exclusiva
+        :rtype: ContextManager[None]
+        """
+        return self._tranca.escrita()
+
+    def _trancar(self, nome: str) -> Callable:
+        """
+        Cria a versão com tranca de um método do sistema
+
+        :param nome: nome do método
+        :type nome: str
+        :return: método que adquire e liberta a tranca adequada
+        :rtype: Callable
+        """
+        metodo: Callable = getattr(self._sistema, nome)
+        tranca: TrancaLeituraEscrita = self._tranca
+        if nome in ESCRITAS:
+            adquirir, libertar = tranca.adquirir_escrita, tranca.libertar_escrita
+        else:
+            adquirir, libertar = tranca.adquirir_leitura, tranca.libertar_leitura
+        gerador: bool = inspect.isgeneratorfunction(metodo)
+
+        @wraps(metodo)
+        def trancado(*args, **kwargs):
+            adquirir()
+            try:
+                if gerador:
+                    return iter(list(metodo(*args, **kwargs)))
+                return metodo(*args, **kwargs)
+            finally:
+                libertar()
+
+        return trancado
+
+    def __getattr__(self, nome: str) -> Callable:
+        """
+        Obtém a versão com tranca de um método público do sistema
+
+        :param nome: nome do método
+        :type nome: str
+        :return: método que adquire e liberta a tranca adequada
+        :rtype: Callable
+        """
+        if nome.startswith("_") or not callable(getattr(SistemaTuristico, nome, None)):
+            raise AttributeError(nome)
+        metodo: Optional[Callable] = self._metodos.get(nome)
+        if metodo is None:
+            metodo = self._metodos[nome] = self._trancar(nome)
+        return metodo
@@ -0,0 +1,176 @@
+import math
+from types import ModuleType
+from typing import List, Optional, Sequence
+
+RAIO_TERRA: int = 6371000
+
+_numpy: Optional[ModuleType] = None
+_numpy_procurado: bool = False
+
+
+def obter_numpy() -> Optional[ModuleType]:
+    """
+    Importa o NumPy na primeira utilização, para não atrasar o arranque
+    do programa
+
+    :return: módulo numpy, ou None se não estiver instalado
+    :rtype: Optional[ModuleType]
+    """
+    global _numpy, _numpy_procurado
+    if not _numpy_procurado:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+        _numpy_procurado = True
+    return _numpy
+
+
+def distancia_terra(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Calcula a distância entre dois pontos no planeta Terra
+
+    :param lat1: latitude do ponto 1
+    :type lat1: float
+    :param lon1: longitude do ponto 1
+    :type lon1: float
+    :param lat2: latitude do ponto 2
+    :type lat2: float
+    :param lon2: longitude do ponto 2
+    :type lon2: float
+    :return: distância (m) entre os dois pontos
+    :rtype: float
+    """
+    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+    dlat: float = lat2 - lat1
+    dlon: float = lon2 - lon1
+    a: float = (
+        math.sin(dlat / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+    )
+    c: float = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    return RAIO_TERRA * c
+
+
+def distancias_terra(
+    lat: float, lon: float, lats: Sequence[float], lons: Sequence[float]
+) -> Sequence[float]:
+    """
+    Calcula de uma só vez a distância de um ponto de origem a N pontos.
+    Usa operações vetoriais do NumPy se estiver instalado
+
+    :param lat: latitude da origem
+    :type lat: float
+    :param lon: longitude da origem
+    :type lon: float
+    :param lats: latitudes dos N pontos
+    :type lats: Sequence[float]
+    :param lons: longitudes dos N pontos
+    :type lons: Sequence[float]
+    :return: N distâncias (m), pela ordem dos pontos
+    :rtype: Sequence[float]
+    """
+    np: Optional[ModuleType] = obter_numpy()
+    if np is None:
+        return [distancia_terra(lat, lon, la, lo) for la, lo in zip(lats, lons)]
+    phi1: float = math.radians(lat)
+    lambda1: float = math.radians(lon)
+    phi2 = np.radians(np.asarray(lats, dtype=np.float64))
+    lambda2 = np.radians(np.asarray(lons, dtype=np.float64))
+    a = np.sin((phi2 - phi1) * 0.5)
+    a *= a
+    b = np.sin((lambda2 - lambda1) * 0.5)
+    b *= b
+    b *= np.cos(phi2)
+    b *= math.cos(phi1)
+    a += b
+    return _angulo_central(a)
+
+
+def indices_no_raio(
+    lat: float,
+    lon: float,
+    lats: Sequence[float],
+    lons: Sequence[float],
+    raio: float,
+) -> List[int]:
+    """
+    Obtém as posições dos pontos a uma distância de uma origem não
+    superior ao raio. Com NumPy, a comparação também é vetorial
+
+    :param lat: latitude da origem
+    :type lat: float
+    :param lon: longitude da origem
+    :type lon: float
+    :param lats: latitudes dos N pontos
+    :type lats: Sequence[float]
+    :param lons: longitudes dos N pontos
+    :type lons: Sequence[float]
+    :param raio: distância máxima (m)
+    :type raio: float
+    :return: posições dos pontos dentro do raio, por ordem crescente
+    :rtype: List[int]
+    """
+    distancias: Sequence[float] = distancias_terra(lat, lon, lats, lons)
+    np: Optional[ModuleType] = obter_numpy()
+    if np is None:
+        return [i for i, d in enumerate(distancias) if d <= raio]
+    return np.flatnonzero(distancias <= raio).tolist()
+
+
+def _angulo_central(a):
+    """
+    Converte, sem cópias intermédias, o termo do haversine de cada
+    par de pontos na distância (m) sobre a superfície da Terra
+
+    :param a: termos do haversine (são reutilizados para o resultado)
+    :type a: numpy.ndarray
+    :return: distâncias (m)
+    :rtype: numpy.ndarray
+    """
+    np: ModuleType = obter_numpy()
+    np.clip(a, 0.0, 1.0, out=a)
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= 2 * RAIO_TERRA
+    return a
+
+
+def matriz_distancias_terra(
+    lats1: Sequence[float],
+    lons1: Sequence[float],
+    lats2: Sequence[float],
+    lons2: Sequence[float],
+) -> Sequence[Sequence[float]]:
+    """
+    Calcula a matriz N×M das distâncias entre N pontos e M pontos.
+    Usa operações vetoriais do NumPy se estiver instalado
+
+    :param lats1: latitudes dos N pontos
+    :type lats1: Sequence[float]
+    :param lons1: longitudes dos N pontos
+    :type lons1: Sequence[float]
+    :param lats2: latitudes dos M pontos
+    :type lats2: Sequence[float]
+    :param lons2: longitudes dos M pontos
+    :type lons2: Sequence[float]
+    :return: matriz em que a linha i e coluna j é a distância (m)
+    entre o ponto i dos N pontos e o ponto j dos M pontos
+    :rtype: Sequence[Sequence[float]]
+    """
+    np: Optional[ModuleType] = obter_numpy()
+    if np is None:
+        return [
+            [distancia_terra(la1, lo1, la2, lo2) for la2, lo2 in zip(lats2, lons2)]
+            for la1, lo1 in zip(lats1, lons1)
+        ]
+    phi1 = np.radians(np.asarray(lats1, dtype=np.float64))[:, np.newaxis]
+    lambda1 = np.radians(np.asarray(lons1, dtype=np.float64))[:, np.newaxis]
+    phi2 = np.radians(np.asarray(lats2, dtype=np.float64))[np.newaxis, :]
+    lambda2 = np.radians(np.asarray(lons2, dtype=np.float64))[np.newaxis, :]
+    a = (
+        np.sin((phi2 - phi1) / 2) ** 2
+        + np.cos(phi1) * np.cos(phi2) * np.sin((lambda2 - lambda1) / 2) ** 2
+    )
+    return _angulo_central(a)
@@ -1,8 +1,196 @@
-import networkx as nx
-from typing import List, Tuple
-from matplotlib.pyplot import show, figure
+import heapq
+import math
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 from sistema.QueueBasedList import QueueBasedList
-from sistema.StackBasedList import StackListBased
+from sistema.grafo_csr import GrafoCSR
+from sistema.instrumentacao import contar
+
+LIMIAR_PARALELO: int = 1000
+"""número de vértices a partir do qual as centralidades usam vários processos"""
+
+_grafo_processo: Optional[GrafoCSR] = None
+
+
+def _proximidade(grafo: GrafoCSR, fontes: List[int]) -> List[Tuple[int, float]]:
+    """
+    Calcula a centralidade de proximidade de alguns vértices do grafo,
+    normalizada pela fração de vértices que cada um alcança
+
+    :param grafo: vista CSR do grafo
+    :type grafo: GrafoCSR
+    :param fontes: identificadores dos vértices a calcular
+    :type fontes: List[int]
+    :return: identificadores dos vértices e respetiva proximidade
+    :rtype: List[Tuple[int, float]]
+    """
+    resultado: List[Tuple[int, float]] = []
+    for fonte in fontes:
+        alcancaveis: List[float] = [
+            d for d in grafo.dijkstra(fonte)[0] if d != math.inf
+        ]
+        alcancados: int = len(alcancaveis) - 1
+        total: float = sum(alcancaveis)
+        if alcancados > 0 and total > 0:
+            resultado.append(
+                (fonte, (alcancados / total) * (alcancados / (len(grafo) - 1)))
+            )
+        else:
+            resultado.append((fonte, 0.0))
+    return resultado
+
+
+def _distancias_pivos(
+    grafo_inverso: GrafoCSR, pivos: List[int]
+) -> Tuple[List[int], List[float]]:
+    """
+    Conta, para cada vértice, os pivôs que alcança e soma as distâncias
+    até eles, com um cálculo de distâncias mais curtas a partir de cada
+    pivô no grafo com as arestas invertidas
+
+    :param grafo_inverso: vista CSR do grafo com as arestas invertidas
+    :type grafo_inverso: GrafoCSR
+    :param pivos: identificadores dos pivôs
+    :type pivos: List[int]
+    :return: número de pivôs alcançados e soma das distâncias até eles,
+    por identificador
+    :rtype: Tuple[List[int], List[float]]
+    """
+    n: int = len(grafo_inverso)
+    contagens: List[int] = [0] * n
+    somas: List[float] = [0.0] * n
+    for pivo in pivos:
+        for v, d in enumerate(grafo_inverso.dijkstra(pivo)[0]):
+            if d != math.inf and v != pivo:
+                contagens[v] += 1
+                somas[v] += d
+    return contagens, somas
+
+
+def _intermediacao(grafo: GrafoCSR, fontes: List[int]) -> List[float]:
+    """
+    Acumula a centralidade de intermediação dos caminhos mais curtos
+    que partem de alguns vértices do grafo (algoritmo de Brandes)
+
+    :param grafo: vista CSR do grafo
+    :type grafo: GrafoCSR
+    :param fontes: identificadores dos vértices de partida
+    :type fontes: List[int]
+    :return: intermediação parcial de cada vértice, por identificador
+    :rtype: List[float]
+    """
+    inicios: array = grafo._inicios
+    destinos: array = grafo._destinos
+    pesos: array = grafo._pesos
+    n: int = len(grafo)
+    intermediacao: List[float] = [0.0] * n
+    for fonte in fontes:
+        ordem: List[int] = []
+        anteriores: dict[int, List[int]] = {fonte: []}
+        caminhos: List[int] = [0] * n
+        caminhos[fonte] = 1
+        fechados: bytearray = bytearray(n)
+        vistos: List[float] = [math.inf] * n
+        vistos[fonte] = 0.0
+        fila: List[Tuple[float, int, int, int]] = [(0.0, 0, fonte, fonte)]
+        contador: int = 1
+        while fila:
+            distancia, _, anterior, vertice = heapq.heappop(fila)
+            if fechados[vertice]:
+                continue
+            fechados[vertice] = 1
+            caminhos[vertice] += caminhos[anterior] if anterior != vertice else 0
+            ordem.append(vertice)
+            for k in range(inicios[vertice], inicios[vertice + 1]):
+                adjacente: int = destinos[k]
+                if fechados[adjacente]:
+                    continue
+                nova_distancia: float = distancia + pesos[k]
+                if nova_distancia < vistos[adjacente]:
+                    vistos[adjacente] = nova_distancia
+                    heapq.heappush(fila, (nova_distancia, contador, vertice, adjacente))
+                    contador += 1
+                    caminhos[adjacente] = 0
+                    anteriores[adjacente] = [vertice]
+                elif nova_distancia == vistos[adjacente]:
+                    caminhos[adjacente] += caminhos[vertice]
+                    anteriores[adjacente].append(vertice)
+        contar("vertices_visitados", len(ordem))
+        dependencia: dict[int, float] = dict.fromkeys(ordem, 0.0)
+        while ordem:
+            w: int = ordem.pop()
+            coeficiente: float = (1 + dependencia[w]) / caminhos[w]
+            for v in anteriores[w]:
+                dependencia[v] += caminhos[v] * coeficiente
+            if w != fonte:
+                intermediacao[w] += dependencia[w]
+    return intermediacao
+
+
+def _repartir(
+    grafo: GrafoCSR,
+    funcao: Callable,
+    fontes: List[int],
+    processos: Optional[int],
+) -> list:
+    """
+    Aplica uma função de centralidade a blocos de vértices de partida,
+    em vários processos se o grafo tiver pelo menos LIMIAR_PARALELO vértices
+
+    :param grafo: vista CSR do grafo
+    :type grafo: GrafoCSR
+    :param funcao: função que recebe o grafo e uma lista de vértices
+    :type funcao: Callable
+    :param fontes: identificadores dos vértices de partida
+    :type fontes: List[int]
+    :param processos: número de processos, ou None para escolher
+    automaticamente
+    :type processos: Optional[int]
+    :return: resultado parcial de cada bloco
+    :rtype: list
+    """
+    if processos is None:
+        processos = os.cpu_count() if len(grafo) >= LIMIAR_PARALELO else 1
+    if processos is None or processos <= 1 or len(fontes) < 2:
+        return [funcao(grafo, fontes)]
+    tamanho: int = -(-len(fontes) // (processos * 4))
+    tarefas: List[Tuple[Callable, List[int]]] = [
+        (funcao, fontes[i : i + tamanho]) for i in range(0, len(fontes), tamanho)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=processos,
+        initializer=_iniciar_processo,
+        initargs=(grafo,),
+    ) as executor:
+        return list(executor.map(_calcular_em_processo, tarefas))
+
+
+def _iniciar_processo(grafo: GrafoCSR) -> None:
+    """
+    Guarda no processo de trabalho a vista CSR do grafo,
+    para não a enviar com cada tarefa
+
+    :param grafo: vista CSR do grafo
+    :type grafo: GrafoCSR
+    """
+    global _grafo_processo
+    _grafo_processo = grafo
+
+
+def _calcular_em_processo(tarefa: Tuple[Callable, List[int]]):
+    """
+    Aplica uma função de centralidade num processo de trabalho
+
+    :param tarefa: função e vértices de partida
+    :type tarefa: Tuple[Callable, List[int]]
+    :return: resultado parcial da função
+    """
+    funcao, fontes = tarefa
+    return funcao(_grafo_processo, fontes)
 
 
 class Graph:
@@ -11,6 +199,21 @@ class Graph:
     def __init__(self):
         """Define o estado inicial de self"""
         self._vertices: dict[str, dict[str, float]] = {}
+        self._predecessores: dict[str, dict[str, float]] = {}
+        self._versao: int = 0
+        self._cache_proximidade: Optional[Tuple[int, dict[str, float]]] = None
+        self._cache_intermediacao: Optional[Tuple[int, dict[str, float]]] = None
+        self._arvores: dict[int, Tuple[List[float], List[int]]] = {}
+        self._versao_arvores: int = 0
+        self._cache_csr: Optional[Tuple[int, GrafoCSR]] = None
+        self._tranca_caches: Lock = Lock()
+        """
+        protege o preenchimento da vista CSR e das árvores guardadas por
+        consultas em simultâneo. A proximidade e a intermediação não
+        precisam dela: são guardadas numa única atribuição, lida também
+        de uma só vez, pelo que duas consultas iguais apenas repetem o
+        cálculo
+        """
 
     def is_empty(self) -> bool:
         """
@@ -49,6 +252,46 @@ class Graph:
     def clear(self) -> None:
         """Elimina todos os dados do grafo"""
         self._vertices: dict[str, dict[str, float]] = {}
+        self._predecessores: dict[str, dict[str, float]] = {}
+        self._versao += 1
+
+    def carregar_vertices(self, vertices: dict[str, dict[str, float]]) -> None:
+        """
+        Substitui os dados do grafo pelas listas de adjacência recebidas
+        e reconstrói o índice de predecessores
+
+        :param vertices: arestas de saída de cada vértice e os seus pesos
+        :type vertices: dict[str, dict[str, float]]
+        """
+        self.clear()
+        for v in vertices:
+            self._vertices[v] = {}
+            self._predecessores[v] = {}
+        for v, adjacentes in vertices.items():
+            for adj, peso in adjacentes.items():
+                self._vertices[v][adj] = peso
+                self._predecessores.setdefault(adj, {})[v] = peso
+                self._vertices.setdefault(adj, {})
+
+    def carregar_arestas(
+        self, vertices: Iterable[str], arestas: Iterable[Tuple[str, str, float]]
+    ) -> None:
+        """
+        Substitui os dados do grafo pelos vértices e arestas recebidos
+        de uma só vez, sem as verificações de add_edges
+
+        :param vertices: vértices do grafo
+        :type vertices: Iterable[str]
+        :param arestas: vértice de início, vértice de fim e peso de cada aresta
+        :type arestas: Iterable[Tuple[str, str, float]]
+        """
+        self.clear()
+        for v in vertices:
+            self._vertices[v] = {}
+            self._predecessores[v] = {}
+        for inicio, fim, peso in arestas:
+            self._vertices[inicio][fim] = peso
+            self._predecessores[fim][inicio] = peso
 
     def adjacentes_externo(self, label: str) -> set[str]:
         """
@@ -74,12 +317,9 @@ class Graph:
         :return: conjunto de vértices adjacentes internamente
         :rtype: set[str]
         """
-        adjacentes: set[str] = set()
-        if label in self._vertices:
-            for v, i in self._vertices.items():
-                if label in i:
-                    adjacentes.add(v)
-        return adjacentes
+        if label in self._predecessores:
+            return set(self._predecessores[label])
+        return set()
 
     def add_vertex(self, label: str) -> None:
         """
@@ -90,10 +330,13 @@ class Graph:
         """
         if label not in self._vertices:
             self._vertices[label] = {}
+            self._predecessores[label] = {}
+            self._versao += 1
 
-    def add_edges(self, from_label: str, to_label: str, weight: float) -> None:
+    def add_edges(self, from_label: str, to_label: str, weight: float) -> bool:
         """
-        Adiciona uma aresta ao grafo
+        Adiciona uma aresta ao grafo, se os dois vértices existirem e
+        ainda não estiverem ligados em nenhum dos sentidos
 
         :param from_label: vertice do inicio da aresta
         :type from_label: str
@@ -101,6 +344,8 @@ class Graph:
         :type to_label: str
         :param weight: peso da aresta
         :type weight: float
+        :return: True se a aresta foi adicionada e False se não foi
+        :rtype: bool
         """
         if (
             to_label in self._vertices
@@ -109,6 +354,10 @@ class Graph:
             and from_label not in self._vertices[to_label]
         ):
             self._vertices[from_label][to_label] = weight
+            self._predecessores[to_label][from_label] = weight
+            self._versao += 1
+            return True
+        return False
 
     def remove_vertex(self, vertex: str) -> None:
         """
@@ -118,10 +367,11 @@ class Graph:
         :type vertex: str
         """
         if vertex in self._vertices:
-            self._vertices.pop(vertex)
-            for v in self._vertices.values():
-                if vertex in v:
-                    v.pop(vertex)
+            for adj in self._vertices.pop(vertex):
+                self._predecessores[adj].pop(vertex)
+            for anterior in self._predecessores.pop(vertex):
+                self._vertices[anterior].pop(vertex)
+            self._versao += 1
 
     def remove_edge(self, from_label: str, to_label: str) -> None:
         """
@@ -135,6 +385,8 @@ class Graph:
         if from_label in self._vertices and to_label in self._vertices:
             if to_label in self._vertices[from_label]:
                 self._vertices[from_label].pop(to_label)
+                self._predecessores[to_label].pop(from_label)
+                self._versao += 1
 
     def size_edges(self) -> int:
         """
@@ -188,21 +440,12 @@ class Graph:
 
     def draw_graph(self) -> None:
         """Visualiza o grafo em modo gráfico"""
-        figure(figsize=(8, 6))
-        g: nx.DiGraph = nx.DiGraph()
-        nodes: set[str] = self.get_vertices()
-        g.add_nodes_from(nodes)
-        edges: set[tuple[str, str]] = self.get_edges()
-        g.add_edges_from(edges)
-        pos = nx.shell_layout(g)
-        weights: dict[tuple[str, str], float] = {}
-        for from_label, to_label in edges:
-            weights[(from_label, to_label)] = self.get_weight(from_label, to_label)
-        nx.draw_networkx_nodes(g, pos)
-        nx.draw_networkx_edges(g, pos, arrows=True)
-        nx.draw_networkx_labels(g, pos)
-        nx.draw_networkx_edge_labels(g, pos, edge_labels=weights, label_pos=0.7)
-        show()
+        from sistema.visualizacao import desenhar_grafo
+
+        arestas: dict[tuple[str, str], float] = {}
+        for from_label, to_label in self.get_edges():
+            arestas[(from_label, to_label)] = self.get_weight(from_label, to_label)
+        desenhar_grafo(self.get_vertices(), arestas, "shell")
 
     def total_caminhos(self, inicio: str, fim: str) -> List[List[str]]:
         """
@@ -218,17 +461,20 @@ class Graph:
         """
         if inicio == fim:
             return [[inicio]]
+        grafo: GrafoCSR = self.csr()
+        origem: int = grafo.id(inicio)
+        destino: int = grafo.id(fim)
         total: List[List[str]] = []
         por_visitar: QueueBasedList = QueueBasedList()
-        por_visitar.add([inicio])
+        por_visitar.add([origem])
         while not por_visitar.is_empty():
-            caminho: List[str] = por_visitar.pop()
-            ponto_fim: str = caminho[-1]
-            if ponto_fim == fim:
-                total.append(caminho)
-            for adjacente in self._vertices[ponto_fim]:
+            caminho: List[int] = por_visitar.pop()
+            ponto_fim: int = caminho[-1]
+            if ponto_fim == destino:
+                total.append([grafo.nome(v) for v in caminho])
+            for adjacente, _ in grafo.adjacentes(ponto_fim):
                 if adjacente not in caminho:
-                    novo_caminho: List[str] = list(caminho)
+                    novo_caminho: List[int] = list(caminho)
                     novo_caminho.append(adjacente)
                     por_visitar.add(novo_caminho)
         return total
@@ -252,23 +498,403 @@ class Graph:
             distancia_dos_caminhos.append((distancia_total, caminho))
         return distancia_dos_caminhos
 
+    @staticmethod
+    def _heuristica_nula(vertice: str) -> float:
+        """
+        Heurística que reduz o algoritmo A* ao algoritmo de Dijkstra
+
+        :param vertice: vértice do grafo
+        :type vertice: str
+        :return: estimativa nula da distância
+        :rtype: float
+        """
+        return 0.0
+
+    def caminho_mais_curto(
+        self,
+        inicio: str,
+        fim: str,
+        heuristica: Optional[Callable[[str], float]] = None,
+    ) -> Tuple[float, List[str]]:
+        """
+        Calcula o caminho mais curto entre dois vértices com o algoritmo
+        de Dijkstra ou, se for indicada uma heurística, com o algoritmo A*
+
+        :param inicio: vértice inicial
+        :type inicio: str
+        :param fim: vértice final
+        :type fim: str
+        :param heuristica: estimativa da distância de um vértice até ao
+        vértice final, que nunca pode ser superior à distância real
+        :type heuristica: Optional[Callable[[str], float]]
+        :return: distância total e caminho, ou (inf, []) se não existir caminho
+        :rtype: Tuple[float, List[str]]
+        """
+        return self._pesquisa(inicio, fim, heuristica, set(), set())
+
+    def _pesquisa(
+        self,
+        inicio: str,
+        fim: str,
+        heuristica: Optional[Callable[[str], float]],
+        vertices_ignorados: set[str],
+        arestas_ignoradas: set[tuple[str, str]],
+    ) -> Tuple[float, List[str]]:
+        """
+        Pesquisa A* entre dois vértices que ignora alguns vértices e arestas
+
+        :param inicio: vértice inicial
+        :type inicio: str
+        :param fim: vértice final
+        :type fim: str
+        :param heuristica: estimativa da distância até ao vértice final
+        :type heuristica: Optional[Callable[[str], float]]
+        :param vertices_ignorados: vértices que não podem ser visitados
+        :type vertices_ignorados: set[str]
+        :param arestas_ignoradas: arestas que não podem ser percorridas
+        :type arestas_ignoradas: set[tuple[str, str]]
+        :return: distância total e caminho, ou (inf, []) se não existir caminho
+        :rtype: Tuple[float, List[str]]
+        """
+        if inicio not in self._vertices or fim not in self._vertices:
+            return math.inf, []
+        if heuristica is None:
+            heuristica = Graph._heuristica_nula
+        distancias: dict[str, float] = {inicio: 0.0}
+        anteriores: dict[str, str] = {}
+        fechados: set[str] = set()
+        fila: List[Tuple[float, float, str]] = [(heuristica(inicio), 0.0, inicio)]
+        while fila:
+            _, distancia, vertice = heapq.heappop(fila)
+            if vertice in fechados:
+                continue
+            if vertice == fim:
+                contar("vertices_visitados", len(fechados) + 1)
+                caminho: List[str] = [fim]
+                while caminho[-1] != inicio:
+                    caminho.append(anteriores[caminho[-1]])
+                caminho.reverse()
+                return distancia, caminho
+            fechados.add(vertice)
+            for adjacente, peso in self._vertices[vertice].items():
+                if (
+                    adjacente in vertices_ignorados
+                    or (vertice, adjacente) in arestas_ignoradas
+                ):
+                    continue
+                nova_distancia: float = distancia + peso
+                if adjacente not in fechados and nova_distancia < distancias.get(
+                    adjacente, math.inf
+                ):
+                    distancias[adjacente] = nova_distancia
+                    anteriores[adjacente] = vertice
+                    heapq.heappush(
+                        fila,
+                        (
+                            nova_distancia + heuristica(adjacente),
+                            nova_distancia,
+                            adjacente,
+                        ),
+                    )
+        contar("vertices_visitados", len(fechados))
+        return math.inf, []
+
+    def caminhos_mais_curtos(
+        self, inicio: str, fim: str, k: Optional[int] = None
+    ) -> Iterator[Tuple[float, List[str]]]:
+        """
+        Gera os k caminhos sem ciclos mais curtos entre dois vértices,
+        por ordem crescente da distância (algoritmo de Yen).
+        Cada caminho só é calculado quando é pedido
+
+        :param inicio: vértice inicial
+        :type inicio: str
+        :param fim: vértice final
+        :type fim: str
+        :param k: número máximo de caminhos, ou None para todos
+        :type k: Optional[int]
+        :yield: distância total e caminho
+        :rtype: Iterator[Tuple[float, List[str]]]
+        """
+        if k is not None and k <= 0:
+            return
+        distancia, caminho = self.caminho_mais_curto(inicio, fim)
+        if not caminho:
+            return
+        encontrados: List[List[str]] = [caminho]
+        candidatos: List[Tuple[float, List[str]]] = []
+        vistos: set[tuple[str, ...]] = {tuple(caminho)}
+        yield distancia, caminho
+        while k is None or len(encontrados) < k:
+            anterior: List[str] = encontrados[-1]
+            distancia_raiz: float = 0.0
+            for i in range(len(anterior) - 1):
+                raiz: List[str] = anterior[: i + 1]
+                arestas_ignoradas: set[tuple[str, str]] = {
+                    (c[i], c[i + 1])
+                    for c in encontrados
+                    if len(c) > i + 1 and c[: i + 1] == raiz
+                }
+                distancia_desvio, desvio = self._pesquisa(
+                    anterior[i], fim, None, set(raiz[:-1]), arestas_ignoradas
+                )
+                if desvio:
+                    novo_caminho: List[str] = raiz[:-1] + desvio
+                    if tuple(novo_caminho) not in vistos:
+                        vistos.add(tuple(novo_caminho))
+                        heapq.heappush(
+                            candidatos,
+                            (distancia_raiz + distancia_desvio, novo_caminho),
+                        )
+                distancia_raiz += self._vertices[anterior[i]][anterior[i + 1]]
+            if not candidatos:
+                return
+            distancia, caminho = heapq.heappop(candidatos)
+            encontrados.append(caminho)
+            yield distancia, caminho
+
+    def invalidar_caches(self) -> None:
+        """
+        Descarta a vista CSR, as árvores de caminhos mais curtos e as
+        centralidades guardadas, que voltam a ser calculadas quando forem
+        pedidas
+        """
+        self._versao += 1
+
+    def csr(self) -> GrafoCSR:
+        """
+        Obtém a vista CSR do grafo, com vértices identificados por inteiros,
+        construindo-a só se não estiver guardada para a versão atual do grafo
+
+        :return: vista CSR do grafo
+        :rtype: GrafoCSR
+        """
+        cache: Optional[Tuple[int, GrafoCSR]] = self._cache_csr
+        if cache is None or cache[0] != self._versao:
+            with self._tranca_caches:
+                cache = self._cache_csr
+                if cache is None or cache[0] != self._versao:
+                    cache = self._cache_csr = (self._versao, GrafoCSR(self._vertices))
+        return cache[1]
+
+    def distancias(self, inicio: str) -> dict[str, float]:
+        """
+        Calcula a distância mais curta de um vértice a todos os
+        vértices que este alcança (algoritmo de Dijkstra)
+
+        :param inicio: vértice inicial
+        :type inicio: str
+        :return: distância a cada vértice alcançável, incluindo o inicial
+        :rtype: dict[str, float]
+        """
+        if inicio not in self._vertices:
+            return {}
+        grafo: GrafoCSR = self.csr()
+        return {
+            grafo.nome(i): d
+            for i, d in enumerate(grafo.dijkstra(grafo.id(inicio))[0])
+            if d != math.inf
+        }
+
+    def _arvore(self, inicio: int) -> Tuple[List[float], List[int]]:
+        """
+        Obtém a árvore de caminhos mais curtos com raiz num vértice,
+        calculando-a só se não estiver guardada para a versão atual do grafo
+
+        :param inicio: identificador do vértice inicial na vista CSR
+        :type inicio: int
+        :return: distância a cada vértice e o vértice anterior a cada um
+        no caminho mais curto, por identificador
+        :rtype: Tuple[List[float], List[int]]
+        """
+        with self._tranca_caches:
+            if self._versao_arvores != self._versao:
+                self._arvores = {}
+                self._versao_arvores = self._versao
+            arvores: dict[int, Tuple[List[float], List[int]]] = self._arvores
+        arvore: Optional[Tuple[List[float], List[int]]] = arvores.get(inicio)
+        if arvore is None:
+            arvore = arvores.setdefault(inicio, self.csr().dijkstra(inicio))
+        return arvore
+
+    def caminho_tabelado(self, inicio: str, fim: str) -> Tuple[float, List[str]]:
+        """
+        Obtém o caminho mais curto entre dois vértices a partir da tabela
+        de caminhos mais curtos, que é preenchida à medida que é usada
+        e descartada quando o grafo é alterado. Depois da primeira
+        consulta a partir de um vértice, as seguintes custam
+        O(comprimento do caminho)
+
+        :param inicio: vértice inicial
+        :type inicio: str
+        :param fim: vértice final
+        :type fim: str
+        :return: distância total e caminho, ou (inf, []) se não existir caminho
+        :rtype: Tuple[float, List[str]]
+        """
+        if inicio not in self._vertices or fim not in self._vertices:
+            return math.inf, []
+        grafo: GrafoCSR = self.csr()
+        origem: int = grafo.id(inicio)
+        distancias, anteriores = self._arvore(origem)
+        destino: int = grafo.id(fim)
+        if distancias[destino] == math.inf:
+            return math.inf, []
+        caminho: List[int] = [destino]
+        while caminho[-1] != origem:
+            caminho.append(anteriores[caminho[-1]])
+        caminho.reverse()
+        return distancias[destino], [grafo.nome(v) for v in caminho]
+
+    def tabela_distancias(self) -> dict[str, dict[str, float]]:
+        """
+        Obtém as distâncias mais curtas entre todos os pares de vértices
+        ligados, completando a tabela de caminhos mais curtos
+
+        :return: distância de cada vértice a cada vértice que alcança
+        :rtype: dict[str, dict[str, float]]
+        """
+        grafo: GrafoCSR = self.csr()
+        return {
+            grafo.nome(v): {
+                grafo.nome(i): d
+                for i, d in enumerate(self._arvore(v)[0])
+                if d != math.inf
+            }
+            for v in range(len(grafo))
+        }
+
+    def proximidade(
+        self,
+        amostra: Optional[int] = None,
+        semente: Optional[int] = None,
+        processos: Optional[int] = None,
+    ) -> dict[str, float]:
+        """
+        Calcula a centralidade de proximidade de todos os vértices, com um
+        cálculo de distâncias mais curtas a partir de cada vértice, em tempo
+        O(V·E log V). Com uma amostra, as distâncias são calculadas só até
+        alguns vértices (pivôs) escolhidos ao acaso, no grafo com as arestas
+        invertidas, e o resultado é uma aproximação. Em grafos com pelo
+        menos LIMIAR_PARALELO vértices os cálculos são repartidos por vários
+        processos. O resultado exato fica guardado até o grafo ser alterado
+
+        :param amostra: número de pivôs, ou None para todos os vértices
+        :type amostra: Optional[int]
+        :param semente: semente da escolha aleatória da amostra
+        :type semente: Optional[int]
+        :param processos: número de processos, ou None para escolher
+        automaticamente
+        :type processos: Optional[int]
+        :return: proximidade de cada vértice
+        :rtype: dict[str, float]
+        :raises ValueError: se a amostra tiver menos de um vértice
+        """
+        if amostra is not None and amostra < 1:
+            raise ValueError(
+                f"A amostra tem de ter pelo menos um vértice (recebido {amostra})"
+            )
+        exato: bool = amostra is None or amostra >= len(self._vertices)
+        cache: Optional[Tuple[int, dict[str, float]]] = self._cache_proximidade
+        if exato and cache and cache[0] == self._versao:
+            return dict(cache[1])
+        grafo: GrafoCSR = self.csr()
+        resultado: dict[str, float] = {}
+        if exato:
+            for parcial in _repartir(
+                grafo, _proximidade, list(range(len(grafo))), processos
+            ):
+                for v, valor in parcial:
+                    resultado[grafo.nome(v)] = valor
+            self._cache_proximidade = (self._versao, resultado)
+            return dict(resultado)
+        n: int = len(grafo)
+        inverso: GrafoCSR = GrafoCSR(
+            {v: self._predecessores[v] for v in self._vertices}
+        )
+        pivos: List[int] = random.Random(semente).sample(range(n), amostra)
+        contagens: List[int] = [0] * n
+        somas: List[float] = [0.0] * n
+        for parcial_contagens, parcial_somas in _repartir(
+            inverso, _distancias_pivos, pivos, processos
+        ):
+            for v in range(n):
+                contagens[v] += parcial_contagens[v]
+                somas[v] += parcial_somas[v]
+        e_pivo: bytearray = bytearray(n)
+        for pivo in pivos:
+            e_pivo[pivo] = 1
+        for v in range(n):
+            alcancados: int = contagens[v]
+            if alcancados > 0 and somas[v] > 0:
+                resultado[grafo.nome(v)] = (alcancados / somas[v]) * (
+                    alcancados / (amostra - e_pivo[v])
+                )
+            else:
+                resultado[grafo.nome(v)] = 0.0
+        return resultado
+
+    def intermediacao(
+        self,
+        amostra: Optional[int] = None,
+        semente: Optional[int] = None,
+        processos: Optional[int] = None,
+    ) -> dict[str, float]:
+        """
+        Calcula a centralidade de intermediação normalizada de todos os
+        vértices (algoritmo de Brandes para grafos pesados), em tempo
+        O(V·E + V² log V). Com uma amostra, só são usados alguns vértices
+        de partida, escolhidos ao acaso, e o resultado é uma aproximação.
+        Em grafos com pelo menos LIMIAR_PARALELO vértices os cálculos são
+        repartidos por vários processos. O resultado exato fica guardado
+        até o grafo ser alterado
+
+        :param amostra: número de vértices de partida, ou None para todos
+        :type amostra: Optional[int]
+        :param semente: semente da escolha aleatória da amostra
+        :type semente: Optional[int]
+        :param processos: número de processos, ou None para escolher
+        automaticamente
+        :type processos: Optional[int]
+        :return: intermediação de cada vértice
+        :rtype: dict[str, float]
+        :raises ValueError: se a amostra tiver menos de um vértice
+        """
+        if amostra is not None and amostra < 1:
+            raise ValueError(
+                f"A amostra tem de ter pelo menos um vértice (recebido {amostra})"
+            )
+        exato: bool = amostra is None or amostra >= len(self._vertices)
+        cache: Optional[Tuple[int, dict[str, float]]] = self._cache_intermediacao
+        if exato and cache and cache[0] == self._versao:
+            return dict(cache[1])
+        grafo: GrafoCSR = self.csr()
+        n: int = len(grafo)
+        fontes: List[int] = list(range(n))
+        if not exato:
+            fontes = random.Random(semente).sample(fontes, amostra)
+        soma: List[float] = [0.0] * n
+        for parcial in _repartir(grafo, _intermediacao, fontes, processos):
+            for v, valor in enumerate(parcial):
+                soma[v] += valor
+        escala: float = 1.0
+        if n > 2:
+            escala = (n / len(fontes)) / ((n - 1) * (n - 2))
+        resultado: dict[str, float] = {
+            grafo.nome(v): valor * escala for v, valor in enumerate(soma)
+        }
+        if exato:
+            self._cache_intermediacao = (self._versao, resultado)
+        return dict(resultado)
+
     def draw_tree(self) -> None:
         """Visualiza a árvore em modo gráfico"""
-        figure(figsize=(8, 6))
-        g: nx.DiGraph = nx.DiGraph()
-        nodes: set[str] = self.get_vertices()
-        g.add_nodes_from(nodes)
-        edges: set[tuple[str, str]] = self.get_edges()
-        g.add_edges_from(edges)
-        pos = nx.spring_layout(g)
-        weights: dict[tuple[str, str], float] = {}
-        for from_label, to_label in edges:
-            weights[(from_label, to_label)] = self.get_weight(from_label, to_label)
-        nx.draw_networkx_nodes(g, pos)
-        nx.draw_networkx_edges(g, pos, arrows=True)
-        nx.draw_networkx_labels(g, pos)
-        nx.draw_networkx_edge_labels(g, pos, edge_labels=weights, label_pos=0.7)
-        show()
+        from sistema.visualizacao import desenhar_grafo
+
+        arestas: dict[tuple[str, str], float] = {}
+        for from_label, to_label in self.get_edges():
+            arestas[(from_label, to_label)] = self.get_weight(from_label, to_label)
+        desenhar_grafo(self.get_vertices(), arestas, "spring")
 
     def construir_arvore(self, inicio: str) -> None:
         """
@@ -279,20 +905,12 @@ class Graph:
         :type inicio: str
         :return: gráfico da árvore
         """
+        grafo: GrafoCSR = self.csr()
         arvore: Graph = Graph()
-        visitados: set[str] = set()
-        pilha: StackListBased = StackListBased()
-        pilha.push(inicio)
-        while pilha:
-            ponto: str = pilha.pop()
-            arvore.add_vertex(ponto)
-            visitados.add(ponto)
-            for adjacente in self._vertices[ponto]:
-                if adjacente not in visitados:
-                    pilha.push(adjacente)
-                    visitados.add(adjacente)
-                    arvore.add_vertex(adjacente)
-                    arvore.add_edges(
-                        ponto, adjacente, self.get_weight(ponto, adjacente)
-                    )
+        arvore.add_vertex(inicio)
+        for anterior, v in grafo.profundidade(grafo.id(inicio)):
+            ponto: str = grafo.nome(anterior)
+            adjacente: str = grafo.nome(v)
+            arvore.add_vertex(adjacente)
+            arvore.add_edges(ponto, adjacente, self.get_weight(ponto, adjacente))
         return arvore.draw_tree()
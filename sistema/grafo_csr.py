@@ -0,0 +1,159 @@
+import heapq
+import math
+from array import array
+from typing import Iterator, List, Tuple
+
+
+class GrafoCSR:
+    """
+    Vista imutável de um grafo orientado no formato CSR (compressed sparse
+    row): os vértices são identificados por inteiros e as arestas de saída
+    do vértice v ocupam as posições inicios[v] a inicios[v + 1] - 1 dos
+    arrays de destinos e de pesos
+    """
+
+    __slots__ = ("_nomes", "_ids", "_inicios", "_destinos", "_pesos")
+
+    def __init__(self, vertices: dict[str, dict[str, float]]):
+        """
+        Define o estado inicial de self a partir das listas de adjacência
+
+        :param vertices: arestas de saída de cada vértice e os seus pesos
+        :type vertices: dict[str, dict[str, float]]
+        """
+        self._nomes: List[str] = list(vertices)
+        self._ids: dict[str, int] = {v: i for i, v in enumerate(self._nomes)}
+        self._inicios: array = array("q", [0])
+        self._destinos: array = array("i")
+        self._pesos: array = array("d")
+        for v in self._nomes:
+            adjacentes: dict[str, float] = vertices[v]
+            self._destinos.extend(self._ids[adj] for adj in adjacentes)
+            self._pesos.extend(adjacentes.values())
+            self._inicios.append(len(self._destinos))
+
+    def __len__(self) -> int:
+        """
+        Verifica o número de vértices
+
+        :return: número de vértices
+        :rtype: int
+        """
+        return len(self._nomes)
+
+    def __getstate__(self) -> tuple:
+        """
+        Obtém o estado de self para ser enviado a outro processo
+
+        :return: nomes e arrays do grafo
+        :rtype: tuple
+        """
+        return self._nomes, self._inicios, self._destinos, self._pesos
+
+    def __setstate__(self, estado: tuple) -> None:
+        """
+        Repõe o estado de self recebido de outro processo
+
+        :param estado: nomes e arrays do grafo
+        :type estado: tuple
+        """
+        self._nomes, self._inicios, self._destinos, self._pesos = estado
+        self._ids = {v: i for i, v in enumerate(self._nomes)}
+
+    def id(self, nome: str) -> int:
+        """
+        Obtém o identificador inteiro de um vértice
+
+        :param nome: vértice
+        :type nome: str
+        :return: identificador do vértice
+        :rtype: int
+        """
+        return self._ids[nome]
+
+    def nome(self, i: int) -> str:
+        """
+        Obtém o vértice com um identificador inteiro
+
+        :param i: identificador do vértice
+        :type i: int
+        :return: vértice
+        :rtype: str
+        """
+        return self._nomes[i]
+
+    def adjacentes(self, v: int) -> Iterator[Tuple[int, float]]:
+        """
+        Gera as arestas de saída de um vértice
+
+        :param v: identificador do vértice
+        :type v: int
+        :yield: identificador do vértice de destino e peso de cada aresta
+        :rtype: Iterator[Tuple[int, float]]
+        """
+        a: int = self._inicios[v]
+        b: int = self._inicios[v + 1]
+        return zip(self._destinos[a:b], self._pesos[a:b])
+
+    def profundidade(self, inicio: int) -> List[Tuple[int, int]]:
+        """
+        Realiza uma travessia em profundidade. Cada vértice é marcado
+        quando é empilhado, pelo que a árvore obtida liga-o ao primeiro
+        vértice que o encontrou
+
+        :param inicio: identificador do vértice inicial
+        :type inicio: int
+        :return: arestas (anterior, vértice) da árvore da travessia,
+        pela ordem em que os vértices foram encontrados
+        :rtype: List[Tuple[int, int]]
+        """
+        inicios: array = self._inicios
+        destinos: array = self._destinos
+        visitados: bytearray = bytearray(len(self._nomes))
+        visitados[inicio] = 1
+        pilha: List[int] = [inicio]
+        arvore: List[Tuple[int, int]] = []
+        while pilha:
+            v: int = pilha.pop()
+            for k in range(inicios[v], inicios[v + 1]):
+                adj: int = destinos[k]
+                if not visitados[adj]:
+                    visitados[adj] = 1
+                    pilha.append(adj)
+                    arvore.append((v, adj))
+        return arvore
+
+    def dijkstra(self, inicio: int) -> Tuple[List[float], List[int]]:
+        """
+        Calcula a árvore de caminhos mais curtos com raiz num vértice
+        (algoritmo de Dijkstra)
+
+        :param inicio: identificador do vértice inicial
+        :type inicio: int
+        :return: distância a cada vértice (inf se não for alcançável) e o
+        vértice anterior a cada um no caminho mais curto (-1 se não houver)
+        :rtype: Tuple[List[float], List[int]]
+        """
+        inicios: array = self._inicios
+        destinos: array = self._destinos
+        pesos: array = self._pesos
+        n: int = len(self._nomes)
+        distancias: List[float] = [math.inf] * n
+        anteriores: List[int] = [-1] * n
+        fechados: bytearray = bytearray(n)
+        distancias[inicio] = 0.0
+        anteriores[inicio] = inicio
+        fila: List[Tuple[float, int]] = [(0.0, inicio)]
+        while fila:
+            distancia, v = heapq.heappop(fila)
+            if fechados[v]:
+                continue
+            fechados[v] = 1
+            for k in range(inicios[v], inicios[v + 1]):
+                adj: int = destinos[k]
+                nova_distancia: float = distancia + pesos[k]
+                if nova_distancia < distancias[adj]:
+                    distancias[adj] = nova_distancia
+                    anteriores[adj] = v
+                    heapq.heappush(fila, (nova_distancia, adj))
+        return distancias, anteriores
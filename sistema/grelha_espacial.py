@@ -0,0 +1,224 @@
+import math
+from types import ModuleType
+from typing import TypeVar, Generic, Iterator, List, Optional, Sequence, Tuple
+from sistema.distancias import obter_numpy
+
+
+T = TypeVar("T")
+
+
+class GrelhaEspacial(Generic[T]):
+    """
+    Índice espacial de grelha uniforme sobre coordenadas geográficas,
+    que agrupa os elementos por células de latitude e longitude. As
+    coordenadas de cada célula são guardadas também em vetores NumPy,
+    construídos na primeira consulta após uma alteração da célula
+    """
+
+    def __init__(self, tamanho_celula: float = 0.05):
+        """
+        Define o estado inicial de self
+
+        :param tamanho_celula: lado de cada célula em graus
+        :type tamanho_celula: float
+        """
+        self._tamanho_celula: float = tamanho_celula
+        self._celulas: dict[Tuple[int, int], List[T]] = {}
+        self._coordenadas: dict[Tuple[int, int], Tuple[List[float], List[float]]] = {}
+        self._vetores: dict[
+            Tuple[int, int], Tuple[Sequence[float], Sequence[float]]
+        ] = {}
+        self._tamanho: int = 0
+
+    def __len__(self) -> int:
+        """
+        Verifica o número de elementos no índice
+
+        :return: número de elementos
+        :rtype: int
+        """
+        return self._tamanho
+
+    def _celula(self, lat: float, lon: float) -> Tuple[int, int]:
+        """
+        Obtém a célula que contém uma coordenada
+
+        :param lat: latitude da coordenada
+        :type lat: float
+        :param lon: longitude da coordenada
+        :type lon: float
+        :return: índices da célula
+        :rtype: Tuple[int, int]
+        """
+        return (
+            math.floor(lat / self._tamanho_celula),
+            math.floor(lon / self._tamanho_celula),
+        )
+
+    def adicionar(self, lat: float, lon: float, elemento: T) -> None:
+        """
+        Adiciona um elemento ao índice
+
+        :param lat: latitude do elemento
+        :type lat: float
+        :param lon: longitude do elemento
+        :type lon: float
+        :param elemento: elemento a adicionar
+        :type elemento: T
+        """
+        celula: Tuple[int, int] = self._celula(lat, lon)
+        self._celulas.setdefault(celula, []).append(elemento)
+        lats, lons = self._coordenadas.setdefault(celula, ([], []))
+        lats.append(lat)
+        lons.append(lon)
+        self._vetores.pop(celula, None)
+        self._tamanho += 1
+
+    def remover(self, lat: float, lon: float, elemento: T) -> None:
+        """
+        Remove um elemento do índice
+
+        :param lat: latitude com que o elemento foi adicionado
+        :type lat: float
+        :param lon: longitude com que o elemento foi adicionado
+        :type lon: float
+        :param elemento: elemento a remover
+        :type elemento: T
+        """
+        celula: Tuple[int, int] = self._celula(lat, lon)
+        if celula in self._celulas and elemento in self._celulas[celula]:
+            i: int = self._celulas[celula].index(elemento)
+            self._celulas[celula].pop(i)
+            self._coordenadas[celula][0].pop(i)
+            self._coordenadas[celula][1].pop(i)
+            self._vetores.pop(celula, None)
+            if not self._celulas[celula]:
+                self._celulas.pop(celula)
+                self._coordenadas.pop(celula)
+            self._tamanho -= 1
+
+    def _celulas_candidatas(
+        self, lat: float, lon: float, raio: float
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Gera as células não vazias que intersetam o círculo com centro na
+        coordenada e o raio indicado
+
+        :param lat: latitude do centro
+        :type lat: float
+        :param lon: longitude do centro
+        :type lon: float
+        :param raio: raio em metros
+        :type raio: float
+        :yield: índices das células
+        :rtype: Iterator[Tuple[int, int]]
+        """
+        angulo: float = raio / 6371000
+        delta_lat: float = math.degrees(angulo)
+        lat_min: int = self._celula(lat - delta_lat, lon)[0]
+        lat_max: int = self._celula(lat + delta_lat, lon)[0]
+        if abs(lat) + delta_lat >= 90 or math.sin(angulo) >= math.cos(
+            math.radians(lat)
+        ):
+            delta_lon: float = 180.0
+        else:
+            delta_lon: float = math.degrees(
+                math.asin(math.sin(angulo) / math.cos(math.radians(lat)))
+            )
+        if delta_lon >= 180 or not -180 <= lon - delta_lon <= lon + delta_lon <= 180:
+            for celula in self._celulas:
+                if lat_min <= celula[0] <= lat_max:
+                    yield celula
+            return
+        lon_min: int = self._celula(lat, lon - delta_lon)[1]
+        lon_max: int = self._celula(lat, lon + delta_lon)[1]
+        if (lat_max - lat_min + 1) * (lon_max - lon_min + 1) > len(self._celulas):
+            for celula in self._celulas:
+                if lat_min <= celula[0] <= lat_max and lon_min <= celula[1] <= lon_max:
+                    yield celula
+            return
+        for i in range(lat_min, lat_max + 1):
+            for j in range(lon_min, lon_max + 1):
+                if (i, j) in self._celulas:
+                    yield (i, j)
+
+    def candidatos(self, lat: float, lon: float, raio: float) -> Iterator[T]:
+        """
+        Gera os elementos das células que intersetam o círculo com
+        centro na coordenada e o raio indicado. Podem ser gerados
+        elementos fora do círculo, mas nunca é omitido nenhum de dentro
+
+        :param lat: latitude do centro
+        :type lat: float
+        :param lon: longitude do centro
+        :type lon: float
+        :param raio: raio em metros
+        :type raio: float
+        :yield: elementos candidatos
+        :rtype: Iterator[T]
+        """
+        for celula in self._celulas_candidatas(lat, lon, raio):
+            yield from self._celulas[celula]
+
+    def _vetor(
+        self, celula: Tuple[int, int]
+    ) -> Tuple[Sequence[float], Sequence[float]]:
+        """
+        Obtém as coordenadas dos elementos de uma célula em vetores NumPy,
+        construindo-os só se a célula foi alterada desde a última consulta
+
+        :param celula: índices da célula
+        :type celula: Tuple[int, int]
+        :return: latitudes e longitudes dos elementos da célula
+        :rtype: Tuple[Sequence[float], Sequence[float]]
+        """
+        vetores: Optional[Tuple[Sequence[float], Sequence[float]]] = self._vetores.get(
+            celula
+        )
+        if vetores is None:
+            np: ModuleType = obter_numpy()
+            lats, lons = self._coordenadas[celula]
+            vetores = self._vetores[celula] = (
+                np.array(lats, dtype=np.float64),
+                np.array(lons, dtype=np.float64),
+            )
+        return vetores
+
+    def candidatos_coordenadas(
+        self, lat: float, lon: float, raio: float
+    ) -> Tuple[List[T], Sequence[float], Sequence[float]]:
+        """
+        Obtém os mesmos elementos que candidatos, juntamente com as suas
+        latitudes e longitudes, em vetores NumPy se estiver instalado
+
+        :param lat: latitude do centro
+        :type lat: float
+        :param lon: longitude do centro
+        :type lon: float
+        :param raio: raio em metros
+        :type raio: float
+        :return: elementos candidatos e as respetivas latitudes e longitudes
+        :rtype: Tuple[List[T], Sequence[float], Sequence[float]]
+        """
+        celulas: List[Tuple[int, int]] = list(self._celulas_candidatas(lat, lon, raio))
+        elementos: List[T] = []
+        for celula in celulas:
+            elementos.extend(self._celulas[celula])
+        np: Optional[ModuleType] = obter_numpy()
+        if np is None:
+            lats: List[float] = []
+            lons: List[float] = []
+            for celula in celulas:
+                lats.extend(self._coordenadas[celula][0])
+                lons.extend(self._coordenadas[celula][1])
+            return elementos, lats, lons
+        if not celulas:
+            return elementos, np.empty(0), np.empty(0)
+        vetores: List[Tuple[Sequence[float], Sequence[float]]] = [
+            self._vetor(celula) for celula in celulas
+        ]
+        return (
+            elementos,
+            np.concatenate([v[0] for v in vetores]),
+            np.concatenate([v[1] for v in vetores]),
+        )
@@ -0,0 +1,304 @@
+import atexit
+import inspect
+import json
+import math
+import random
+import sys
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Iterator, List, Optional, Tuple
+
+AMOSTRAS: int = 4096
+"""número máximo de durações guardadas por operação para os percentis"""
+
+PERCENTIS: Tuple[int, ...] = (50, 90, 99)
+
+_ativa: bool = False
+_estatisticas: dict[str, "Estatistica"] = {}
+_contadores: dict[str, int] = {}
+_originais: List[Tuple[type, str, object]] = []
+_destino: Optional[str] = None
+_tranca: Lock = Lock()
+"""protege os contadores e as durações registadas por várias threads"""
+
+
+class Estatistica:
+    """
+    Número de chamadas e durações de uma operação. As durações usadas nos
+    percentis são uma amostra uniforme de no máximo AMOSTRAS chamadas
+    """
+
+    __slots__ = ("_chamadas", "_total", "_maximo", "_amostra")
+
+    def __init__(self):
+        """Define o estado inicial de self"""
+        self._chamadas: int = 0
+        self._total: float = 0.0
+        self._maximo: float = 0.0
+        self._amostra: List[float] = []
+
+    def registar(self, duracao: float) -> None:
+        """
+        Regista a duração de uma chamada
+
+        :param duracao: duração da chamada (s)
+        :type duracao: float
+        """
+        with _tranca:
+            self._chamadas += 1
+            self._total += duracao
+            self._maximo = max(self._maximo, duracao)
+            if len(self._amostra) < AMOSTRAS:
+                self._amostra.append(duracao)
+            else:
+                i: int = random.randrange(self._chamadas)
+                if i < AMOSTRAS:
+                    self._amostra[i] = duracao
+
+    def resumo(self) -> dict:
+        """
+        Resume as durações das chamadas registadas. Deve ser chamado com
+        _tranca adquirida
+
+        :return: chamadas, tempo total, médio e máximo e percentis (s)
+        :rtype: dict
+        """
+        ordenada: List[float] = sorted(self._amostra)
+        resumo: dict = {
+            "chamadas": self._chamadas,
+            "total": self._total,
+            "media": self._total / self._chamadas if self._chamadas else 0.0,
+            "maximo": self._maximo,
+        }
+        for p in PERCENTIS:
+            resumo[f"p{p}"] = (
+                ordenada[max(math.ceil(p / 100 * len(ordenada)) - 1, 0)]
+                if ordenada
+                else 0.0
+            )
+        return resumo
+
+
+def ativa() -> bool:
+    """
+    Verifica se a instrumentação está ativa
+
+    :return: True se estiver ativa, False caso contrário
+    :rtype: bool
+    """
+    return _ativa
+
+
+def contar(contador: str, quantidade: int = 1) -> None:
+    """
+    Acrescenta uma quantidade a um contador de trabalho.
+    Não faz nada se a instrumentação não estiver ativa
+
+    :param contador: nome do contador
+    :type contador: str
+    :param quantidade: quantidade a acrescentar
+    :type quantidade: int
+    """
+    if _ativa:
+        with _tranca:
+            _contadores[contador] = _contadores.get(contador, 0) + quantidade
+
+
+def _medir(nome: str, funcao: Callable) -> Callable:
+    """
+    Envolve uma função de modo a registar a duração de cada chamada.
+    Nos geradores é medido o tempo até serem esgotados ou descartados
+
+    :param nome: nome da operação
+    :type nome: str
+    :param funcao: função a envolver
+    :type funcao: Callable
+    :return: função envolvida
+    :rtype: Callable
+    """
+    estatistica: Estatistica = _estatisticas.setdefault(nome, Estatistica())
+    if inspect.isgeneratorfunction(funcao):
+
+        @wraps(funcao)
+        def gerador(*args, **kwargs) -> Iterator:
+            inicio: float = perf_counter()
+            try:
+                yield from funcao(*args, **kwargs)
+            finally:
+                estatistica.registar(perf_counter() - inicio)
+
+        return gerador
+
+    @wraps(funcao)
+    def medida(*args, **kwargs):
+        inicio: float = perf_counter()
+        try:
+            return funcao(*args, **kwargs)
+        finally:
+            estatistica.registar(perf_counter() - inicio)
+
+    return medida
+
+
+def _contar_resultado(
+    funcao: Callable, contador: str, quantidade: Callable[[object], int]
+) -> Callable:
+    """
+    Envolve uma função de modo a acrescentar a um contador uma quantidade
+    calculada a partir do resultado de cada chamada
+
+    :param funcao: função a envolver
+    :type funcao: Callable
+    :param contador: nome do contador
+    :type contador: str
+    :param quantidade: calcula a quantidade a partir do resultado
+    :type quantidade: Callable[[object], int]
+    :return: função envolvida
+    :rtype: Callable
+    """
+    if inspect.isgeneratorfunction(funcao):
+
+        @wraps(funcao)
+        def gerador(*args, **kwargs) -> Iterator:
+            for resultado in funcao(*args, **kwargs):
+                contar(contador, quantidade(resultado))
+                yield resultado
+
+        return gerador
+
+    @wraps(funcao)
+    def contada(*args, **kwargs):
+        resultado = funcao(*args, **kwargs)
+        contar(contador, quantidade(resultado))
+        return resultado
+
+    return contada
+
+
+def _substituir(classe: type, nome: str, funcao: Callable) -> None:
+    """
+    Substitui um método de uma classe, guardando o original
+
+    :param classe: classe a alterar
+    :type classe: type
+    :param nome: nome do método
+    :type nome: str
+    :param funcao: novo método
+    :type funcao: Callable
+    """
+    _originais.append((classe, nome, vars(classe)[nome]))
+    setattr(classe, nome, funcao)
+
+
+def ativar(destino: Optional[str] = None) -> None:
+    """
+    Ativa a instrumentação: os métodos públicos de SistemaTuristico e de
+    Graph passam a registar o número e a duração das chamadas, e as
+    travessias do grafo o número de vértices visitados e de caminhos
+    enumerados. Enquanto não for ativada, as classes não são alteradas,
+    pelo que não há qualquer custo
+
+    :param destino: ficheiro onde é gravado o relatório quando o programa
+    termina, "-" para a saída de erro, ou None para não gravar
+    :type destino: Optional[str]
+    """
+    global _ativa, _destino
+    if _ativa:
+        return
+    from sistema.sistema_turistico import SistemaTuristico
+    from sistema.grafo import Graph
+    from sistema.grafo_csr import GrafoCSR
+
+    for classe in (SistemaTuristico, Graph):
+        for nome, metodo in list(vars(classe).items()):
+            if not nome.startswith("_") and inspect.isfunction(metodo):
+                _substituir(classe, nome, _medir(f"{classe.__name__}.{nome}", metodo))
+    _substituir(
+        GrafoCSR,
+        "dijkstra",
+        _contar_resultado(
+            GrafoCSR.dijkstra,
+            "vertices_visitados",
+            lambda r: sum(1 for d in r[0] if d != math.inf),
+        ),
+    )
+    _substituir(
+        GrafoCSR,
+        "profundidade",
+        _contar_resultado(
+            GrafoCSR.profundidade, "vertices_visitados", lambda r: len(r) + 1
+        ),
+    )
+    _substituir(
+        Graph,
+        "total_caminhos",
+        _contar_resultado(Graph.total_caminhos, "caminhos_enumerados", len),
+    )
+    _substituir(
+        Graph,
+        "caminhos_mais_curtos",
+        _contar_resultado(
+            Graph.caminhos_mais_curtos, "caminhos_enumerados", lambda r: 1
+        ),
+    )
+    _ativa = True
+    if destino is not None and _destino is None:
+        atexit.register(_gravar_ao_terminar)
+    _destino = destino
+
+
+def desativar() -> None:
+    """Desativa a instrumentação, repondo os métodos originais"""
+    global _ativa
+    while _originais:
+        classe, nome, original = _originais.pop()
+        setattr(classe, nome, original)
+    _ativa = False
+
+
+def limpar() -> None:
+    """Descarta as chamadas e contadores registados"""
+    with _tranca:
+        for estatistica in _estatisticas.values():
+            estatistica.__init__()
+        _contadores.clear()
+
+
+def relatorio() -> dict:
+    """
+    Obtém as estatísticas registadas até ao momento
+
+    :return: resumo das chamadas de cada operação e contadores de trabalho
+    :rtype: dict
+    """
+    with _tranca:
+        return {
+            "operacoes": {
+                nome: estatistica.resumo()
+                for nome, estatistica in sorted(_estatisticas.items())
+                if estatistica._chamadas
+            },
+            "contadores": dict(sorted(_contadores.items())),
+        }
+
+
+def gravar_relatorio(destino: str) -> None:
+    """
+    Grava o relatório em json
+
+    :param destino: caminho do ficheiro, ou "-" para a saída de erro
+    :type destino: str
+    """
+    texto: str = json.dumps(relatorio(), indent=4, ensure_ascii=False)
+    if destino == "-":
+        print(texto, file=sys.stderr)
+    else:
+        with open(destino, "w", encoding="UTF-8") as f:
+            f.write(texto + "\n")
+
+
+def _gravar_ao_terminar() -> None:
+    """Grava o relatório no destino indicado em ativar"""
+    if _destino is not None:
+        gravar_relatorio(_destino)
@@ -1,10 +1,26 @@
 from typing import List
 from sistema.Ponto2D import Ponto2D
 
+ESCALA: range = range(1, 5)
+"""valores possíveis de uma avaliação"""
+
 
 class PontoInteresse:
     """Ponto de interesse turístico de um determinado concelho"""
 
+    __slots__ = (
+        "_designacao",
+        "_morada",
+        "_coordenadas",
+        "_categoria",
+        "_acessibilidade",
+        "_atividades",
+        "_contagem_avaliacoes",
+        "_soma_avaliacoes",
+        "_histograma",
+        "_visitas",
+    )
+
     def __init__(
         self,
         designacao: str,
@@ -38,9 +54,22 @@ class PontoInteresse:
         self._categoria: str = categoria
         self._acessibilidade: str = acessibilidade
         self._atividades: str = atividades
-        self._avaliacao: List[int] = []
+        self._contagem_avaliacoes: int = 0
+        self._soma_avaliacoes: int = 0
+        self._histograma: List[int] = [0, 0, 0, 0]
         self._visitas: int = 0
 
+    def media_avaliacao(self) -> float:
+        """
+        Calcula a classificação média do ponto de interesse
+
+        :return: classificação média, ou 0 se não tiver avaliações
+        :rtype: float
+        """
+        if self._contagem_avaliacoes > 0:
+            return self._soma_avaliacoes / self._contagem_avaliacoes
+        return 0.00
+
     def __str__(self) -> str:
         """
         Gerar uma string com todos os atributos do ponto de interesse
@@ -48,10 +77,7 @@ class PontoInteresse:
         :return: string com os atributos do ponto de interesse
         :rtype: str
         """
-        if len(self._avaliacao) > 0:
-            media: float = sum(self._avaliacao) / len(self._avaliacao)
-        else:
-            media: float = 0.00
+        media: float = self.media_avaliacao()
         return (
             f"Designação: {self._designacao}\n"
             f"Morada: {self._morada}\n"
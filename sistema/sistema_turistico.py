@@ -1,13 +1,11 @@
-import math
-from matplotlib import pyplot as plt
-from sistema.LinkedList import LinkedList
-from sistema.ponto_interesse import PontoInteresse
+from bisect import bisect_left, insort
+from sistema.LinkedList import DoubleNode, LinkedList
+from sistema.ponto_interesse import ESCALA, PontoInteresse
 from sistema.via_circulacao import ViaCirculacao
 from sistema.grafo import Graph
-from typing import TypeVar, List, Tuple, Union
-
-
-T = TypeVar("T")
+from sistema.grelha_espacial import GrelhaEspacial
+from sistema.distancias import distancia_terra, indices_no_raio
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 
 class SistemaTuristico:
@@ -19,13 +17,17 @@ class SistemaTuristico:
     def __init__(self):
         """Define o estado inicial de self"""
         self._pontos: LinkedList[PontoInteresse] = LinkedList()
+        self._indice: dict[str, DoubleNode[PontoInteresse]] = {}
+        self._indice_categorias: dict[str, List[Tuple[str, str]]] = {}
         self._categorias: Tuple[str, str, str] = (
             "natureza",
             "cultura",
             "gastronomia",
         )
-        self._rede: List[ViaCirculacao] = []
+        self._rede: dict[Tuple[str, str], ViaCirculacao] = {}
+        self._vias_por_ponto: dict[str, set[Tuple[str, str]]] = {}
         self._grafo: Graph = Graph()
+        self._grelha: GrelhaEspacial[PontoInteresse] = GrelhaEspacial()
 
     def adicionar_ponto(self, ponto_interesse: PontoInteresse) -> None:
         """
@@ -34,7 +36,115 @@ class SistemaTuristico:
         :param ponto_interesse: ponto de interesse a ser adicionado
         :type ponto_interesse: PontoInteresse
         """
-        self._pontos.add(ponto_interesse)
+        self._indice[ponto_interesse._designacao] = self._pontos.add(ponto_interesse)
+        self._indexar_categoria(ponto_interesse)
+        self._grelha.adicionar(
+            float(ponto_interesse._coordenadas._x),
+            float(ponto_interesse._coordenadas._y),
+            ponto_interesse,
+        )
+
+    def carregar_pontos(self, pontos: Iterable[PontoInteresse]) -> None:
+        """
+        Adiciona vários pontos de interesse ao sistema de uma só vez,
+        ordenando o índice de cada categoria apenas no fim
+
+        :param pontos: pontos de interesse a adicionar
+        :type pontos: Iterable[PontoInteresse]
+        """
+        categorias: set[str] = set()
+        for ponto_interesse in pontos:
+            self._indice[ponto_interesse._designacao] = self._pontos.add(
+                ponto_interesse
+            )
+            self._indice_categorias.setdefault(ponto_interesse._categoria, []).append(
+                (ponto_interesse._designacao.casefold(), ponto_interesse._designacao)
+            )
+            categorias.add(ponto_interesse._categoria)
+            self._grelha.adicionar(
+                float(ponto_interesse._coordenadas._x),
+                float(ponto_interesse._coordenadas._y),
+                ponto_interesse,
+            )
+        for categoria in categorias:
+            self._indice_categorias[categoria].sort()
+
+    def _indexar_categoria(self, ponto_interesse: PontoInteresse) -> None:
+        """
+        Insere um ponto de interesse no índice da sua categoria,
+        mantendo a ordem alfabética das designações
+
+        :param ponto_interesse: ponto de interesse a inserir
+        :type ponto_interesse: PontoInteresse
+        """
+        insort(
+            self._indice_categorias.setdefault(ponto_interesse._categoria, []),
+            (ponto_interesse._designacao.casefold(), ponto_interesse._designacao),
+        )
+
+    def _desindexar_categoria(self, ponto_interesse: PontoInteresse) -> None:
+        """
+        Retira um ponto de interesse do índice da sua categoria
+
+        :param ponto_interesse: ponto de interesse a retirar
+        :type ponto_interesse: PontoInteresse
+        """
+        chaves: List[Tuple[str, str]] = self._indice_categorias.get(
+            ponto_interesse._categoria, []
+        )
+        chave: Tuple[str, str] = (
+            ponto_interesse._designacao.casefold(),
+            ponto_interesse._designacao,
+        )
+        i: int = bisect_left(chaves, chave)
+        if i < len(chaves) and chaves[i] == chave:
+            del chaves[i]
+
+    def obter_ponto(self, designacao: str) -> Optional[PontoInteresse]:
+        """
+        Obtém o ponto de interesse com uma determinada designação
+
+        :param designacao: designação do ponto de interesse
+        :type designacao: str
+        :return: ponto de interesse, ou None se não existir
+        :rtype: Optional[PontoInteresse]
+        """
+        no: Optional[DoubleNode[PontoInteresse]] = self._indice.get(designacao)
+        return None if no is None else no._data
+
+    def remover_ponto(self, designacao: str) -> Optional[PontoInteresse]:
+        """
+        Remove um ponto de interesse do sistema e da rede de circulação,
+        juntamente com as vias que o ligam a outros pontos
+
+        :param designacao: designação do ponto de interesse
+        :type designacao: str
+        :return: ponto de interesse removido, ou None se não existir
+        :rtype: Optional[PontoInteresse]
+        """
+        no: Optional[DoubleNode[PontoInteresse]] = self._indice.pop(designacao, None)
+        if no is None:
+            return None
+        ponto_interesse: PontoInteresse = self._pontos.unlink(no)
+        self._desindexar_categoria(ponto_interesse)
+        self._grelha.remover(
+            float(ponto_interesse._coordenadas._x),
+            float(ponto_interesse._coordenadas._y),
+            ponto_interesse,
+        )
+        self.remover_vertice(designacao)
+        return ponto_interesse
+
+    def existe_ponto(self, designacao: str) -> bool:
+        """
+        Verifica se existe um ponto de interesse com uma determinada designação
+
+        :param designacao: designação do ponto de interesse
+        :type designacao: str
+        :return: True se existir e False se não existir
+        :rtype: bool
+        """
+        return designacao in self._indice
 
     def alterar_ponto(
         self, ponto_interesse: PontoInteresse, categoria: str, acessibilidade: str
@@ -50,47 +160,46 @@ class SistemaTuristico:
         :param acessibilidade: nova acessibilidade
         :type acessibilidade: str
         """
-        ponto_interesse._categoria = categoria
+        if categoria != ponto_interesse._categoria:
+            self._desindexar_categoria(ponto_interesse)
+            ponto_interesse._categoria = categoria
+            self._indexar_categoria(ponto_interesse)
         ponto_interesse._acessibilidade = acessibilidade
 
-    def bubble_sort(self, lista: List[Tuple[str, T]]) -> List[Tuple[str, T]]:
+    def iterar_categoria(
+        self, categoria: str, inicio: int = 0, limite: Optional[int] = None
+    ) -> Iterator[PontoInteresse]:
         """
-        Algorítmo bubble sort para ordenar por ordem alfabética
+        Gera os pontos de interesse de uma determinada categoria
+        por ordem alfabética, a partir de uma determinada posição
 
-        :param lista: lista desordenada
-        :type lista: List[Tuple[str, T]]
-        :return: lista ordenada
-        :rtype: List[Tuple[str, T]]
-        """
-        n: int = len(lista)
-        for i in range(n):
-            trocas: bool = False
-            for j in range(0, n - i - 1):
-                if lista[j][0].upper() > lista[j + 1][0].upper():
-                    lista[j], lista[j + 1] = lista[j + 1], lista[j]
-                    trocas: bool = True
-            if not trocas:
-                break
-        return lista
+        :param categoria: categoria a ser pesquisada
+        :type categoria: str
+        :param inicio: posição do primeiro ponto de interesse a gerar
+        :type inicio: int
+        :param limite: número máximo de pontos de interesse, ou None para todos
+        :type limite: Optional[int]
+        :yield: pontos de interesse da categoria
+        :rtype: Iterator[PontoInteresse]
+        """
+        chaves: List[Tuple[str, str]] = self._indice_categorias.get(categoria, [])
+        fim: int = len(chaves) if limite is None else min(len(chaves), inicio + limite)
+        for i in range(inicio, fim):
+            yield self._indice[chaves[i][1]]._data
 
     def pesquisar_pontos(self, categoria: str) -> str:
         """
         Pesquisa todos os pontos de interesse de uma determinada
-        categoria e ordena-os por ordem alfabética
+        categoria, por ordem alfabética
 
         :param categoria: categoria a ser pesquisada
         :type categoria: str
         :return: pontos de interesse pertencente à categoria ordenados
         :rtype: str
         """
-        resultados: List[Tuple[str, PontoInteresse]] = []
         resultados_ordenados: str = ""
-        for ponto_interesse in self._pontos:
-            if ponto_interesse._categoria == categoria:
-                resultados.append((ponto_interesse._designacao, ponto_interesse))
-        resultados = self.bubble_sort(resultados)
-        for i in resultados:
-            resultados_ordenados += f"{str(i[1])}\n"
+        for ponto_interesse in self.iterar_categoria(categoria):
+            resultados_ordenados += f"{str(ponto_interesse)}\n"
         return resultados_ordenados
 
     def avaliar_ponto(self, avaliacao: int, ponto_interesse: PontoInteresse) -> None:
@@ -102,10 +211,85 @@ class SistemaTuristico:
         :type avaliacao: int
         :param ponto_interesse: ponto de interesse a ser avaliado
         :type ponto_interesse: PontoInteresse
-        """
-        ponto_interesse._avaliacao.append(avaliacao)
+        :raises ValueError: se a avaliação não for um inteiro de 1 a 4
+        """
+        if (
+            isinstance(avaliacao, bool)
+            or not isinstance(avaliacao, int)
+            or avaliacao not in ESCALA
+        ):
+            raise ValueError(f"avaliação fora da escala de 1 a 4: {avaliacao!r}")
+        ponto_interesse._contagem_avaliacoes += 1
+        ponto_interesse._soma_avaliacoes += avaliacao
+        ponto_interesse._histograma[avaliacao - 1] += 1
         ponto_interesse._visitas += 1
 
+    @staticmethod
+    def _validar_contagem(designacao: str, contagem: Sequence[int]) -> None:
+        """
+        Verifica que uma contagem tem um número de avaliações, inteiro
+        e não negativo, para cada valor da escala
+
+        :param designacao: designação do ponto de interesse
+        :type designacao: str
+        :param contagem: número de avaliações com os valores 1, 2, 3 e 4
+        :type contagem: Sequence[int]
+        :raises ValueError: se a contagem for inválida
+        """
+        if isinstance(contagem, (str, bytes)) or len(contagem) != len(ESCALA):
+            raise ValueError(
+                f"{designacao}: a contagem tem de ter {len(ESCALA)} valores"
+            )
+        for c in contagem:
+            if isinstance(c, bool) or not isinstance(c, int) or c < 0:
+                raise ValueError(f"{designacao}: contagem inválida: {c!r}")
+
+    def avaliar_pontos(self, contagens: dict[str, Sequence[int]]) -> int:
+        """
+        Adiciona de uma só vez várias avaliações a vários pontos de
+        interesse, incrementando o contador de visitas por cada uma.
+        As designações que não existem no sistema são ignoradas. Todas
+        as contagens são verificadas antes de alguma ser aplicada
+
+        :param contagens: número de avaliações com os valores 1, 2, 3 e 4
+        dadas a cada ponto de interesse, por designação
+        :type contagens: dict[str, Sequence[int]]
+        :return: número de avaliações adicionadas
+        :rtype: int
+        :raises ValueError: se alguma contagem for inválida
+        """
+        for designacao, contagem in contagens.items():
+            self._validar_contagem(designacao, contagem)
+        total: int = 0
+        for designacao, contagem in contagens.items():
+            ponto_interesse: Optional[PontoInteresse] = self.obter_ponto(designacao)
+            if ponto_interesse is None:
+                continue
+            n: int = sum(contagem)
+            ponto_interesse._contagem_avaliacoes += n
+            ponto_interesse._soma_avaliacoes += sum(
+                (i + 1) * c for i, c in enumerate(contagem)
+            )
+            for i, c in enumerate(contagem):
+                ponto_interesse._histograma[i] += c
+            ponto_interesse._visitas += n
+            total += n
+        return total
+
+    def histograma_avaliacoes(self) -> List[int]:
+        """
+        Conta as avaliações de todos os pontos de interesse
+        por cada valor da escala numérica
+
+        :return: número de avaliações com os valores 1, 2, 3 e 4
+        :rtype: List[int]
+        """
+        contagem_avaliacoes: List[int] = [0, 0, 0, 0]
+        for ponto_interesse in self._pontos:
+            for i in range(4):
+                contagem_avaliacoes[i] += ponto_interesse._histograma[i]
+        return contagem_avaliacoes
+
     def consultar_estatisticas(self) -> str:
         """
         Consulta todos os pontos de interesse,
@@ -118,16 +302,8 @@ class SistemaTuristico:
         :rtype: str
         """
         consulta: str = ""
-        total_avaliacoes: List[int] = []
         for ponto_interesse in self._pontos:
-            if len(ponto_interesse._avaliacao) > 0:
-                media: float = sum(ponto_interesse._avaliacao) / len(
-                    ponto_interesse._avaliacao
-                )
-                for a in ponto_interesse._avaliacao:
-                    total_avaliacoes.append(a)
-            else:
-                media: float = 0.00
+            media: float = ponto_interesse.media_avaliacao()
             consulta += (
                 f"{ponto_interesse._designacao}:\n"
                 "Categoria: "
@@ -137,24 +313,10 @@ class SistemaTuristico:
                 "Classificação média: "
                 f"{str(round(media, 2))}\n\n"
             )
-        contagem_avaliacoes = [
-            total_avaliacoes.count(1),
-            total_avaliacoes.count(2),
-            total_avaliacoes.count(3),
-            total_avaliacoes.count(4),
-        ]
-        escala = [
-            "1\nNada Satisfeito",
-            "2\nPouco Satisfeito",
-            "3\nSatisfeito",
-            "4\nMuito Satisfeito",
-        ]
-        plt.figure(figsize=(8, 6))
-        plt.bar(escala, contagem_avaliacoes)
-        plt.title("Distribuição dos Pontos de Interesse pela Escala Numérica")
-        plt.ylabel("Número de Avaliações")
-        plt.yticks(range(0, max(contagem_avaliacoes) + 1))
-        plt.show()
+        contagem_avaliacoes: List[int] = self.histograma_avaliacoes()
+        from sistema.visualizacao import grafico_avaliacoes
+
+        grafico_avaliacoes(contagem_avaliacoes)
         return consulta
 
     def distancia_terra(
@@ -174,46 +336,37 @@ class SistemaTuristico:
         :return: distância entre os dois pontos
         :rtype: float
         """
-        R: int = 6371000
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-        dlat: float = lat2 - lat1
-        dlon: float = lon2 - lon1
-        a: float = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+        return distancia_terra(lat1, lon1, lat2, lon2)
+
+    def pontos_proximos(
+        self, lat: float, lon: float, raio: float = 5000
+    ) -> List[PontoInteresse]:
+        """
+        Obtém os pontos de interesse próximos de uma coordenada,
+        por ordem decrescente do número de visitas
+
+        :param lat: latitude da coordenada
+        :type lat: float
+        :param lon: longitude da coordenada
+        :type lon: float
+        :param raio: distância máxima (m) dos pontos de interesse
+        :type raio: float
+        :return: pontos de interesse próximos da coordenada
+        :rtype: List[PontoInteresse]
+        """
+        candidatos, lats, lons = self._grelha.candidatos_coordenadas(
+            float(lat), float(lon), raio
+        )
+        return sorted(
+            (
+                candidatos[i]
+                for i in indices_no_raio(float(lat), float(lon), lats, lons, raio)
+            ),
+            key=lambda p: p._visitas,
+            reverse=True,
         )
-        c: float = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        d: float = R * c
-        return d
-
-    def quick_sort(
-        self, lista: List[Tuple[Union[int, float], T]]
-    ) -> List[Tuple[Union[int, float], T]]:
-        """
-        Algorítmo quick sort para ordenar números por ordem decrescente
-
-        :param lista: lista desordenada
-        :type lista: List[Tuple[Union[int, float], T]]
-        :return: lista ordenada
-        :rtype: List[Tuple[Union[int, float], T]]
-        """
-        if len(lista) > 1:
-            pivot: int = len(lista) // 2
-            lista_maior: List[Tuple[Union[int, float], T]] = []
-            lista_menor: List[Tuple[Union[int, float], T]] = []
-            for i in range(len(lista)):
-                if lista[i][0] < lista[pivot][0]:
-                    lista_menor.append(lista[i])
-                elif i != pivot:
-                    lista_maior.append(lista[i])
-            return (
-                self.quick_sort(lista_maior)
-                + [lista[pivot]]
-                + self.quick_sort(lista_menor)
-            )
-        return lista
 
-    def sugestoes_visitas(self, lat: float, lon: float) -> str:
+    def sugestoes_visitas(self, lat: float, lon: float, raio: float = 5000) -> str:
         """
         Mostra os pontos de interesse próximos das coordenadas inseridas,
         organizando-os por ordem decrescente do número de visitas
@@ -222,25 +375,81 @@ class SistemaTuristico:
         :type lat: float
         :param lon: longitude da coordenada inserida
         :type lon: float
+        :param raio: distância máxima (m) dos pontos de interesse
+        :type raio: float
         :return: pontos de interesse próximos das coordenadas
         :rtype: str
         """
-        pontos_proximos: List[Tuple[Union[int, float], PontoInteresse]] = []
         pontos_ordenados: str = ""
-        for ponto_interesse in self._pontos:
-            proximidade: float = self.distancia_terra(
-                float(lat),
-                float(lon),
-                float(ponto_interesse._coordenadas._x),
-                float(ponto_interesse._coordenadas._y),
-            )
-            if proximidade <= 5000:
-                pontos_proximos.append((ponto_interesse._visitas, ponto_interesse))
-        pontos_proximos = self.quick_sort(pontos_proximos)
-        for i in pontos_proximos:
-            pontos_ordenados += f"{str(i[1])}\n"
+        for ponto_interesse in self.pontos_proximos(lat, lon, raio):
+            pontos_ordenados += f"{str(ponto_interesse)}\n"
         return pontos_ordenados
 
+    def itinerario(
+        self, inicio: str, fim: str, tabelado: bool = True
+    ) -> Tuple[float, List[str], float, float]:
+        """
+        Calcula o caminho mais curto entre dois pontos da rede.
+        Por omissão usa a tabela de caminhos mais curtos do grafo, que torna
+        rápidas as consultas repetidas a partir do mesmo ponto de origem.
+        Caso contrário usa o algoritmo A*, com a distância entre as
+        coordenadas geográficas de cada ponto e as do ponto de destino
+        como heurística
+
+        :param inicio: ponto de origem
+        :type inicio: str
+        :param fim: ponto de destino
+        :type fim: str
+        :param tabelado: True para usar a tabela e False para usar o A*
+        :type tabelado: bool
+        :return: distância (km), caminho e tempos estimados (h) a pé
+        e de carro, ou (inf, [], 0.0, 0.0) se não existir caminho
+        :rtype: Tuple[float, List[str], float, float]
+        """
+        if tabelado:
+            return self._tempos_caminho(*self._grafo.caminho_tabelado(inicio, fim))
+        destino: Optional[PontoInteresse] = self.obter_ponto(fim)
+
+        def heuristica(vertice: str) -> float:
+            ponto_interesse: Optional[PontoInteresse] = self.obter_ponto(vertice)
+            if destino is None or ponto_interesse is None:
+                return 0.0
+            return (
+                self.distancia_terra(
+                    float(ponto_interesse._coordenadas._x),
+                    float(ponto_interesse._coordenadas._y),
+                    float(destino._coordenadas._x),
+                    float(destino._coordenadas._y),
+                )
+                / 1000
+            )
+
+        return self._tempos_caminho(
+            *self._grafo.caminho_mais_curto(inicio, fim, heuristica)
+        )
+
+    def _tempos_caminho(
+        self, distancia: float, caminho: List[str]
+    ) -> Tuple[float, List[str], float, float]:
+        """
+        Soma os tempos estimados a pé e de carro das vias de um caminho
+
+        :param distancia: distância total do caminho (km)
+        :type distancia: float
+        :param caminho: pontos do caminho
+        :type caminho: List[str]
+        :return: distância (km), caminho e tempos estimados (h) a pé e de carro
+        :rtype: Tuple[float, List[str], float, float]
+        """
+        tempo_a_pe: float = 0.0
+        tempo_carro: float = 0.0
+        for i in range(len(caminho) - 1):
+            via: Optional[ViaCirculacao] = self.obter_via(caminho[i], caminho[i + 1])
+            if via is not None:
+                tempo_a_pe += via._tempo_a_pe
+                tempo_carro += via._tempo_carro
+        return distancia, caminho, tempo_a_pe, tempo_carro
+
     def consultar_vertices(self) -> str:
         """
         Consulta todos os pontos pertencentes à rede de circulação
@@ -269,9 +478,10 @@ class SistemaTuristico:
         :param vertice: ponto a ser removido
         :type vertice: str
         """
-        for a in self._rede:
-            if vertice == a._inicio or vertice == a._fim:
-                self._rede.remove(a)
+        for chave in self._vias_por_ponto.pop(vertice, set()):
+            self._rede.pop(chave)
+            outro: str = chave[1] if chave[0] == vertice else chave[0]
+            self._vias_por_ponto[outro].discard(chave)
         self._grafo.remove_vertex(vertice)
 
     def consultar_arestas(self) -> str:
@@ -282,19 +492,60 @@ class SistemaTuristico:
         :rtype: str
         """
         arestas: str = ""
-        for a in self._rede:
+        for a in self._rede.values():
             arestas += f"{a}\n"
         return arestas
 
-    def acrescentar_aresta(self, aresta: ViaCirculacao) -> None:
+    def obter_via(self, inicio: str, fim: str) -> Optional[ViaCirculacao]:
         """
-        Acrescenta uma via à rede de circulação
+        Obtém a via da rede de circulação entre dois pontos
 
-        :param vertice: via a ser adicionada
-        :type vertice: str
+        :param inicio: ponto do início da via
+        :type inicio: str
+        :param fim: ponto do fim da via
+        :type fim: str
+        :return: via, ou None se não existir
+        :rtype: Optional[ViaCirculacao]
+        """
+        return self._rede.get((inicio, fim))
+
+    def acrescentar_aresta(self, aresta: ViaCirculacao) -> bool:
         """
-        self._rede.append(aresta)
-        self._grafo.add_edges(aresta._inicio, aresta._fim, aresta._distancia)
+        Acrescenta uma via à rede de circulação, se o grafo aceitar a
+        aresta correspondente
+
+        :param aresta: via a ser adicionada
+        :type aresta: ViaCirculacao
+        :return: True se a via foi adicionada e False se algum dos pontos
+        não existir na rede ou se já estiverem ligados
+        :rtype: bool
+        """
+        if not self._grafo.add_edges(aresta._inicio, aresta._fim, aresta._distancia):
+            return False
+        chave: Tuple[str, str] = (aresta._inicio, aresta._fim)
+        self._rede[chave] = aresta
+        self._vias_por_ponto.setdefault(aresta._inicio, set()).add(chave)
+        self._vias_por_ponto.setdefault(aresta._fim, set()).add(chave)
+        return True
+
+    def carregar_vias(self, vias: Iterable[ViaCirculacao]) -> None:
+        """
+        Acrescenta várias vias à rede de circulação de uma só vez,
+        cujas arestas já foram carregadas no grafo
+
+        :param vias: vias a acrescentar
+        :type vias: Iterable[ViaCirculacao]
+        """
+        rede: dict[Tuple[str, str], ViaCirculacao] = self._rede
+        vias_por_ponto: dict[str, set[Tuple[str, str]]] = self._vias_por_ponto
+        for via in vias:
+            chave: Tuple[str, str] = (via._inicio, via._fim)
+            rede[chave] = via
+            for ponto in chave:
+                if ponto in vias_por_ponto:
+                    vias_por_ponto[ponto].add(chave)
+                else:
+                    vias_por_ponto[ponto] = {chave}
 
     def remover_aresta(self, aresta: ViaCirculacao) -> None:
         """
@@ -303,9 +554,48 @@ class SistemaTuristico:
         :param aresta: via a ser removida
         :type aresta: ViaCirculacao
         """
-        self._rede.remove(aresta)
+        chave: Tuple[str, str] = (aresta._inicio, aresta._fim)
+        if self._rede.pop(chave, None) is not None:
+            self._vias_por_ponto[aresta._inicio].discard(chave)
+            self._vias_por_ponto[aresta._fim].discard(chave)
         self._grafo.remove_edge(aresta._inicio, aresta._fim)
 
+    def pontos_criticos(
+        self, metrica: str, amostra: Optional[int] = None
+    ) -> List[Tuple[Union[int, float], str]]:
+        """
+        Pontos da rede ordenados por ordem decrescente de uma
+        métrica de centralidade
+
+        :param metrica: "grau_externo", "grau_interno", "proximidade"
+        ou "intermediacao"
+        :type metrica: str
+        :param amostra: número de pontos usados numa aproximação da
+        proximidade ou da intermediação, ou None para o cálculo exato
+        :type amostra: Optional[int]
+        :return: valor da métrica e ponto da rede
+        :rtype: List[Tuple[Union[int, float], str]]
+        """
+        if metrica == "grau_externo":
+            valores: dict[str, Union[int, float]] = {
+                v: len(self._grafo.adjacentes_externo(v)) for v in self._grafo._vertices
+            }
+        elif metrica == "grau_interno":
+            valores: dict[str, Union[int, float]] = {
+                v: len(self._grafo.adjacentes_interno(v)) for v in self._grafo._vertices
+            }
+        elif metrica == "proximidade":
+            valores: dict[str, Union[int, float]] = self._grafo.proximidade(amostra)
+        elif metrica == "intermediacao":
+            valores: dict[str, Union[int, float]] = self._grafo.intermediacao(amostra)
+        else:
+            raise ValueError(f"Métrica de centralidade desconhecida: {metrica}")
+        return sorted(
+            ((valor, v) for v, valor in valores.items()),
+            key=lambda p: p[0],
+            reverse=True,
+        )
+
     def grau_externo(self) -> str:
         """
         Pontos da rede mais críticos, considerando
@@ -315,12 +605,8 @@ class SistemaTuristico:
         :return: pontos ordenados por ordem decrescente do grau externo
         :rtype: str
         """
-        pontos_criticos: List[Tuple[Union[int, float], str]] = []
         pontos_ordenados: str = ""
-        for v in self._grafo._vertices:
-            pontos_criticos.append((len(self._grafo.adjacentes_externo(v)), v))
-        pontos_criticos = self.quick_sort(pontos_criticos)
-        for p in pontos_criticos:
+        for p in self.pontos_criticos("grau_externo"):
             pontos_ordenados += (
                 f"Ponto da rede: {str(p[1])}\n" f"Grau externo: {str(p[0])}\n\n"
             )
@@ -335,19 +621,49 @@ class SistemaTuristico:
         :return: pontos ordenados por ordem decrescente do grau interno
         :rtype: str
         """
-        pontos_criticos: List[Tuple[Union[int, float], str]] = []
         pontos_ordenados: str = ""
-        for v in self._grafo._vertices:
-            pontos_criticos.append((len(self._grafo.adjacentes_interno(v)), v))
-        pontos_criticos = self.quick_sort(pontos_criticos)
-        for p in pontos_criticos:
+        for p in self.pontos_criticos("grau_interno"):
             pontos_ordenados += (
                 f"Ponto da rede: {str(p[1])}\n" f"Grau interno: {str(p[0])}\n\n"
             )
         return pontos_ordenados
 
     def proximidade(self) -> str:
-        return ""
+        """
+        Pontos da rede mais críticos, considerando
+        a métrica de centralidade proximidade,
+        ordenados por ordem decrescente
+
+        :return: pontos ordenados por ordem decrescente da proximidade
+        :rtype: str
+        """
+        pontos_ordenados: str = ""
+        for p in self.pontos_criticos("proximidade"):
+            pontos_ordenados += (
+                f"Ponto da rede: {str(p[1])}\n"
+                f"Proximidade: {str(round(p[0], 4))}\n\n"
+            )
+        return pontos_ordenados
+
+    def intermediacao(self, amostra: Optional[int] = None) -> str:
+        """
+        Pontos da rede mais críticos, considerando
+        a métrica de centralidade intermediação,
+        ordenados por ordem decrescente
+
+        :param amostra: número de pontos de partida usados numa
+        aproximação, ou None para o cálculo exato
+        :type amostra: Optional[int]
+        :return: pontos ordenados por ordem decrescente da intermediação
+        :rtype: str
+        """
+        pontos_ordenados: str = ""
+        for p in self.pontos_criticos("intermediacao", amostra):
+            pontos_ordenados += (
+                f"Ponto da rede: {str(p[1])}\n"
+                f"Intermediação: {str(round(p[0], 4))}\n\n"
+            )
+        return pontos_ordenados
 
     def mapa(self) -> None:
         """
@@ -363,12 +679,6 @@ class SistemaTuristico:
                     str(ponto_interesse._designacao),
                 )
             )
-        plt.figure(figsize=(8, 6))
-        for latitude, longitude, designacao in coordenadas:
-            plt.scatter(latitude, longitude, label=designacao)
-        plt.title("Mapa dos Pontos de Interesse")
-        plt.xlabel("Latitude")
-        plt.ylabel("Longitude")
-        plt.grid(True)
-        plt.legend()
-        plt.show()
+        from sistema.visualizacao import mapa_pontos
+
+        mapa_pontos(coordenadas)
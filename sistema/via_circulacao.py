@@ -4,6 +4,16 @@ from math import floor
 class ViaCirculacao:
     """Via de uma rede de circulação de um determinado concelho"""
 
+    __slots__ = (
+        "_inicio",
+        "_fim",
+        "_distancia",
+        "_velocidade_minima",
+        "_velocidade_maxima",
+        "_tempo_a_pe",
+        "_tempo_carro",
+    )
+
     def __init__(
         self,
         inicio: str,
@@ -0,0 +1,74 @@
+import networkx as nx
+from matplotlib import pyplot as plt
+from typing import List, Tuple
+
+
+def desenhar_grafo(
+    vertices: set[str],
+    arestas: dict[Tuple[str, str], float],
+    disposicao: str = "shell",
+) -> None:
+    """
+    Visualiza um grafo orientado em modo gráfico
+
+    :param vertices: vértices do grafo
+    :type vertices: set[str]
+    :param arestas: peso de cada aresta (inicio, fim)
+    :type arestas: dict[Tuple[str, str], float]
+    :param disposicao: "shell" para dispor os vértices em círculo ou
+    "spring" para os dispor por forças entre os vértices
+    :type disposicao: str
+    """
+    plt.figure(figsize=(8, 6))
+    g: nx.DiGraph = nx.DiGraph()
+    g.add_nodes_from(vertices)
+    g.add_edges_from(arestas)
+    if disposicao == "spring":
+        pos = nx.spring_layout(g)
+    else:
+        pos = nx.shell_layout(g)
+    nx.draw_networkx_nodes(g, pos)
+    nx.draw_networkx_edges(g, pos, arrows=True)
+    nx.draw_networkx_labels(g, pos)
+    nx.draw_networkx_edge_labels(g, pos, edge_labels=arestas, label_pos=0.7)
+    plt.show()
+
+
+def grafico_avaliacoes(contagem_avaliacoes: List[int]) -> None:
+    """
+    Mostra o gráfico com a distribuição das avaliações
+    pelos valores da escala numérica
+
+    :param contagem_avaliacoes: número de avaliações com os valores 1, 2, 3 e 4
+    :type contagem_avaliacoes: List[int]
+    """
+    escala = [
+        "1\nNada Satisfeito",
+        "2\nPouco Satisfeito",
+        "3\nSatisfeito",
+        "4\nMuito Satisfeito",
+    ]
+    plt.figure(figsize=(8, 6))
+    plt.bar(escala, contagem_avaliacoes)
+    plt.title("Distribuição dos Pontos de Interesse pela Escala Numérica")
+    plt.ylabel("Número de Avaliações")
+    plt.yticks(range(0, max(contagem_avaliacoes) + 1))
+    plt.show()
+
+
+def mapa_pontos(coordenadas: List[Tuple[float, float, str]]) -> None:
+    """
+    Mostra um mapa com pontos identificados pelas suas coordenadas
+
+    :param coordenadas: latitude, longitude e designação de cada ponto
+    :type coordenadas: List[Tuple[float, float, str]]
+    """
+    plt.figure(figsize=(8, 6))
+    for latitude, longitude, designacao in coordenadas:
+        plt.scatter(latitude, longitude, label=designacao)
+    plt.title("Mapa dos Pontos de Interesse")
+    plt.xlabel("Latitude")
+    plt.ylabel("Longitude")
+    plt.grid(True)
+    plt.legend()
+    plt.show()
@@ -0,0 +1,78 @@
+import os
+import subprocess
+import sys
+from statistics import median
+from time import perf_counter
+from typing import List
+
+RAIZ: str = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+CENARIOS: dict[str, str] = {
+    "núcleo (sistema + interface)": (
+        "import sistema.sistema_turistico, interface.input_output, interface.menu"
+    ),
+    "núcleo + visualização": (
+        "import sistema.sistema_turistico, interface.input_output, interface.menu, "
+        "sistema.visualizacao"
+    ),
+}
+
+
+def tempo_arranque(codigo: str, repeticoes: int = 15) -> List[float]:
+    """
+    Mede o tempo (s) de arranque de um interpretador novo que executa o código
+
+    :param codigo: código Python a executar
+    :type codigo: str
+    :param repeticoes: número de interpretadores a lançar
+    :type repeticoes: int
+    :return: tempo de cada execução
+    :rtype: List[float]
+    """
+    tempos: List[float] = []
+    for _ in range(repeticoes):
+        inicio: float = perf_counter()
+        subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, check=True)
+        tempos.append(perf_counter() - inicio)
+    return tempos
+
+
+def bibliotecas_carregadas(codigo: str) -> List[str]:
+    """
+    Verifica que bibliotecas de gráficos ficam carregadas depois do código
+
+    :param codigo: código Python a executar
+    :type codigo: str
+    :return: nomes das bibliotecas de gráficos importadas
+    :rtype: List[str]
+    """
+    resultado = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            codigo + "\nimport sys\n"
+            "print(' '.join(m for m in ('matplotlib', 'networkx') if m in sys.modules))",
+        ],
+        cwd=RAIZ,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return resultado.stdout.split()
+
+
+def main() -> None:
+    """Compara o tempo de arranque com e sem as bibliotecas de gráficos"""
+    vazio: float = median(tempo_arranque("pass"))
+    print(f"{'interpretador vazio':32} {vazio * 1000:8.1f} ms")
+    for nome, codigo in CENARIOS.items():
+        tempo: float = median(tempo_arranque(codigo))
+        carregadas: str = ", ".join(bibliotecas_carregadas(codigo)) or "nenhuma"
+        print(
+            f"{nome:32} {tempo * 1000:8.1f} ms "
+            f"(+{(tempo - vazio) * 1000:.1f} ms; gráficos: {carregadas})"
+        )
+
+
+if __name__ == "__main__":
+    main()
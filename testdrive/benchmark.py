@@ -0,0 +1,274 @@
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+from argparse import ArgumentParser, Namespace
+from statistics import median
+from time import perf_counter
+from typing import Callable, List, Optional
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from sistema.sistema_turistico import SistemaTuristico
+from sistema.ponto_interesse import PontoInteresse
+from sistema.Ponto2D import Ponto2D
+from interface import input_output as io
+from testdrive.gerador import CENTRO, gerar_sistema
+
+LIMITE_TOTAL_CAMINHOS: int = 12
+"""tamanho máximo em que é medido total_caminhos, que cresce exponencialmente"""
+
+AMOSTRA_INTERMEDIACAO: int = 50
+"""vértices de partida usados na intermediação aproximada"""
+
+
+class Contexto:
+    """Sistema a medir e dados auxiliares das operações"""
+
+    def __init__(self, st: SistemaTuristico, semente: int, pasta: str):
+        """
+        Define o estado inicial de self
+
+        :param st: sistema a medir
+        :type st: SistemaTuristico
+        :param semente: semente do gerador dos argumentos das operações
+        :type semente: int
+        :param pasta: pasta temporária para os ficheiros gravados
+        :type pasta: str
+        """
+        self.st: SistemaTuristico = st
+        self.aleatorio: random.Random = random.Random(semente)
+        self.pasta: str = pasta
+        self.pontos: List[str] = [p._designacao for p in st._pontos]
+        self.novos: int = 0
+
+    def ponto(self) -> str:
+        """
+        Escolhe ao acaso a designação de um ponto de interesse
+
+        :return: designação
+        :rtype: str
+        """
+        return self.aleatorio.choice(self.pontos)
+
+    def invalidar(self) -> None:
+        """Descarta as tabelas e centralidades guardadas pelo grafo"""
+        self.st._grafo.invalidar_caches()
+
+
+def _adicionar_ponto(c: Contexto) -> None:
+    c.novos += 1
+    c.st.adicionar_ponto(
+        PontoInteresse(
+            f"Ponto novo {c.novos}",
+            "Rua Direita",
+            Ponto2D(CENTRO[0] + c.aleatorio.uniform(-0.1, 0.1), CENTRO[1]),
+            "cultura",
+            "",
+            "",
+        )
+    )
+
+
+def _sugestoes(c: Contexto) -> None:
+    c.st.sugestoes_visitas(
+        CENTRO[0] + c.aleatorio.uniform(-0.1, 0.1),
+        CENTRO[1] + c.aleatorio.uniform(-0.1, 0.1),
+    )
+
+
+def _itinerario_frio(c: Contexto) -> None:
+    c.invalidar()
+    c.st.itinerario(c.ponto(), c.ponto())
+
+
+def _total_caminhos(c: Contexto) -> Optional[bool]:
+    if len(c.st._grafo) > LIMITE_TOTAL_CAMINHOS:
+        return False
+    c.st._grafo.total_caminhos(c.ponto(), c.ponto())
+
+
+def _proximidade(c: Contexto) -> None:
+    c.invalidar()
+    c.st.proximidade()
+
+
+def _intermediacao(c: Contexto) -> None:
+    c.st.intermediacao(AMOSTRA_INTERMEDIACAO)
+
+
+def _gravar(c: Contexto) -> None:
+    io.PASTA_DADOS = c.pasta
+    io.gravar_sistema_turistico(c.st)
+
+
+def _carregar(c: Contexto) -> None:
+    io.PASTA_DADOS = c.pasta
+    if not os.path.exists(io.caminho_ficheiro(io.SNAPSHOT_BINARIO)):
+        io.gravar_sistema_turistico(c.st)
+    io.carregar_sistema_turistico(SistemaTuristico())
+
+
+def _exportar_json(c: Contexto) -> None:
+    io.exportar_json(c.st, os.path.join(c.pasta, "benchmark.json"))
+
+
+def _importar_json(c: Contexto) -> None:
+    ficheiro: str = os.path.join(c.pasta, "benchmark.json")
+    if not os.path.exists(ficheiro):
+        io.exportar_json(c.st, ficheiro)
+    io.importar_json(SistemaTuristico(), ficheiro)
+
+
+OPERACOES: dict[str, Callable[[Contexto], Optional[bool]]] = {
+    "adicionar_ponto": _adicionar_ponto,
+    "obter_ponto": lambda c: c.st.obter_ponto(c.ponto()),
+    "pesquisar_pontos": lambda c: c.st.pesquisar_pontos(
+        c.aleatorio.choice(c.st._categorias)
+    ),
+    "iterar_categoria (20)": lambda c: list(
+        c.st.iterar_categoria(c.aleatorio.choice(c.st._categorias), 0, 20)
+    ),
+    "avaliar_ponto": lambda c: c.st.avaliar_ponto(
+        c.aleatorio.randint(1, 4), c.st.obter_ponto(c.ponto())
+    ),
+    "histograma_avaliacoes": lambda c: c.st.histograma_avaliacoes(),
+    "sugestoes_visitas": _sugestoes,
+    "itinerario (tabela fria)": _itinerario_frio,
+    "itinerario (tabela)": lambda c: c.st.itinerario(c.ponto(), c.ponto()),
+    "itinerario (A*)": lambda c: c.st.itinerario(c.ponto(), c.ponto(), False),
+    "total_caminhos": _total_caminhos,
+    "grau_externo": lambda c: c.st.grau_externo(),
+    "grau_interno": lambda c: c.st.grau_interno(),
+    "proximidade": _proximidade,
+    f"intermediacao (amostra {AMOSTRA_INTERMEDIACAO})": _intermediacao,
+    "consultar_arestas": lambda c: c.st.consultar_arestas(),
+    "gravar_sistema_turistico": _gravar,
+    "carregar_sistema_turistico": _carregar,
+    "exportar_json": _exportar_json,
+    "importar_json": _importar_json,
+}
+
+
+def medir(
+    tamanhos: List[int],
+    densidade: float,
+    repeticoes: int,
+    semente: int,
+    operacoes: Optional[List[str]] = None,
+) -> List[dict]:
+    """
+    Mede o tempo de cada operação em sistemas gerados de vários tamanhos
+
+    :param tamanhos: números de pontos de interesse dos sistemas
+    :type tamanhos: List[int]
+    :param densidade: número médio de vias que partem de cada ponto
+    :type densidade: float
+    :param repeticoes: número de medições de cada operação
+    :type repeticoes: int
+    :param semente: semente dos geradores aleatórios
+    :type semente: int
+    :param operacoes: nomes das operações a medir, ou None para todas
+    :type operacoes: Optional[List[str]]
+    :return: tempos (s) de cada operação em cada tamanho
+    :rtype: List[dict]
+    """
+    pasta_original: str = io.PASTA_DADOS
+    resultados: List[dict] = []
+    try:
+        for tamanho in tamanhos:
+            inicio: float = perf_counter()
+            st: SistemaTuristico = gerar_sistema(tamanho, densidade, semente)
+            resultados.append(
+                {
+                    "operacao": "gerar_sistema",
+                    "tamanho": tamanho,
+                    "vias": len(st._rede),
+                    "repeticoes": 1,
+                    "tempos": [perf_counter() - inicio],
+                }
+            )
+            with tempfile.TemporaryDirectory() as pasta:
+                contexto: Contexto = Contexto(st, semente, pasta)
+                for nome, operacao in OPERACOES.items():
+                    if operacoes is not None and nome not in operacoes:
+                        continue
+                    tempos: List[float] = []
+                    for _ in range(repeticoes):
+                        inicio = perf_counter()
+                        if operacao(contexto) is False:
+                            break
+                        tempos.append(perf_counter() - inicio)
+                    if tempos:
+                        resultados.append(
+                            {
+                                "operacao": nome,
+                                "tamanho": tamanho,
+                                "vias": len(st._rede),
+                                "repeticoes": len(tempos),
+                                "tempos": tempos,
+                            }
+                        )
+    finally:
+        io.PASTA_DADOS = pasta_original
+    for resultado in resultados:
+        tempos: List[float] = resultado.pop("tempos")
+        resultado["mediana"] = median(tempos)
+        resultado["minimo"] = min(tempos)
+        resultado["maximo"] = max(tempos)
+    return resultados
+
+
+def argumentos() -> Namespace:
+    """
+    Interpreta os argumentos da linha de comandos
+
+    :return: argumentos interpretados
+    :rtype: Namespace
+    """
+    parser: ArgumentParser = ArgumentParser(
+        description="Mede as operações do sistema turístico em sistemas gerados"
+    )
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--densidade", type=float, default=3.0)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--operacoes", nargs="+", choices=list(OPERACOES))
+    parser.add_argument(
+        "--saida",
+        default="benchmark.json",
+        help="ficheiro json onde são escritos os resultados",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Mede as operações e escreve os resultados em json"""
+    args: Namespace = argumentos()
+    resultados: List[dict] = medir(
+        args.tamanhos, args.densidade, args.repeticoes, args.semente, args.operacoes
+    )
+    with open(args.saida, "w", encoding="UTF-8") as f:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "plataforma": platform.platform(),
+                "densidade": args.densidade,
+                "semente": args.semente,
+                "resultados": resultados,
+            },
+            f,
+            indent=4,
+            ensure_ascii=False,
+        )
+    print(f"{'operação':36} {'tamanho':>8} {'vias':>8} {'mediana (ms)':>14}")
+    for resultado in resultados:
+        print(
+            f"{resultado['operacao']:36} {resultado['tamanho']:8} "
+            f"{resultado['vias']:8} {resultado['mediana'] * 1000:14.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
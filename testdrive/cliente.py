@@ -0,0 +1,224 @@
+import asyncio
+import os
+import random
+import sys
+import tempfile
+from argparse import ArgumentParser, Namespace
+from json import dumps, loads
+from time import perf_counter
+from typing import List, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interface.servidor import LIMITE_LINHA, Servidor
+from testdrive.gerador import CENTRO, gerar_sistema
+
+
+def gerar_pedidos(
+    pontos: List[str], n: int, populares: int, semente: int
+) -> List[dict]:
+    """
+    Gera uma mistura de pedidos, em que os itinerários e as sugestões se
+    concentram num pequeno número de origens e destinos populares, como
+    acontece com quiosques no mesmo local
+
+    :param pontos: designações dos pontos de interesse
+    :type pontos: List[str]
+    :param n: número de pedidos
+    :type n: int
+    :param populares: número de pontos populares
+    :type populares: int
+    :param semente: semente do gerador aleatório
+    :type semente: int
+    :return: pedidos
+    :rtype: List[dict]
+    """
+    aleatorio: random.Random = random.Random(semente)
+    destinos: List[str] = random.Random(0).sample(pontos, populares)
+    pedidos: List[dict] = []
+    for i in range(n):
+        escolha: float = aleatorio.random()
+        if escolha < 0.5:
+            pedido: dict = {
+                "op": "itinerario",
+                "inicio": aleatorio.choice(destinos),
+                "fim": aleatorio.choice(destinos),
+            }
+        elif escolha < 0.8:
+            pedido = {
+                "op": "sugestoes",
+                "x": CENTRO[0] + destinos.index(aleatorio.choice(destinos)) * 0.001,
+                "y": CENTRO[1],
+            }
+        elif escolha < 0.95:
+            pedido = {"op": "pesquisar", "categoria": "cultura", "limite": 20}
+        else:
+            pedido = {"op": "pontos_criticos", "metrica": "grau_externo"}
+        pedido["id"] = i
+        pedidos.append(pedido)
+    return pedidos
+
+
+async def ligar(
+    endereco: str,
+) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Abre uma ligação ao servidor
+
+    :param endereco: "anfitrião:porta" para TCP, ou caminho de um socket Unix
+    :type endereco: str
+    :return: leitor das respostas e escritor dos pedidos
+    :rtype: Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+    """
+    anfitriao, separador, porta = endereco.rpartition(":")
+    if separador and porta.isdigit():
+        return await asyncio.open_connection(
+            anfitriao or "127.0.0.1", int(porta), limit=LIMITE_LINHA
+        )
+    return await asyncio.open_unix_connection(endereco, limit=LIMITE_LINHA)
+
+
+async def obter_pontos(endereco: str) -> List[str]:
+    """
+    Pede ao servidor as designações de todos os pontos de interesse
+
+    :param endereco: "anfitrião:porta" para TCP, ou caminho de um socket Unix
+    :type endereco: str
+    :return: designações dos pontos de interesse
+    :rtype: List[str]
+    """
+    leitor, escritor = await ligar(endereco)
+    pontos: List[str] = []
+    for categoria in ("natureza", "cultura", "gastronomia"):
+        escritor.write(
+            (dumps({"op": "pesquisar", "categoria": categoria}) + "\n").encode()
+        )
+        await escritor.drain()
+        resposta: dict = loads(await leitor.readline())
+        pontos.extend(p["designacao"] for p in resposta["resultado"])
+    escritor.close()
+    await escritor.wait_closed()
+    return pontos
+
+
+async def cliente(endereco: str, pedidos: List[dict], latencias: List[float]) -> int:
+    """
+    Envia pedidos por uma ligação, um de cada vez, registando a latência
+
+    :param endereco: "anfitrião:porta" para TCP, ou caminho de um socket Unix
+    :type endereco: str
+    :param pedidos: pedidos a enviar
+    :type pedidos: List[dict]
+    :param latencias: lista onde são acrescentadas as latências (s)
+    :type latencias: List[float]
+    :return: número de respostas com erro
+    :rtype: int
+    """
+    leitor, escritor = await ligar(endereco)
+    erros: int = 0
+    for pedido in pedidos:
+        inicio: float = perf_counter()
+        escritor.write((dumps(pedido) + "\n").encode())
+        await escritor.drain()
+        resposta: dict = loads(await leitor.readline())
+        latencias.append(perf_counter() - inicio)
+        if not resposta["ok"] or resposta.get("id") != pedido["id"]:
+            erros += 1
+    escritor.close()
+    await escritor.wait_closed()
+    return erros
+
+
+async def carga(endereco: str, clientes: int, pedidos: int, populares: int) -> None:
+    """
+    Executa vários clientes em simultâneo e apresenta o débito e as latências
+
+    :param endereco: "anfitrião:porta" para TCP, ou caminho de um socket Unix
+    :type endereco: str
+    :param clientes: número de ligações simultâneas
+    :type clientes: int
+    :param pedidos: número de pedidos por cliente
+    :type pedidos: int
+    :param populares: número de pontos populares
+    :type populares: int
+    """
+    pontos: List[str] = await obter_pontos(endereco)
+    populares = min(populares, len(pontos))
+    latencias: List[float] = []
+    inicio: float = perf_counter()
+    erros: List[int] = await asyncio.gather(
+        *(
+            cliente(endereco, gerar_pedidos(pontos, pedidos, populares, i), latencias)
+            for i in range(clientes)
+        )
+    )
+    duracao: float = perf_counter() - inicio
+    latencias.sort()
+    print(
+        f"{clientes} clientes, {len(latencias)} pedidos em {duracao:.2f} s "
+        f"({len(latencias) / duracao:.0f} pedidos/s), {sum(erros)} erros"
+    )
+    for p in (50, 90, 99):
+        print(f"p{p}: {latencias[int(p / 100 * (len(latencias) - 1))] * 1000:.1f} ms")
+    print(f"máximo: {latencias[-1] * 1000:.1f} ms")
+
+
+async def main_async(args: Namespace) -> None:
+    """
+    Gera a carga sobre um servidor já em execução ou, se não for indicado
+    nenhum endereço, sobre um servidor iniciado neste processo com um
+    sistema gerado
+
+    :param args: argumentos da linha de comandos
+    :type args: Namespace
+    """
+    if args.endereco is not None:
+        await carga(args.endereco, args.clientes, args.pedidos, args.populares)
+        return
+    servidor: Servidor = Servidor(
+        gerar_sistema(args.pontos, semente=1), args.threads, not args.sem_agrupar
+    )
+    with tempfile.TemporaryDirectory() as pasta:
+        endereco: str = os.path.join(pasta, "servidor.sock")
+        servidor_asyncio: asyncio.AbstractServer = await servidor.iniciar(endereco)
+        try:
+            await carga(endereco, args.clientes, args.pedidos, args.populares)
+        finally:
+            servidor_asyncio.close()
+            servidor.fechar()
+    print(
+        f"servidor: {servidor.pedidos} pedidos, {servidor.agrupados} "
+        "respondidos com o resultado de um pedido igual em curso"
+    )
+
+
+def main() -> None:
+    """Interpreta os argumentos e gera a carga"""
+    parser: ArgumentParser = ArgumentParser(
+        description="Gerador de carga para o servidor do sistema turístico"
+    )
+    parser.add_argument(
+        "--endereco",
+        help="anfitrião:porta ou socket Unix de um servidor iniciado com "
+        "main.py --servidor; por omissão é iniciado neste processo um "
+        "servidor com um sistema gerado",
+    )
+    parser.add_argument(
+        "--pontos",
+        type=int,
+        default=2000,
+        help="número de pontos de interesse do sistema gerado",
+    )
+    parser.add_argument("--clientes", type=int, default=50)
+    parser.add_argument("--pedidos", type=int, default=40)
+    parser.add_argument("--populares", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument(
+        "--sem-agrupar",
+        action="store_true",
+        help="desativa o agrupamento de pedidos iguais no servidor gerado",
+    )
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import os
+import random
+import sys
+import threading
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Callable, List
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from sistema.concorrencia import SistemaConcorrente
+from sistema.ponto_interesse import PontoInteresse
+from sistema.Ponto2D import Ponto2D
+from testdrive.gerador import CENTRO, gerar_sistema
+
+
+def leituras(sc: SistemaConcorrente, pontos: List[str], n: int, semente: int) -> None:
+    """
+    Executa uma mistura de consultas ao sistema partilhado
+
+    :param sc: sistema partilhado
+    :type sc: SistemaConcorrente
+    :param pontos: designações dos pontos de interesse
+    :type pontos: List[str]
+    :param n: número de consultas
+    :type n: int
+    :param semente: semente do gerador aleatório
+    :type semente: int
+    """
+    aleatorio: random.Random = random.Random(semente)
+    for i in range(n):
+        escolha: int = i % 4
+        if escolha == 0:
+            sc.obter_ponto(aleatorio.choice(pontos))
+        elif escolha == 1:
+            list(sc.iterar_categoria("cultura", 0, 20))
+        elif escolha == 2:
+            sc.pontos_proximos(
+                CENTRO[0] + aleatorio.uniform(-0.05, 0.05),
+                CENTRO[1] + aleatorio.uniform(-0.05, 0.05),
+            )
+        else:
+            sc.itinerario(aleatorio.choice(pontos), aleatorio.choice(pontos), False)
+
+
+def escritas(sc: SistemaConcorrente, pontos: List[str], parar: threading.Event) -> int:
+    """
+    Altera o sistema partilhado até ser pedido para parar, adicionando,
+    avaliando e removendo pontos de interesse
+
+    :param sc: sistema partilhado
+    :type sc: SistemaConcorrente
+    :param pontos: designações dos pontos de interesse
+    :type pontos: List[str]
+    :param parar: evento que termina as alterações
+    :type parar: threading.Event
+    :return: número de alterações feitas
+    :rtype: int
+    """
+    aleatorio: random.Random = random.Random(0)
+    n: int = 0
+    while not parar.is_set():
+        designacao: str = f"Ponto temporário {n}"
+        sc.adicionar_ponto(
+            PontoInteresse(
+                designacao,
+                "Rua Direita",
+                Ponto2D(CENTRO[0], CENTRO[1]),
+                "cultura",
+                "",
+                "",
+            )
+        )
+        sc.avaliar_ponto(
+            aleatorio.randint(1, 4), sc.obter_ponto(aleatorio.choice(pontos))
+        )
+        sc.remover_ponto(designacao)
+        n += 3
+    return n
+
+
+def medir(
+    sc: SistemaConcorrente,
+    pontos: List[str],
+    threads: int,
+    consultas: int,
+    com_escritor: bool,
+) -> float:
+    """
+    Mede o débito de consultas com várias threads de leitura
+
+    :param sc: sistema partilhado
+    :type sc: SistemaConcorrente
+    :param pontos: designações dos pontos de interesse
+    :type pontos: List[str]
+    :param threads: número de threads de leitura
+    :type threads: int
+    :param consultas: número total de consultas, repartidas pelas threads
+    :type consultas: int
+    :param com_escritor: se True, uma thread altera o sistema em simultâneo
+    :type com_escritor: bool
+    :return: consultas por segundo
+    :rtype: float
+    """
+    parar: threading.Event = threading.Event()
+    with ThreadPoolExecutor(threads + 1) as executor:
+        escritor = (
+            executor.submit(escritas, sc, pontos, parar) if com_escritor else None
+        )
+        inicio: float = perf_counter()
+        tarefas = [
+            executor.submit(leituras, sc, pontos, consultas // threads, i)
+            for i in range(threads)
+        ]
+        for tarefa in tarefas:
+            tarefa.result()
+        duracao: float = perf_counter() - inicio
+        parar.set()
+        if escritor is not None:
+            escritor.result()
+    return consultas / duracao
+
+
+def verificar(sc: SistemaConcorrente) -> None:
+    """
+    Verifica que os índices do sistema continuam coerentes
+
+    :param sc: sistema partilhado
+    :type sc: SistemaConcorrente
+    """
+    with sc.leitura():
+        st = sc.sistema
+        assert len(st._pontos) == len(st._indice)
+        assert sum(len(c) for c in st._indice_categorias.values()) == len(st._pontos)
+        assert len(st._grelha) == len(st._pontos)
+
+
+def main() -> None:
+    """Mede o débito de consultas para vários números de threads"""
+    parser: ArgumentParser = ArgumentParser(
+        description="Débito de consultas a um sistema partilhado por várias threads"
+    )
+    parser.add_argument("--pontos", type=int, default=2000)
+    parser.add_argument("--consultas", type=int, default=4000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args: Namespace = parser.parse_args()
+    sc: SistemaConcorrente = SistemaConcorrente(gerar_sistema(args.pontos, semente=1))
+    with sc.leitura():
+        pontos: List[str] = [p._designacao for p in sc.sistema._pontos]
+    leituras(sc, pontos, args.consultas // 4, 0)
+    gil: Callable[[], bool] = getattr(sys, "_is_gil_enabled", lambda: True)
+    print(f"GIL ativo: {gil()}, CPUs: {os.cpu_count()}")
+    print(f"{'threads':>8} {'consultas/s':>14} {'com escritor':>14}")
+    for threads in args.threads:
+        sem: float = medir(sc, pontos, threads, args.consultas, False)
+        com: float = medir(sc, pontos, threads, args.consultas, True)
+        print(f"{threads:8} {sem:14.0f} {com:14.0f}")
+    verificar(sc)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interface import input_output
+
+
+@pytest.fixture
+def pasta_dados(tmp_path, monkeypatch):
+    """Usa uma pasta temporária para os ficheiros de dados do sistema"""
+    monkeypatch.setattr(input_output, "PASTA_DADOS", str(tmp_path))
+    return tmp_path
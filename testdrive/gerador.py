@@ -0,0 +1,137 @@
+import math
+import os
+import random
+import sys
+from typing import List
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from sistema.sistema_turistico import SistemaTuristico
+from sistema.ponto_interesse import PontoInteresse
+from sistema.via_circulacao import ViaCirculacao
+from sistema.Ponto2D import Ponto2D
+from sistema.distancias import distancia_terra
+
+CENTRO: tuple = (38.6547, -27.2167)
+"""coordenadas do centro de Angra do Heroísmo"""
+
+RAIO: float = 15000
+"""distância máxima (m) dos pontos gerados ao centro"""
+
+TIPOS: dict[str, tuple] = {
+    "natureza": ("Miradouro", "Jardim", "Gruta", "Praia", "Trilho", "Lagoa"),
+    "cultura": ("Museu", "Igreja", "Forte", "Império", "Solar", "Ermida"),
+    "gastronomia": ("Restaurante", "Tasca", "Pastelaria", "Adega", "Café"),
+}
+
+LUGARES: tuple = (
+    "da Sé",
+    "de São Mateus",
+    "de São Bento",
+    "da Serreta",
+    "do Porto Judeu",
+    "da Terra Chã",
+    "das Cinco Ribeiras",
+    "do Monte Brasil",
+    "da Feteira",
+    "de Santa Bárbara",
+    "dos Altares",
+    "da Ribeirinha",
+)
+
+
+def gerar_pontos(n: int, semente: int = 0) -> List[PontoInteresse]:
+    """
+    Gera pontos de interesse em coordenadas aleatórias à volta de
+    Angra do Heroísmo, com avaliações e visitas aleatórias
+
+    :param n: número de pontos de interesse
+    :type n: int
+    :param semente: semente do gerador aleatório
+    :type semente: int
+    :return: pontos de interesse com designações únicas
+    :rtype: List[PontoInteresse]
+    """
+    aleatorio: random.Random = random.Random(semente)
+    pontos: List[PontoInteresse] = []
+    for i in range(n):
+        categoria: str = aleatorio.choice(tuple(TIPOS))
+        distancia: float = RAIO * math.sqrt(aleatorio.random())
+        angulo: float = aleatorio.uniform(0, 2 * math.pi)
+        lat: float = CENTRO[0] + math.degrees(distancia * math.cos(angulo) / 6371000)
+        lon: float = CENTRO[1] + math.degrees(
+            distancia * math.sin(angulo) / (6371000 * math.cos(math.radians(lat)))
+        )
+        ponto_interesse: PontoInteresse = PontoInteresse(
+            f"{aleatorio.choice(TIPOS[categoria])} {aleatorio.choice(LUGARES)} {i}",
+            f"Rua {aleatorio.randint(1, 200)}",
+            Ponto2D(lat, lon),
+            categoria,
+            "Estacionamento, via pedonal",
+            "Visitas",
+        )
+        for _ in range(aleatorio.randint(0, 10)):
+            avaliacao: int = aleatorio.randint(1, 4)
+            ponto_interesse._contagem_avaliacoes += 1
+            ponto_interesse._soma_avaliacoes += avaliacao
+            ponto_interesse._histograma[avaliacao - 1] += 1
+            ponto_interesse._visitas += 1
+        pontos.append(ponto_interesse)
+    return pontos
+
+
+def gerar_sistema(
+    n: int, densidade: float = 3.0, semente: int = 0, vizinhanca: int = 20
+) -> SistemaTuristico:
+    """
+    Gera um sistema com n pontos de interesse e uma rede de circulação
+    entre eles. Os pontos são ordenados pela longitude e cada um é ligado
+    a pontos escolhidos ao acaso entre os seguintes nessa ordem, de modo
+    que as vias ligam sobretudo pontos próximos
+
+    :param n: número de pontos de interesse
+    :type n: int
+    :param densidade: número médio de vias que partem de cada ponto
+    :type densidade: float
+    :param semente: semente do gerador aleatório
+    :type semente: int
+    :param vizinhanca: número de pontos seguintes entre os quais
+    são escolhidos os destinos das vias
+    :type vizinhanca: int
+    :return: sistema gerado
+    :rtype: SistemaTuristico
+    """
+    aleatorio: random.Random = random.Random(semente + 1)
+    st: SistemaTuristico = SistemaTuristico()
+    pontos: List[PontoInteresse] = gerar_pontos(n, semente)
+    for ponto_interesse in pontos:
+        st.adicionar_ponto(ponto_interesse)
+        st.acrescentar_vertice(ponto_interesse._designacao)
+    pontos.sort(key=lambda p: p._coordenadas._y)
+    for i, ponto_interesse in enumerate(pontos):
+        seguintes: List[PontoInteresse] = pontos[i + 1 : i + 1 + vizinhanca]
+        vias: int = min(len(seguintes), int(densidade + aleatorio.random()))
+        for outro in aleatorio.sample(seguintes, vias):
+            inicio, fim = ponto_interesse, outro
+            if aleatorio.random() < 0.5:
+                inicio, fim = outro, ponto_interesse
+            distancia: float = (
+                1.3
+                * distancia_terra(
+                    inicio._coordenadas._x,
+                    inicio._coordenadas._y,
+                    fim._coordenadas._x,
+                    fim._coordenadas._y,
+                )
+                / 1000
+            )
+            velocidade_minima: float = aleatorio.choice((20, 30, 40))
+            st.acrescentar_aresta(
+                ViaCirculacao(
+                    inicio._designacao,
+                    fim._designacao,
+                    round(distancia, 3),
+                    velocidade_minima,
+                    velocidade_minima + aleatorio.choice((20, 30, 50)),
+                )
+            )
+    return st
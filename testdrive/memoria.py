@@ -0,0 +1,110 @@
+import os
+import sys
+import tracemalloc
+from typing import Callable, List
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from sistema.LinkedList import DoubleNode
+from sistema.Ponto2D import Ponto2D
+from sistema.ponto_interesse import PontoInteresse
+from sistema.via_circulacao import ViaCirculacao
+
+
+def sem_slots(classe: type) -> type:
+    """
+    Cria uma cópia de uma classe com os mesmos métodos, mas sem __slots__,
+    em que os atributos de cada objeto ficam num __dict__
+
+    :param classe: classe com __slots__
+    :type classe: type
+    :return: classe equivalente sem __slots__
+    :rtype: type
+    """
+    atributos: dict = {
+        nome: valor
+        for nome, valor in vars(classe).items()
+        if nome != "__slots__" and nome not in classe.__slots__
+    }
+    return type(classe.__name__, (object,), atributos)
+
+
+def bytes_por_objeto(criar: Callable[[int], object], n: int) -> float:
+    """
+    Mede a memória alocada por cada objeto criado
+
+    :param criar: função que cria o objeto número i
+    :type criar: Callable[[int], object]
+    :param n: número de objetos a criar
+    :type n: int
+    :return: bytes por objeto
+    :rtype: float
+    """
+    tracemalloc.start()
+    inicio: int = tracemalloc.get_traced_memory()[0]
+    objetos: List[object] = [criar(i) for i in range(n)]
+    fim: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objetos
+    return (fim - inicio) / n
+
+
+def medir(ponto: type, ponto2d: type, via: type, no: type, n: int) -> dict:
+    """
+    Mede os bytes por ponto de interesse, por via e por nó da lista ligada.
+    Os textos são partilhados por todos os objetos, para medir apenas
+    o custo dos próprios objetos
+
+    :param ponto: classe dos pontos de interesse
+    :type ponto: type
+    :param ponto2d: classe das coordenadas
+    :type ponto2d: type
+    :param via: classe das vias
+    :type via: type
+    :param no: classe dos nós da lista ligada
+    :type no: type
+    :param n: número de objetos de cada tipo
+    :type n: int
+    :return: bytes por objeto de cada tipo
+    :rtype: dict
+    """
+    return {
+        "ponto de interesse": bytes_por_objeto(
+            lambda i: ponto(
+                "designação",
+                "morada",
+                ponto2d(38.65 + i * 1e-7, -27.22),
+                "cultura",
+                "acessibilidade",
+                "atividades",
+            ),
+            n,
+        ),
+        "via": bytes_por_objeto(
+            lambda i: via("inicio", "fim", 1.0 + i * 1e-7, 30.0, 50.0), n
+        ),
+        "nó da lista": bytes_por_objeto(lambda i: no(None), n),
+    }
+
+
+def main(n: int = 100000) -> None:
+    """
+    Compara a memória usada pelos objetos com e sem __slots__
+
+    :param n: número de objetos de cada tipo
+    :type n: int
+    """
+    antes: dict = medir(
+        sem_slots(PontoInteresse),
+        sem_slots(Ponto2D),
+        sem_slots(ViaCirculacao),
+        sem_slots(DoubleNode),
+        n,
+    )
+    depois: dict = medir(PontoInteresse, Ponto2D, ViaCirculacao, DoubleNode, n)
+    print(f"{'objeto':20} {'__dict__':>10} {'__slots__':>10}")
+    for nome in antes:
+        print(f"{nome:20} {antes[nome]:10.1f} {depois[nome]:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import os
+import sys
+from json import loads
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interface.avaliacoes import importar_avaliacoes, ler_eventos, validar_avaliacao
+from interface.input_output import (
+    DIARIO,
+    caminho_ficheiro,
+    carregar_sistema_turistico,
+    gravar_sistema_turistico,
+)
+from sistema.sistema_turistico import SistemaTuristico
+from testdrive.gerador import gerar_sistema
+
+
+def agregados(st: SistemaTuristico) -> dict:
+    """
+    Obtém os agregados das avaliações de todos os pontos de interesse
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :return: contagem, soma, histograma e visitas, por designação
+    :rtype: dict
+    """
+    return {
+        p._designacao: (
+            p._contagem_avaliacoes,
+            p._soma_avaliacoes,
+            list(p._histograma),
+            p._visitas,
+        )
+        for p in st._pontos
+    }
+
+
+def registos_diario() -> list:
+    """
+    Lê os registos do diário, sem a linha da geração
+
+    :return: registos do diário
+    :rtype: list
+    """
+    with open(caminho_ficheiro(DIARIO), "r", encoding="UTF-8") as f:
+        return [loads(linha) for linha in f.readlines()[1:]]
+
+
+def test_ler_eventos_csv() -> None:
+    """O cabeçalho, as linhas vazias e as aspas do CSV são tratados"""
+    linhas: list = [
+        "designacao,avaliacao",
+        "Museu de Angra,4",
+        "",
+        '"Forte, São Sebastião", 2 ',
+        "só um campo",
+        "designacao,avaliacao",
+    ]
+    assert list(ler_eventos(linhas)) == [
+        ("Museu de Angra", "4"),
+        ("Forte, São Sebastião", "2"),
+        ("só um campo", None),
+        ("designacao", "avaliacao"),
+    ]
+
+
+def test_ler_eventos_json() -> None:
+    """Cada linha em JSON é um objeto com a designação e a avaliação"""
+    linhas: list = [
+        '{"designacao": "Museu de Angra", "avaliacao": 3}',
+        '{"designacao": "Forte", "avaliacao": "1"}',
+        '{"designacao": "Sem avaliação"}',
+        '{"designacao": ',
+    ]
+    assert list(ler_eventos(linhas)) == [
+        ("Museu de Angra", 3),
+        ("Forte", "1"),
+        ('{"designacao": "Sem avaliação"}', None),
+        ('{"designacao":', None),
+    ]
+
+
+@pytest.mark.parametrize("avaliacao", [0, 5, "7", "x", 2.5, True, None])
+def test_validar_avaliacao_invalida(avaliacao) -> None:
+    with pytest.raises((TypeError, ValueError)):
+        validar_avaliacao(avaliacao)
+
+
+def test_importar_avaliacoes(pasta_dados) -> None:
+    """Os eventos válidos dão um único registo no diário, que é repetido"""
+    st: SistemaTuristico = gerar_sistema(20, semente=3)
+    gravar_sistema_turistico(st)
+    antes: dict = agregados(st)
+    a, b = [p._designacao for p in st._pontos][:2]
+    eventos: list = [
+        (a, "4"),
+        (b, 1),
+        (a, 4),
+        ("Inexistente", 3),
+        (b, 9),
+        (a, None),
+        (b, "2"),
+    ]
+    aplicadas, erros = importar_avaliacoes(st, eventos)
+    assert aplicadas == 4
+    assert len(erros) == 3
+    assert "Inexistente" in erros[0]
+    depois: dict = agregados(st)
+    assert depois[a] == (
+        antes[a][0] + 2,
+        antes[a][1] + 8,
+        [antes[a][2][0], antes[a][2][1], antes[a][2][2], antes[a][2][3] + 2],
+        antes[a][3] + 2,
+    )
+    assert depois[b][:2] == (antes[b][0] + 2, antes[b][1] + 3)
+    assert {d: v for d, v in depois.items() if d not in (a, b)} == {
+        d: v for d, v in antes.items() if d not in (a, b)
+    }
+    assert registos_diario() == [
+        {
+            "op": "avaliar_pontos",
+            "contagens": {a: [0, 0, 0, 2], b: [1, 1, 0, 0]},
+        }
+    ]
+    carregado: SistemaTuristico = SistemaTuristico()
+    carregar_sistema_turistico(carregado)
+    assert agregados(carregado) == depois
+
+
+def test_importar_avaliacoes_sem_eventos_validos(pasta_dados) -> None:
+    """Sem avaliações válidas nada é alterado nem registado"""
+    st: SistemaTuristico = gerar_sistema(5, semente=4)
+    gravar_sistema_turistico(st)
+    antes: dict = agregados(st)
+    assert importar_avaliacoes(st, [("Inexistente", 2), ("x", 0)])[0] == 0
+    assert agregados(st) == antes
+    assert registos_diario() == []
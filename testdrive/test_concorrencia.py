@@ -0,0 +1,102 @@
+import os
+import sys
+import threading
+import time
+from typing import List
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from sistema.concorrencia import SistemaConcorrente, TrancaLeituraEscrita
+from testdrive.gerador import gerar_sistema
+
+
+def test_leitura_encaixada_com_escritor_a_espera() -> None:
+    """Um leitor volta a entrar mesmo com um escritor à espera"""
+    tranca: TrancaLeituraEscrita = TrancaLeituraEscrita()
+    ordem: List[str] = []
+    escritor_a_espera: threading.Event = threading.Event()
+
+    def leitor() -> None:
+        with tranca.leitura():
+            escritor_a_espera.wait(5)
+            time.sleep(0.05)
+            with tranca.leitura():
+                ordem.append("leitura encaixada")
+
+    def escritor() -> None:
+        escritor_a_espera.set()
+        with tranca.escrita():
+            ordem.append("escrita")
+
+    threads: List[threading.Thread] = [
+        threading.Thread(target=leitor, daemon=True),
+        threading.Thread(target=escritor, daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert not any(thread.is_alive() for thread in threads)
+    assert ordem == ["leitura encaixada", "escrita"]
+    assert tranca._leitores == {} and tranca._escritor is None
+
+
+def test_escritor_reentrante() -> None:
+    """O escritor pode voltar a adquirir a tranca para leitura ou escrita"""
+    tranca: TrancaLeituraEscrita = TrancaLeituraEscrita()
+    with tranca.escrita():
+        with tranca.leitura():
+            with tranca.escrita():
+                pass
+    assert tranca._escritor is None and tranca._profundidade == 0
+
+
+def test_leitor_nao_pode_escrever() -> None:
+    """Adquirir a escrita com a leitura adquirida falha em vez de bloquear"""
+    tranca: TrancaLeituraEscrita = TrancaLeituraEscrita()
+    with tranca.leitura():
+        with pytest.raises(RuntimeError):
+            tranca.adquirir_escrita()
+    with tranca.escrita():
+        pass
+
+
+def test_consultas_em_simultaneo_com_alteracoes() -> None:
+    """Consultas e alterações em várias threads dão os resultados de uma só"""
+    sc: SistemaConcorrente = SistemaConcorrente(gerar_sistema(200, semente=1))
+    with sc.leitura():
+        pares = list(sc.sistema._rede)[:10]
+        esperados = [sc.sistema.itinerario(a, b) for a, b in pares]
+    intervalo: float = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    erros: List[BaseException] = []
+    parar: threading.Event = threading.Event()
+
+    def consultar() -> None:
+        try:
+            for _ in range(30):
+                assert [sc.itinerario(a, b) for a, b in pares] == esperados
+        except BaseException as erro:
+            erros.append(erro)
+
+    def invalidar() -> None:
+        while not parar.is_set():
+            with sc.escrita():
+                sc.sistema._grafo.invalidar_caches()
+
+    try:
+        escritor: threading.Thread = threading.Thread(target=invalidar)
+        escritor.start()
+        leitores: List[threading.Thread] = [
+            threading.Thread(target=consultar) for _ in range(4)
+        ]
+        for thread in leitores:
+            thread.start()
+        for thread in leitores:
+            thread.join()
+        parar.set()
+        escritor.join()
+    finally:
+        sys.setswitchinterval(intervalo)
+    assert erros == []
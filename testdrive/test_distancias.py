@@ -0,0 +1,95 @@
+import math
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from sistema import distancias
+from sistema.distancias import (
+    distancia_terra,
+    distancias_terra,
+    indices_no_raio,
+    matriz_distancias_terra,
+)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def modo(request, monkeypatch) -> str:
+    """Corre cada teste com os cálculos vetoriais e sem o NumPy"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(distancias, "_numpy_procurado", False)
+    else:
+        monkeypatch.setattr(distancias, "_numpy", None)
+        monkeypatch.setattr(distancias, "_numpy_procurado", True)
+    return request.param
+
+
+def coordenadas(n: int, semente: int) -> tuple:
+    """
+    Gera coordenadas aleatórias em todo o globo, incluindo os polos
+    e pontos dos dois lados do antimeridiano
+
+    :param n: número de coordenadas aleatórias
+    :type n: int
+    :param semente: semente do gerador aleatório
+    :type semente: int
+    :return: latitudes e longitudes
+    :rtype: tuple
+    """
+    aleatorio: random.Random = random.Random(semente)
+    lats: list = [90.0, -90.0, 0.0, 0.0, 38.65, 38.65]
+    lons: list = [0.0, 45.0, 180.0, -179.999, -27.21, -27.2101]
+    for _ in range(n):
+        lats.append(aleatorio.uniform(-90, 90))
+        lons.append(aleatorio.uniform(-180, 180))
+    return lats, lons
+
+
+@pytest.mark.parametrize("origem", [(38.65, -27.21), (90.0, 0.0), (0.0, 179.99)])
+def test_distancias_terra_igual_ao_escalar(modo: str, origem: tuple) -> None:
+    lats, lons = coordenadas(200, 1)
+    obtidas: list = list(distancias_terra(origem[0], origem[1], lats, lons))
+    esperadas: list = [
+        distancia_terra(origem[0], origem[1], la, lo) for la, lo in zip(lats, lons)
+    ]
+    assert len(obtidas) == len(esperadas)
+    for obtida, esperada in zip(obtidas, esperadas):
+        assert math.isclose(obtida, esperada, rel_tol=1e-9, abs_tol=1e-6)
+
+
+@pytest.mark.parametrize("raio", [0, 1000, 5000000, 30000000])
+def test_indices_no_raio_igual_ao_escalar(modo: str, raio: float) -> None:
+    lats, lons = coordenadas(500, 2)
+    obtidos: list = indices_no_raio(38.65, -27.21, lats, lons, raio)
+    esperados: list = [
+        i
+        for i, (la, lo) in enumerate(zip(lats, lons))
+        if distancia_terra(38.65, -27.21, la, lo) <= raio
+    ]
+    assert obtidos == esperados
+
+
+def test_sem_pontos(modo: str) -> None:
+    assert list(distancias_terra(0.0, 0.0, [], [])) == []
+    assert indices_no_raio(0.0, 0.0, [], [], 1000) == []
+
+
+def test_matriz_distancias_terra_igual_ao_escalar(modo: str) -> None:
+    lats1, lons1 = coordenadas(20, 3)
+    lats2, lons2 = coordenadas(30, 4)
+    matriz = matriz_distancias_terra(lats1, lons1, lats2, lons2)
+    assert len(matriz) == len(lats1)
+    for i, (la1, lo1) in enumerate(zip(lats1, lons1)):
+        linha: list = list(matriz[i])
+        assert len(linha) == len(lats2)
+        for j, (la2, lo2) in enumerate(zip(lats2, lons2)):
+            esperada: float = distancia_terra(la1, lo1, la2, lo2)
+            assert math.isclose(linha[j], esperada, rel_tol=1e-9, abs_tol=1e-6)
+
+
+def test_matriz_sem_pontos(modo: str) -> None:
+    assert len(matriz_distancias_terra([], [], [1.0], [2.0])) == 0
+    assert [list(l) for l in matriz_distancias_terra([1.0], [2.0], [], [])] == [[]]
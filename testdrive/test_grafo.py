@@ -0,0 +1,343 @@
+import math
+import os
+import random
+import sys
+from typing import List, Tuple
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from sistema.grafo import Graph
+
+
+def grafo_aleatorio(vertices: int, arestas: int, semente: int) -> Graph:
+    """
+    Gera um grafo dirigido com pesos inteiros entre 1 e 5
+
+    :param vertices: número de vértices
+    :type vertices: int
+    :param arestas: número de arestas a tentar acrescentar
+    :type arestas: int
+    :param semente: semente do gerador aleatório
+    :type semente: int
+    :return: grafo gerado
+    :rtype: Graph
+    """
+    aleatorio: random.Random = random.Random(semente)
+    grafo: Graph = Graph()
+    nomes: List[str] = [f"v{i}" for i in range(vertices)]
+    for nome in nomes:
+        grafo.add_vertex(nome)
+    for _ in range(arestas):
+        inicio, fim = aleatorio.sample(nomes, 2)
+        grafo.add_edges(inicio, fim, aleatorio.randint(1, 5))
+    return grafo
+
+
+def caminhos_simples(
+    grafo: Graph, inicio: str, fim: str
+) -> List[Tuple[float, List[str]]]:
+    """
+    Enumera por força bruta todos os caminhos sem ciclos entre dois vértices
+
+    :param grafo: grafo a percorrer
+    :type grafo: Graph
+    :param inicio: vértice inicial
+    :type inicio: str
+    :param fim: vértice final
+    :type fim: str
+    :return: distância e caminho de cada caminho, por ordem crescente da distância
+    :rtype: List[Tuple[float, List[str]]]
+    """
+    caminhos: List[Tuple[float, List[str]]] = []
+
+    def visitar(caminho: List[str], distancia: float) -> None:
+        if caminho[-1] == fim:
+            caminhos.append((distancia, list(caminho)))
+            return
+        for seguinte, peso in grafo._vertices[caminho[-1]].items():
+            if seguinte not in caminho:
+                caminho.append(seguinte)
+                visitar(caminho, distancia + peso)
+                caminho.pop()
+
+    visitar([inicio], 0.0)
+    caminhos.sort(key=lambda c: c[0])
+    return caminhos
+
+
+@pytest.mark.parametrize("semente", range(8))
+def test_yen_enumera_todos_os_caminhos_por_ordem(semente: int) -> None:
+    """Sem k, os caminhos de Yen são todos os caminhos simples, por ordem"""
+    grafo: Graph = grafo_aleatorio(8, 40, semente)
+    for inicio, fim in (("v0", "v7"), ("v3", "v1"), ("v5", "v2")):
+        esperados = caminhos_simples(grafo, inicio, fim)
+        obtidos = list(grafo.caminhos_mais_curtos(inicio, fim))
+        assert [d for d, _ in obtidos] == [d for d, _ in esperados]
+        assert sorted(map(tuple, (c for _, c in obtidos))) == sorted(
+            map(tuple, (c for _, c in esperados))
+        )
+        for distancia, caminho in obtidos:
+            assert distancia == sum(
+                grafo.get_weight(a, b) for a, b in zip(caminho, caminho[1:])
+            )
+
+
+def test_yen_respeita_k() -> None:
+    """Com k, são gerados só os k caminhos mais curtos"""
+    grafo: Graph = grafo_aleatorio(8, 40, 3)
+    esperados = caminhos_simples(grafo, "v0", "v7")
+    for k in (0, 1, 3, len(esperados) + 2):
+        obtidos = list(grafo.caminhos_mais_curtos("v0", "v7", k))
+        assert [d for d, _ in obtidos] == [d for d, _ in esperados[:k]]
+
+
+def test_yen_sem_caminho() -> None:
+    """Entre vértices desligados ou inexistentes não há caminhos"""
+    grafo: Graph = Graph()
+    for nome in ("a", "b", "c"):
+        grafo.add_vertex(nome)
+    grafo.add_edges("a", "b", 1)
+    assert list(grafo.caminhos_mais_curtos("a", "c")) == []
+    assert list(grafo.caminhos_mais_curtos("b", "a")) == []
+    assert list(grafo.caminhos_mais_curtos("a", "z")) == []
+    assert list(grafo.caminhos_mais_curtos("a", "b")) == [(1, ["a", "b"])]
+
+
+def distancias_floyd(grafo: Graph) -> dict[str, dict[str, float]]:
+    """
+    Calcula a distância mais curta entre todos os pares de vértices
+    (algoritmo de Floyd-Warshall)
+
+    :param grafo: grafo a percorrer
+    :type grafo: Graph
+    :return: distância de cada vértice a cada vértice, inf se não o alcançar
+    :rtype: dict[str, dict[str, float]]
+    """
+    vertices: List[str] = sorted(grafo._vertices)
+    distancias: dict[str, dict[str, float]] = {
+        u: {v: 0.0 if u == v else grafo._vertices[u].get(v, math.inf) for v in vertices}
+        for u in vertices
+    }
+    for w in vertices:
+        for u in vertices:
+            for v in vertices:
+                if distancias[u][w] + distancias[w][v] < distancias[u][v]:
+                    distancias[u][v] = distancias[u][w] + distancias[w][v]
+    return distancias
+
+
+def test_proximidade_exemplo() -> None:
+    """Proximidade num caminho a -> b -> c, calculada à mão"""
+    grafo: Graph = Graph()
+    for nome in ("a", "b", "c"):
+        grafo.add_vertex(nome)
+    grafo.add_edges("a", "b", 1)
+    grafo.add_edges("b", "c", 2)
+    assert grafo.proximidade() == pytest.approx({"a": 0.5, "b": 0.25, "c": 0.0})
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_proximidade_floyd(semente: int) -> None:
+    """A proximidade coincide com a calculada a partir de Floyd-Warshall"""
+    grafo: Graph = grafo_aleatorio(12, 30, semente)
+    n: int = len(grafo._vertices)
+    esperada: dict[str, float] = {}
+    for u, linha in distancias_floyd(grafo).items():
+        alcancaveis: List[float] = [
+            d for v, d in linha.items() if v != u and d != math.inf
+        ]
+        esperada[u] = (
+            (len(alcancaveis) / sum(alcancaveis)) * (len(alcancaveis) / (n - 1))
+            if alcancaveis
+            else 0.0
+        )
+    assert grafo.proximidade(processos=1) == pytest.approx(esperada)
+    assert grafo.proximidade(processos=2) == pytest.approx(esperada)
+
+
+def test_proximidade_apos_alteracao() -> None:
+    """A proximidade guardada é descartada quando o grafo muda"""
+    grafo: Graph = grafo_aleatorio(6, 10, 0)
+    antes: dict[str, float] = grafo.proximidade()
+    grafo.add_vertex("novo")
+    grafo.add_edges("novo", "v0", 1)
+    depois: dict[str, float] = grafo.proximidade()
+    assert set(depois) == set(antes) | {"novo"}
+    assert depois["novo"] > 0
+
+
+
+def test_proximidade_amostra() -> None:
+    """Uma amostra com todos os vértices é exata e a mesma semente repete"""
+    grafo: Graph = grafo_aleatorio(10, 30, 1)
+    exata: dict[str, float] = grafo.proximidade()
+    assert grafo.proximidade(amostra=10) == pytest.approx(exata)
+    assert grafo.proximidade(amostra=50) == pytest.approx(exata)
+    estimada: dict[str, float] = grafo.proximidade(amostra=4, semente=7)
+    assert set(estimada) == set(exata)
+    assert estimada == grafo.proximidade(amostra=4, semente=7)
+    assert estimada == pytest.approx(
+        grafo.proximidade(amostra=4, semente=7, processos=2)
+    )
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_proximidade_amostra_floyd(semente: int) -> None:
+    """A estimativa usa as distâncias de cada vértice aos pivôs sorteados"""
+    grafo: Graph = grafo_aleatorio(12, 30, semente)
+    nomes: List[str] = list(grafo._vertices)
+    pivos: List[str] = [
+        nomes[i] for i in random.Random(semente).sample(range(len(nomes)), 5)
+    ]
+    distancias: dict[str, dict[str, float]] = distancias_floyd(grafo)
+    esperada: dict[str, float] = {}
+    for u in nomes:
+        outros: List[str] = [p for p in pivos if p != u]
+        alcancaveis: List[float] = [
+            distancias[u][p] for p in outros if distancias[u][p] != math.inf
+        ]
+        esperada[u] = (
+            (len(alcancaveis) / sum(alcancaveis)) * (len(alcancaveis) / len(outros))
+            if alcancaveis
+            else 0.0
+        )
+    assert grafo.proximidade(amostra=5, semente=semente) == pytest.approx(esperada)
+
+
+@pytest.mark.parametrize("amostra", [0, -1])
+def test_proximidade_amostra_invalida(amostra: int) -> None:
+    """Uma amostra sem vértices é rejeitada"""
+    with pytest.raises(ValueError, match="pelo menos um vértice"):
+        grafo_aleatorio(5, 10, 0).proximidade(amostra=amostra)
+
+def intermediacao_forca_bruta(grafo: Graph) -> dict[str, float]:
+    """
+    Calcula a intermediação normalizada enumerando todos os caminhos
+    mais curtos entre cada par de vértices
+
+    :param grafo: grafo a percorrer
+    :type grafo: Graph
+    :return: intermediação de cada vértice
+    :rtype: dict[str, float]
+    """
+    n: int = len(grafo._vertices)
+    intermediacao: dict[str, float] = {v: 0.0 for v in grafo._vertices}
+    for s in grafo._vertices:
+        for t in grafo._vertices:
+            if s == t:
+                continue
+            caminhos = caminhos_simples(grafo, s, t)
+            if not caminhos:
+                continue
+            mais_curtos: List[List[str]] = [
+                c for d, c in caminhos if d == caminhos[0][0]
+            ]
+            for caminho in mais_curtos:
+                for v in caminho[1:-1]:
+                    intermediacao[v] += 1 / len(mais_curtos)
+    return {v: valor / ((n - 1) * (n - 2)) for v, valor in intermediacao.items()}
+
+
+def test_intermediacao_exemplo() -> None:
+    """Intermediação num caminho a -> b -> c, calculada à mão"""
+    grafo: Graph = Graph()
+    for nome in ("a", "b", "c"):
+        grafo.add_vertex(nome)
+    grafo.add_edges("a", "b", 1)
+    grafo.add_edges("b", "c", 2)
+    assert grafo.intermediacao() == pytest.approx({"a": 0.0, "b": 0.5, "c": 0.0})
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_intermediacao_forca_bruta(semente: int) -> None:
+    """Brandes coincide com a enumeração dos caminhos mais curtos"""
+    grafo: Graph = grafo_aleatorio(7, 25, semente)
+    esperada: dict[str, float] = intermediacao_forca_bruta(grafo)
+    assert grafo.intermediacao(processos=1) == pytest.approx(esperada)
+    assert grafo.intermediacao(processos=2) == pytest.approx(esperada)
+
+
+def test_intermediacao_amostra() -> None:
+    """Uma amostra com todos os vértices é exata e a mesma semente repete"""
+    grafo: Graph = grafo_aleatorio(10, 30, 1)
+    exata: dict[str, float] = grafo.intermediacao()
+    assert grafo.intermediacao(amostra=10) == pytest.approx(exata)
+    assert grafo.intermediacao(amostra=50) == pytest.approx(exata)
+    estimada: dict[str, float] = grafo.intermediacao(amostra=4, semente=7)
+    assert set(estimada) == set(exata)
+    assert estimada == grafo.intermediacao(amostra=4, semente=7)
+
+
+@pytest.mark.parametrize("amostra", [0, -1])
+def test_intermediacao_amostra_invalida(amostra: int) -> None:
+    """Uma amostra sem vértices é rejeitada"""
+    with pytest.raises(ValueError, match="pelo menos um vértice"):
+        grafo_aleatorio(5, 10, 0).intermediacao(amostra=amostra)
+
+
+def predecessores_por_varrimento(grafo: Graph) -> dict[str, dict[str, float]]:
+    """
+    Reconstrói os predecessores de cada vértice percorrendo as listas
+    de adjacência de saída
+
+    :param grafo: grafo a percorrer
+    :type grafo: Graph
+    :return: vértices que apontam para cada vértice e os pesos das arestas
+    :rtype: dict[str, dict[str, float]]
+    """
+    predecessores: dict[str, dict[str, float]] = {v: {} for v in grafo._vertices}
+    for v, adjacentes in grafo._vertices.items():
+        for adj, peso in adjacentes.items():
+            predecessores[adj][v] = peso
+    return predecessores
+
+
+def verificar_predecessores(grafo: Graph) -> None:
+    """
+    Compara o índice de predecessores e os graus internos com um
+    varrimento das listas de adjacência de saída
+
+    :param grafo: grafo a verificar
+    :type grafo: Graph
+    """
+    esperados: dict[str, dict[str, float]] = predecessores_por_varrimento(grafo)
+    assert grafo._predecessores == esperados
+    for v in grafo._vertices:
+        assert grafo.adjacentes_interno(v) == set(esperados[v])
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_predecessores_acompanham_alteracoes(semente: int) -> None:
+    """O índice de predecessores segue as inserções e remoções aleatórias"""
+    aleatorio: random.Random = random.Random(semente)
+    grafo: Graph = grafo_aleatorio(30, 120, semente)
+    verificar_predecessores(grafo)
+    proximo: int = 30
+    for _ in range(300):
+        nomes: List[str] = list(grafo._vertices)
+        operacao: float = aleatorio.random()
+        if operacao < 0.4 and len(nomes) > 1:
+            inicio, fim = aleatorio.sample(nomes, 2)
+            grafo.add_edges(inicio, fim, aleatorio.randint(1, 5))
+        elif operacao < 0.7:
+            arestas: List[Tuple[str, str]] = sorted(grafo.get_edges())
+            if arestas:
+                grafo.remove_edge(*aleatorio.choice(arestas))
+        elif operacao < 0.85 and nomes:
+            grafo.remove_vertex(aleatorio.choice(nomes))
+        else:
+            grafo.add_vertex(f"v{proximo}")
+            proximo += 1
+        verificar_predecessores(grafo)
+    grafo.remove_edge("inexistente", "v0")
+    grafo.remove_vertex("inexistente")
+    verificar_predecessores(grafo)
+    copia: Graph = Graph()
+    copia.carregar_vertices(grafo._vertices)
+    verificar_predecessores(copia)
+    copia.carregar_arestas(
+        grafo._vertices,
+        [(v, adj, p) for v, adjs in grafo._vertices.items() for adj, p in adjs.items()],
+    )
+    verificar_predecessores(copia)
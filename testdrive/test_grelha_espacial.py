@@ -0,0 +1,118 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from sistema.distancias import distancia_terra, indices_no_raio
+from sistema.grelha_espacial import GrelhaEspacial
+
+
+def grelha_aleatoria(
+    n: int, semente: int, lat: float, lon: float, espalhamento: float
+) -> tuple:
+    """
+    Gera uma grelha com pontos aleatórios à volta de uma coordenada,
+    com as longitudes reduzidas ao intervalo [-180, 180]
+
+    :param n: número de pontos
+    :type n: int
+    :param semente: semente do gerador aleatório
+    :type semente: int
+    :param lat: latitude do centro
+    :type lat: float
+    :param lon: longitude do centro
+    :type lon: float
+    :param espalhamento: desvio máximo (graus) ao centro
+    :type espalhamento: float
+    :return: grelha e lista dos pontos (lat, lon, identificador)
+    :rtype: tuple
+    """
+    aleatorio: random.Random = random.Random(semente)
+    grelha: GrelhaEspacial[int] = GrelhaEspacial()
+    pontos: list = []
+    for i in range(n):
+        la: float = max(-90.0, min(90.0, lat + aleatorio.uniform(-1, 1) * espalhamento))
+        lo: float = (lon + aleatorio.uniform(-1, 1) * espalhamento + 180) % 360 - 180
+        grelha.adicionar(la, lo, i)
+        pontos.append((la, lo, i))
+    return grelha, pontos
+
+
+def no_raio(grelha: GrelhaEspacial, lat: float, lon: float, raio: float) -> set:
+    """
+    Consulta a grelha e filtra os candidatos pela distância
+
+    :param grelha: grelha a consultar
+    :type grelha: GrelhaEspacial
+    :param lat: latitude do centro
+    :type lat: float
+    :param lon: longitude do centro
+    :type lon: float
+    :param raio: raio (m)
+    :type raio: float
+    :return: identificadores dos pontos dentro do raio
+    :rtype: set
+    """
+    candidatos, lats, lons = grelha.candidatos_coordenadas(lat, lon, raio)
+    return {candidatos[i] for i in indices_no_raio(lat, lon, lats, lons, raio)}
+
+
+def forca_bruta(pontos: list, lat: float, lon: float, raio: float) -> set:
+    """
+    Percorre todos os pontos e escolhe os que estão dentro do raio
+
+    :param pontos: pontos (lat, lon, identificador)
+    :type pontos: list
+    :param lat: latitude do centro
+    :type lat: float
+    :param lon: longitude do centro
+    :type lon: float
+    :param raio: raio (m)
+    :type raio: float
+    :return: identificadores dos pontos dentro do raio
+    :rtype: set
+    """
+    return {i for la, lo, i in pontos if distancia_terra(lat, lon, la, lo) <= raio}
+
+
+@pytest.mark.parametrize(
+    "lat, lon",
+    [
+        (38.65, -27.21),
+        (0.0, 179.99),
+        (0.0, -179.99),
+        (-45.0, 180.0),
+        (89.95, 10.0),
+        (-89.99, -120.0),
+    ],
+)
+@pytest.mark.parametrize("raio", [500, 5000, 50000, 500000])
+def test_grelha_igual_a_forca_bruta(lat: float, lon: float, raio: float) -> None:
+    grelha, pontos = grelha_aleatoria(1500, 7, lat, lon, 1.5)
+    assert len(grelha) == 1500
+    assert no_raio(grelha, lat, lon, raio) == forca_bruta(pontos, lat, lon, raio)
+
+
+def test_grelha_pontos_nos_dois_lados_do_antimeridiano() -> None:
+    grelha: GrelhaEspacial[str] = GrelhaEspacial()
+    grelha.adicionar(10.0, 179.999, "este")
+    grelha.adicionar(10.0, -179.999, "oeste")
+    grelha.adicionar(10.0, 179.0, "longe")
+    assert no_raio(grelha, 10.0, 180.0, 1000) == {"este", "oeste"}
+    assert no_raio(grelha, 10.0, -180.0, 1000) == {"este", "oeste"}
+
+
+def test_grelha_depois_de_remover() -> None:
+    grelha, pontos = grelha_aleatoria(800, 3, 38.65, -27.21, 0.3)
+    aleatorio: random.Random = random.Random(4)
+    removidos: list = aleatorio.sample(pontos, 300)
+    for la, lo, i in removidos:
+        grelha.remover(la, lo, i)
+    restantes: list = [p for p in pontos if p not in removidos]
+    assert len(grelha) == 500
+    for raio in (1000, 10000, 100000):
+        assert no_raio(grelha, 38.65, -27.21, raio) == forca_bruta(
+            restantes, 38.65, -27.21, raio
+        )
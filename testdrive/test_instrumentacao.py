@@ -0,0 +1,84 @@
+import os
+import sys
+import threading
+from typing import List
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from sistema import instrumentacao
+from sistema.grafo import Graph
+from testdrive.gerador import gerar_sistema
+
+
+@pytest.fixture
+def ativa():
+    """Ativa a instrumentação durante um teste, com os registos vazios"""
+    instrumentacao.ativar()
+    instrumentacao.limpar()
+    yield
+    instrumentacao.desativar()
+    instrumentacao.limpar()
+
+
+def em_threads(funcao, threads: int = 8) -> None:
+    """
+    Executa uma função em várias threads ao mesmo tempo, trocando de
+    thread com muita frequência
+
+    :param funcao: função sem argumentos
+    :type funcao: Callable[[], None]
+    :param threads: número de threads
+    :type threads: int
+    """
+    intervalo: float = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        lista: List[threading.Thread] = [
+            threading.Thread(target=funcao) for _ in range(threads)
+        ]
+        for thread in lista:
+            thread.start()
+        for thread in lista:
+            thread.join()
+    finally:
+        sys.setswitchinterval(intervalo)
+
+
+def test_contadores_em_threads(ativa) -> None:
+    """Nenhum incremento se perde quando várias threads contam"""
+
+    def contar() -> None:
+        for _ in range(5000):
+            instrumentacao.contar("teste")
+
+    em_threads(contar)
+    assert instrumentacao.relatorio()["contadores"]["teste"] == 8 * 5000
+
+
+def test_chamadas_em_threads(ativa) -> None:
+    """Todas as chamadas de várias threads são registadas"""
+    st = gerar_sistema(20, semente=1)
+    designacao: str = next(iter(st._pontos))._designacao
+
+    def consultar() -> None:
+        for _ in range(2000):
+            st.obter_ponto(designacao)
+
+    em_threads(consultar)
+    resumo: dict = instrumentacao.relatorio()["operacoes"][
+        "SistemaTuristico.obter_ponto"
+    ]
+    assert resumo["chamadas"] == 8 * 2000
+    assert 0 <= resumo["p50"] <= resumo["p99"] <= resumo["maximo"]
+
+
+def test_desativar_repoe_metodos() -> None:
+    """Depois de desativar, os métodos originais são repostos"""
+    original = Graph.__dict__["csr"]
+    instrumentacao.ativar()
+    assert Graph.__dict__["csr"] is not original
+    instrumentacao.desativar()
+    assert Graph.__dict__["csr"] is original
+    instrumentacao.contar("teste")
+    assert "teste" not in instrumentacao.relatorio()["contadores"]
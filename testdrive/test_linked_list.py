@@ -0,0 +1,97 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from sistema.LinkedList import DoubleNode, LinkedList
+
+
+@pytest.mark.parametrize("position", [0, 2, 4])
+def test_unlink_head_middle_and_tail(position: int) -> None:
+    """Unlinking a node keeps both directions of the list consistent"""
+    linked: LinkedList[int] = LinkedList()
+    nodes: list = [linked.add(i) for i in range(5)]
+    assert linked.unlink(nodes[position]) == position
+    expected: list = [i for i in range(5) if i != position]
+    assert list(linked) == expected
+    assert list(reversed(linked)) == expected[::-1]
+    assert len(linked) == 4
+    assert nodes[position]._prev is None and nodes[position]._next is None
+
+
+def test_unlink_only_node() -> None:
+    """Unlinking the only node leaves an empty list"""
+    linked: LinkedList[str] = LinkedList()
+    node: DoubleNode[str] = linked.add("a")
+    assert linked.unlink(node) == "a"
+    assert linked._head is None and linked._tail is None
+    assert len(linked) == 0
+    assert list(linked) == [] and list(reversed(linked)) == []
+    assert linked.add("b")._prev is None
+    assert list(linked) == ["b"]
+
+
+def test_random_operations_match_list() -> None:
+    """Length, forward and reverse order match a Python list"""
+    generator: random.Random = random.Random(3)
+    linked: LinkedList[int] = LinkedList()
+    nodes: dict = {}
+    reference: list = []
+    for i in range(500):
+        if reference and generator.random() < 0.4:
+            value: int = generator.choice(reference)
+            if generator.random() < 0.5:
+                linked.unlink(nodes.pop(value))
+            else:
+                linked.remove(value)
+                nodes.pop(value)
+            reference.remove(value)
+        else:
+            nodes[i] = linked.add(i)
+            reference.append(i)
+        assert len(linked) == len(reference)
+    assert list(linked) == reference
+    assert list(reversed(linked)) == reference[::-1]
+
+
+def test_update_node() -> None:
+    """Updating through a handle changes only that node"""
+    linked: LinkedList[str] = LinkedList()
+    nodes: list = [linked.add(value) for value in "abcd"]
+    linked.update_node(nodes[2], "x")
+    assert list(linked) == ["a", "b", "x", "d"]
+    assert list(reversed(linked)) == ["d", "x", "b", "a"]
+    assert len(linked) == 4
+
+
+def test_detached_node_is_rejected() -> None:
+    """A node removed earlier cannot be unlinked or updated again"""
+    linked: LinkedList[int] = LinkedList()
+    nodes: list = [linked.add(i) for i in range(3)]
+    linked.unlink(nodes[1])
+    with pytest.raises(ValueError):
+        linked.unlink(nodes[1])
+    with pytest.raises(ValueError):
+        linked.update_node(nodes[1], 5)
+    linked.remove(2)
+    with pytest.raises(ValueError):
+        linked.unlink(nodes[2])
+    assert list(linked) == [0]
+    assert len(linked) == 1
+    assert linked._head is nodes[0] and linked._tail is nodes[0]
+
+
+def test_node_from_another_list_is_rejected() -> None:
+    """A node added to one list cannot be unlinked or updated from another"""
+    first: LinkedList[int] = LinkedList()
+    second: LinkedList[int] = LinkedList()
+    node: DoubleNode[int] = first.add(1)
+    second.add(2)
+    with pytest.raises(ValueError):
+        second.unlink(node)
+    with pytest.raises(ValueError):
+        second.update_node(node, 3)
+    assert list(first) == [1] and list(second) == [2]
+    assert len(first) == 1 and len(second) == 1
@@ -0,0 +1,164 @@
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interface import lote
+from interface.input_output import DIARIO, caminho_ficheiro, iniciar_diario
+from interface.lote import executar_comando, executar_linha, executar_lote
+from sistema.sistema_turistico import SistemaTuristico
+from testdrive.gerador import CENTRO, gerar_sistema
+
+
+@pytest.fixture
+def st(pasta_dados) -> SistemaTuristico:
+    """Sistema gerado, com o diário numa pasta temporária"""
+    iniciar_diario(0)
+    return gerar_sistema(30, semente=1)
+
+
+def erro(st: SistemaTuristico, linha: str) -> str:
+    """
+    Executa um comando que tem de falhar
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param linha: comando em JSON
+    :type linha: str
+    :return: mensagem de erro
+    :rtype: str
+    """
+    resposta: dict = executar_linha(st, linha)
+    assert resposta["ok"] is False, resposta
+    return resposta["erro"]
+
+
+@pytest.mark.parametrize(
+    "linha, mensagem",
+    [
+        (
+            '{"op": "pontos_criticos", "metrica": "intermediacao", "amostra": 0}',
+            "amostra tem de ser pelo menos 1",
+        ),
+        (
+            '{"op": "pontos_criticos", "metrica": "intermediacao", "amostra": 1.5}',
+            "amostra tem de ser um número inteiro",
+        ),
+        ('{"op": "sugestoes", "x": 1e400, "y": 0}', "x tem de ser um número finito"),
+        ('{"op": "sugestoes", "x": 38.6, "y": NaN}', "y tem de ser um número finito"),
+        (
+            '{"op": "pesquisar", "categoria": "cultura", "inicio": -2}',
+            "inicio tem de ser pelo menos 0",
+        ),
+        (
+            '{"op": "pesquisar", "categoria": "cultura", "limite": true}',
+            "limite tem de ser um número inteiro",
+        ),
+        ('{"op": "pesquisar", "categoria": "desporto"}', "Categoria não existente"),
+        ('{"op": "pesquisar"}', "Argumento em falta: categoria"),
+        ('{"op": "voar"}', "Operação desconhecida: voar"),
+        ('{"op": [1]}', "Operação desconhecida: [1]"),
+        ('{"op": {"a": 1}}', "Operação desconhecida: {'a': 1}"),
+        ("[1, 2]", "tem de ser um objeto JSON"),
+        ("{", "JSON inválido"),
+    ],
+)
+def test_argumentos_invalidos(st, linha: str, mensagem: str) -> None:
+    """Argumentos inválidos dão uma resposta de erro em vez de uma exceção"""
+    assert mensagem in erro(st, linha)
+
+
+def test_adicionar_ponto_coordenada_infinita(st) -> None:
+    """Um ponto com coordenadas infinitas não é adicionado nem registado"""
+    linha: str = (
+        '{"op": "adicionar_ponto", "designacao": "Longe", "x": 1e400, "y": 0,'
+        ' "categoria": "natureza"}'
+    )
+    assert "x tem de ser um número finito" in erro(st, linha)
+    assert not st.existe_ponto("Longe")
+    with open(caminho_ficheiro(DIARIO), encoding="UTF-8") as f:
+        assert len(f.readlines()) == 1
+
+
+@pytest.mark.parametrize("avaliacao", [3.9, True, 0, 5, "bom", None])
+def test_avaliar_invalido(st, avaliacao) -> None:
+    """Só são aceites avaliações inteiras de 1 a 4"""
+    ponto_interesse = next(iter(st._pontos))
+    histograma: list = list(ponto_interesse._histograma)
+    resposta: dict = executar_comando(
+        st,
+        {
+            "op": "avaliar",
+            "designacao": ponto_interesse._designacao,
+            "avaliacao": avaliacao,
+        },
+    )
+    assert resposta["ok"] is False
+    assert ponto_interesse._histograma == histograma
+
+
+def test_avaliar_registado(st) -> None:
+    """Uma avaliação válida é aplicada e registada no diário"""
+    ponto_interesse = next(iter(st._pontos))
+    quatro: int = ponto_interesse._histograma[3]
+    resposta: dict = executar_comando(
+        st,
+        {
+            "op": "avaliar",
+            "designacao": ponto_interesse._designacao,
+            "avaliacao": "4",
+            "id": 9,
+        },
+    )
+    assert resposta["ok"] is True and resposta["id"] == 9
+    assert ponto_interesse._histograma[3] == quatro + 1
+    with open(caminho_ficheiro(DIARIO), encoding="UTF-8") as f:
+        assert '"avaliacao":4' in f.readlines()[-1]
+
+
+def test_valores_validos(st) -> None:
+    """Os limites dos argumentos são aceites"""
+    for comando in (
+        {"op": "pontos_criticos", "metrica": "intermediacao", "amostra": 1},
+        {"op": "pesquisar", "categoria": "cultura", "inicio": 0, "limite": 0},
+        {"op": "sugestoes", "x": CENTRO[0], "y": CENTRO[1], "raio": 0},
+    ):
+        assert executar_comando(st, comando)["ok"] is True, comando
+
+
+def test_erro_interno(st, monkeypatch) -> None:
+    """Uma exceção inesperada dá uma resposta de erro e o lote continua"""
+
+    def falhar(st: SistemaTuristico, comando: dict) -> None:
+        raise ZeroDivisionError("divisão por zero")
+
+    monkeypatch.setitem(lote.COMANDOS, "estatisticas", falhar)
+    saida: io.StringIO = io.StringIO()
+    falhas: int = executar_lote(
+        st,
+        [
+            '{"op": "estatisticas", "id": 1}',
+            "",
+            '{"op": "pesquisar", "categoria": "cultura"}',
+        ],
+        saida,
+    )
+    respostas: list = saida.getvalue().splitlines()
+    assert falhas == 1
+    assert len(respostas) == 2
+    assert "Erro interno: ZeroDivisionError: divisão por zero" in respostas[0]
+    assert '"ok": true' in respostas[1]
+
+
+def test_operacao_nao_hashable(st) -> None:
+    """Uma operação que não é uma chave válida não interrompe o lote"""
+    saida: io.StringIO = io.StringIO()
+    falhas: int = executar_lote(
+        st, ['{"op": [1]}', '{"op": "pesquisar", "categoria": "cultura"}'], saida
+    )
+    respostas: list = saida.getvalue().splitlines()
+    assert falhas == 1
+    assert len(respostas) == 2
+    assert '"ok": true' in respostas[1]
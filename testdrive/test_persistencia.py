@@ -0,0 +1,366 @@
+import copy
+import json
+import os
+import random
+import struct
+import sys
+from array import array
+from typing import List, Optional
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interface import input_output
+from interface.binario import (
+    CABECALHO,
+    ErroSnapshot,
+    _colunas,
+    carregar_binario,
+    gravar_binario,
+)
+from interface.input_output import (
+    DIARIO,
+    aplicar_alteracao,
+    caminho_ficheiro,
+    carregar_sistema_turistico,
+    exportar_json,
+    gravar_sistema_turistico,
+    importar_json,
+    ler_geracao_diario,
+    registar_alteracao,
+)
+from interface.lote import executar_comando
+from sistema.sistema_turistico import SistemaTuristico
+from testdrive.gerador import gerar_sistema
+
+
+def estado(st: SistemaTuristico) -> dict:
+    """
+    Obtém os dados do sistema numa forma comparável, incluindo os índices
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :return: cópia dos pontos de interesse, vias, grafo e índices
+    :rtype: dict
+    """
+    return copy.deepcopy(
+        {
+            "pontos": [
+                (
+                    p._designacao,
+                    p._morada,
+                    p._coordenadas._x,
+                    p._coordenadas._y,
+                    p._categoria,
+                    p._acessibilidade,
+                    p._atividades,
+                    p._contagem_avaliacoes,
+                    p._soma_avaliacoes,
+                    tuple(p._histograma),
+                    p._visitas,
+                )
+                for p in st._pontos
+            ],
+            "rede": {
+                chave: (
+                    via._inicio,
+                    via._fim,
+                    via._distancia,
+                    via._velocidade_minima,
+                    via._velocidade_maxima,
+                )
+                for chave, via in st._rede.items()
+            },
+            "vertices": st._grafo._vertices,
+            "predecessores": st._grafo._predecessores,
+            "indice": sorted(st._indice),
+            "categorias": st._indice_categorias,
+            "grelha": len(st._grelha),
+        }
+    )
+
+
+def sistema_avaliado(n: int, semente: int) -> SistemaTuristico:
+    """
+    Gera um sistema e avalia alguns dos seus pontos de interesse
+
+    :param n: número de pontos de interesse
+    :type n: int
+    :param semente: semente do gerador aleatório
+    :type semente: int
+    :return: sistema gerado
+    :rtype: SistemaTuristico
+    """
+    st: SistemaTuristico = gerar_sistema(n, semente=semente)
+    aleatorio: random.Random = random.Random(semente)
+    for ponto_interesse in list(st._pontos)[::3]:
+        st.avaliar_ponto(aleatorio.randint(1, 4), ponto_interesse)
+    return st
+
+
+def test_avaliacoes_do_formato_antigo(tmp_path) -> None:
+    """As listas de avaliações dos ficheiros antigos passam a agregados"""
+    ponto: dict = {
+        "designacao": "Miradouro da Serreta",
+        "morada": "Serreta",
+        "coordenadas": {"x": 38.76, "y": -27.36},
+        "categoria": "natureza",
+        "acessibilidade": "Estacionamento",
+        "atividades": "Visitas",
+        "avaliacao": [4, 3, 4, 1, 0, 7],
+        "visitas": 6,
+    }
+    caminho: str = str(tmp_path / "antigo.json")
+    with open(caminho, "w", encoding="UTF-8") as f:
+        json.dump({"pontos": [ponto], "rede": [], "grafo": {}}, f)
+    st: SistemaTuristico = SistemaTuristico()
+    importar_json(st, caminho)
+    ponto_interesse = st.obter_ponto("Miradouro da Serreta")
+    assert ponto_interesse._contagem_avaliacoes == 4
+    assert ponto_interesse._soma_avaliacoes == 12
+    assert ponto_interesse._histograma == [1, 0, 1, 2]
+    assert ponto_interesse._visitas == 6
+
+    exportar_json(st, caminho)
+    with open(caminho, "r", encoding="UTF-8") as f:
+        assert "avaliacao" not in json.load(f)["pontos"][0]
+    carregado: SistemaTuristico = SistemaTuristico()
+    importar_json(carregado, caminho)
+    assert estado(carregado) == estado(st)
+
+
+def test_binario_ida_e_volta(tmp_path) -> None:
+    """Um sistema gravado e carregado do snapshot binário fica igual"""
+    st: SistemaTuristico = sistema_avaliado(300, 1)
+    caminho: str = str(tmp_path / "sistema.bin")
+    gravar_binario(st, caminho, 7)
+    carregado: SistemaTuristico = SistemaTuristico()
+    assert carregar_binario(carregado, caminho) == 7
+    assert estado(carregado) == estado(st)
+    inicio, fim = next(iter(st._rede))
+    assert carregado.itinerario(inicio, fim, False) == st.itinerario(inicio, fim, False)
+
+
+def test_binario_sistema_vazio(tmp_path) -> None:
+    """Um sistema vazio também pode ser gravado e carregado"""
+    caminho: str = str(tmp_path / "vazio.bin")
+    gravar_binario(SistemaTuristico(), caminho, 0)
+    carregado: SistemaTuristico = SistemaTuristico()
+    assert carregar_binario(carregado, caminho) == 0
+    assert estado(carregado) == estado(SistemaTuristico())
+
+
+def test_binario_textos_unicode(tmp_path) -> None:
+    """Designações com acentos e carateres fora do BMP são preservadas"""
+    st: SistemaTuristico = gerar_sistema(5, semente=2)
+    ponto_interesse = next(iter(st._pontos))
+    ponto_interesse._morada = "Rua da Sé, Angra do Heroísmo 🏝"
+    caminho: str = str(tmp_path / "sistema.bin")
+    gravar_binario(st, caminho, 1)
+    carregado: SistemaTuristico = SistemaTuristico()
+    carregar_binario(carregado, caminho)
+    assert estado(carregado) == estado(st)
+
+
+def trocar_indice(dados: bytes, coluna: int, origem: Optional[int] = None) -> bytes:
+    """
+    Substitui o primeiro índice de texto de uma coluna do snapshot, por
+    um índice fora da tabela de textos ou pelo primeiro de outra coluna
+
+    :param dados: snapshot gravado
+    :type dados: bytes
+    :param coluna: posição da coluna a alterar
+    :type coluna: int
+    :param origem: posição da coluna de onde é copiado o índice,
+    ou None para um índice fora da tabela
+    :type origem: Optional[int]
+    :return: snapshot alterado
+    :rtype: bytes
+    """
+    cabecalho: tuple = CABECALHO.unpack_from(dados)
+    posicoes: List[int] = []
+    posicao: int = CABECALHO.size + cabecalho[4]
+    for tipo, tamanho in _colunas(*cabecalho[5:]):
+        posicoes.append(posicao)
+        posicao += tamanho * array(tipo).itemsize
+    indice: bytes = (
+        struct.pack("<I", 0xFFFFFFFF)
+        if origem is None
+        else dados[posicoes[origem] : posicoes[origem] + 4]
+    )
+    return dados[: posicoes[coluna]] + indice + dados[posicoes[coluna] + 4 :]
+
+
+@pytest.mark.parametrize(
+    "danificar",
+    [
+        lambda dados: dados[:10],
+        lambda dados: b"XXXX" + dados[4:],
+        lambda dados: dados[: len(dados) - 8],
+        lambda dados: b"",
+        lambda dados: trocar_indice(dados, 0),
+        lambda dados: trocar_indice(dados, 17),
+        lambda dados: trocar_indice(dados, 17, 1),
+    ],
+    ids=[
+        "cabecalho_truncado",
+        "magico",
+        "colunas_truncadas",
+        "vazio",
+        "indice_de_texto",
+        "indice_de_aresta",
+        "aresta_sem_vertice",
+    ],
+)
+def test_binario_invalido(tmp_path, danificar) -> None:
+    """Um ficheiro danificado é rejeitado com ErroSnapshot"""
+    caminho: str = str(tmp_path / "sistema.bin")
+    gravar_binario(sistema_avaliado(20, 3), caminho, 1)
+    with open(caminho, "rb") as f:
+        dados: bytes = f.read()
+    with open(caminho, "wb") as f:
+        f.write(danificar(dados))
+    with pytest.raises(ErroSnapshot):
+        carregar_binario(SistemaTuristico(), caminho)
+
+
+def alterar(st: SistemaTuristico) -> None:
+    """
+    Faz alterações de todos os tipos registados no diário
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    """
+    designacoes = [p._designacao for p in st._pontos]
+    comandos = [
+        {
+            "op": "adicionar_ponto",
+            "designacao": "Miradouro do Pico",
+            "morada": "Estrada Regional",
+            "x": 38.7,
+            "y": -27.2,
+            "categoria": "natureza",
+        },
+        {"op": "avaliar", "designacao": "Miradouro do Pico", "avaliacao": 4},
+        {"op": "avaliar", "designacao": designacoes[0], "avaliacao": 2},
+        {
+            "op": "avaliar_varios",
+            "avaliacoes": [[designacoes[1], 3], [designacoes[2], 1]],
+        },
+        {
+            "op": "alterar_ponto",
+            "designacao": designacoes[3],
+            "categoria": "cultura",
+            "acessibilidade": "sim",
+        },
+        {"op": "remover_ponto", "designacao": designacoes[4]},
+    ]
+    for comando in comandos:
+        assert executar_comando(st, comando)["ok"], comando
+    for registo in (
+        {"op": "acrescentar_vertice", "vertice": "Miradouro do Pico"},
+        {
+            "op": "acrescentar_aresta",
+            "inicio": "Miradouro do Pico",
+            "fim": designacoes[5],
+            "distancia": 1500.0,
+            "velocidade_minima": 20.0,
+            "velocidade_maxima": 50.0,
+        },
+    ):
+        aplicar_alteracao(st, registo)
+        registar_alteracao(st, registo)
+    inicio, fim = next(iter(st._rede))
+    registo: dict = {"op": "remover_aresta", "inicio": inicio, "fim": fim}
+    aplicar_alteracao(st, registo)
+    registar_alteracao(st, registo)
+
+
+def test_diario_repete_alteracoes(pasta_dados) -> None:
+    """As alterações registadas no diário são repetidas ao carregar"""
+    st: SistemaTuristico = sistema_avaliado(50, 4)
+    gravar_sistema_turistico(st)
+    alterar(st)
+    assert ler_geracao_diario() == 1
+    carregado: SistemaTuristico = SistemaTuristico()
+    carregar_sistema_turistico(carregado)
+    assert estado(carregado) == estado(st)
+
+
+def test_diario_compactado(pasta_dados, monkeypatch) -> None:
+    """Quando o diário excede o limite passa para um novo snapshot"""
+    monkeypatch.setattr(input_output, "LIMITE_DIARIO", 300)
+    st: SistemaTuristico = sistema_avaliado(50, 5)
+    gravar_sistema_turistico(st)
+    alterar(st)
+    assert ler_geracao_diario() > 1
+    carregado: SistemaTuristico = SistemaTuristico()
+    carregar_sistema_turistico(carregado)
+    assert estado(carregado) == estado(st)
+
+
+def test_diario_linha_incompleta(pasta_dados) -> None:
+    """Uma última linha escrita só em parte é ignorada"""
+    st: SistemaTuristico = sistema_avaliado(50, 6)
+    gravar_sistema_turistico(st)
+    alterar(st)
+    esperado: dict = estado(st)
+    with open(caminho_ficheiro(DIARIO), "a", encoding="UTF-8") as f:
+        f.write('{"op":"remover_ponto","desig')
+    carregado: SistemaTuristico = SistemaTuristico()
+    carregar_sistema_turistico(carregado)
+    assert estado(carregado) == esperado
+
+
+def test_diario_de_outra_geracao(pasta_dados) -> None:
+    """Um diário de outro snapshot não é aplicado e é reiniciado"""
+    st: SistemaTuristico = sistema_avaliado(50, 7)
+    gravar_sistema_turistico(st)
+    esperado: dict = estado(st)
+    gravar_binario(st, caminho_ficheiro(input_output.SNAPSHOT_BINARIO), 5)
+    alterar(st)
+    carregado: SistemaTuristico = SistemaTuristico()
+    carregar_sistema_turistico(carregado)
+    assert estado(carregado) == esperado
+    assert ler_geracao_diario() == 5
+
+
+def test_diario_ponto_inexistente(pasta_dados) -> None:
+    """Alterações de pontos de interesse que já não existem são ignoradas"""
+    st: SistemaTuristico = sistema_avaliado(50, 8)
+    gravar_sistema_turistico(st)
+    alterar(st)
+    esperado: dict = estado(st)
+    for registo in (
+        {
+            "op": "alterar_ponto",
+            "designacao": "Inexistente",
+            "categoria": "cultura",
+            "acessibilidade": "sim",
+        },
+        {"op": "avaliar_ponto", "designacao": "Inexistente", "avaliacao": 3},
+    ):
+        aplicar_alteracao(st, registo)
+        registar_alteracao(st, registo)
+    assert estado(st) == esperado
+    carregado: SistemaTuristico = SistemaTuristico()
+    carregar_sistema_turistico(carregado)
+    assert estado(carregado) == esperado
+
+
+def test_diario_operacao_desconhecida(pasta_dados, capsys) -> None:
+    """Uma operação desconhecida é descrita e as seguintes são aplicadas"""
+    st: SistemaTuristico = sistema_avaliado(50, 9)
+    gravar_sistema_turistico(st)
+    with pytest.raises(ValueError, match="Operação desconhecida"):
+        aplicar_alteracao(st, {"op": "teletransportar"})
+    registar_alteracao(st, {"op": "teletransportar", "designacao": "x"})
+    registar_alteracao(st, {"op": "avaliar_ponto", "designacao": "x"})
+    alterar(st)
+    carregado: SistemaTuristico = SistemaTuristico()
+    carregar_sistema_turistico(carregado)
+    assert estado(carregado) == estado(st)
+    erros: str = capsys.readouterr().err
+    assert "Alteração 2 do diário ignorada" in erros
+    assert "teletransportar" in erros
+    assert "Alteração 3 do diário ignorada" not in erros
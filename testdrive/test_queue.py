@@ -0,0 +1,127 @@
+import os
+import random
+import sys
+from collections import deque
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from sistema.QueueBasedList import QueueBasedList
+
+
+def test_wraparound_keeps_fifo_order() -> None:
+    """Items that wrap past the end of the buffer come out in order"""
+    queue: QueueBasedList[int] = QueueBasedList()
+    queue.extend(range(6))
+    assert [queue.pop() for _ in range(5)] == [0, 1, 2, 3, 4]
+    queue.extend(range(6, 12))
+    assert len(queue._items) == QueueBasedList._MIN_BUFFER
+    assert queue._head + len(queue) > len(queue._items)
+    assert list(queue) == list(range(5, 12))
+    assert str(queue) == "[5 6 7 8 9 10 11]"
+    assert queue.peek() == 5
+    assert queue.drain() == list(range(5, 12))
+    assert queue.is_empty()
+
+
+def test_grows_and_shrinks() -> None:
+    """The buffer doubles when full and halves when mostly empty"""
+    queue: QueueBasedList[int] = QueueBasedList()
+    for i in range(3):
+        queue.add(i)
+        queue.pop()
+    for i in range(100):
+        queue.add(i)
+    assert len(queue._items) == 128
+    assert list(queue) == list(range(100))
+    for i in range(95):
+        assert queue.pop() == i
+    assert len(queue._items) < 128
+    assert len(queue._items) >= QueueBasedList._MIN_BUFFER
+    assert list(queue) == list(range(95, 100))
+
+
+def test_bounded_queue() -> None:
+    """A bounded queue never grows past its capacity"""
+    queue: QueueBasedList[int] = QueueBasedList(capacity=5)
+    assert queue.capacity() == 5
+    queue.extend(range(5))
+    assert queue.is_full()
+    assert len(queue._items) == 5
+    with pytest.raises(OverflowError):
+        queue.add(5)
+    queue.pop()
+    queue.add(5)
+    assert list(queue) == [1, 2, 3, 4, 5]
+
+
+def test_bounded_extend_inserts_until_full() -> None:
+    """extend inserts what fits in a bounded queue and then fails"""
+    queue: QueueBasedList[int] = QueueBasedList([0, 1], capacity=4)
+    with pytest.raises(OverflowError):
+        queue.extend(range(2, 10))
+    assert list(queue) == [0, 1, 2, 3]
+
+
+def test_empty_queue() -> None:
+    """peek and pop on an empty queue raise IndexError"""
+    queue: QueueBasedList[int] = QueueBasedList()
+    with pytest.raises(IndexError):
+        queue.peek()
+    with pytest.raises(IndexError):
+        queue.pop()
+    assert queue.drain() == []
+    assert queue.drain(3) == []
+    with pytest.raises(ValueError):
+        QueueBasedList(capacity=0)
+
+
+def test_drain_count() -> None:
+    """drain removes at most count items from the top"""
+    queue: QueueBasedList[int] = QueueBasedList(range(10))
+    assert queue.drain(3) == [0, 1, 2]
+    assert queue.drain(0) == []
+    assert queue.drain(-1) == []
+    assert queue.drain(20) == list(range(3, 10))
+    assert queue.is_empty()
+
+
+@pytest.mark.parametrize("capacity", [None, 1, 7, 30])
+def test_matches_deque(capacity) -> None:
+    """Random operations give the same results as collections.deque"""
+    rng: random.Random = random.Random(capacity)
+    queue: QueueBasedList[int] = QueueBasedList(capacity=capacity)
+    model: deque = deque()
+    for i in range(5000):
+        operation: float = rng.random()
+        if operation < 0.45:
+            if len(model) == capacity:
+                with pytest.raises(OverflowError):
+                    queue.add(i)
+            else:
+                queue.add(i)
+                model.append(i)
+        elif operation < 0.55:
+            items: list = list(range(i, i + rng.randint(0, 12)))
+            fits: int = len(items) if capacity is None else capacity - len(model)
+            if len(items) > fits:
+                with pytest.raises(OverflowError):
+                    queue.extend(items)
+            else:
+                queue.extend(items)
+            model.extend(items[:fits])
+        elif operation < 0.95:
+            if model:
+                assert queue.pop() == model.popleft()
+            else:
+                with pytest.raises(IndexError):
+                    queue.pop()
+        else:
+            count: int = rng.randint(0, 10)
+            assert queue.drain(count) == [
+                model.popleft() for _ in range(min(count, len(model)))
+            ]
+        assert len(queue) == len(model)
+        assert list(queue) == list(model)
+        if capacity is not None:
+            assert len(queue._items) <= capacity
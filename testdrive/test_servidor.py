@@ -0,0 +1,115 @@
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+from json import dumps, loads
+from typing import List
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interface import servidor
+from interface.servidor import LIMITE_LINHA, Servidor
+from testdrive.gerador import gerar_sistema
+
+
+@pytest.fixture
+def srv(pasta_dados):
+    """Servidor sobre um sistema gerado, terminado no fim do teste"""
+    s: Servidor = Servidor(gerar_sistema(30, semente=1), threads=2)
+    yield s
+    s.fechar()
+
+
+async def conversar(s: Servidor, endereco: str, linhas: List[str]) -> List[dict]:
+    """
+    Envia linhas por uma ligação a um servidor e lê uma resposta por linha
+
+    :param s: servidor a iniciar
+    :type s: Servidor
+    :param endereco: caminho do socket Unix
+    :type endereco: str
+    :param linhas: pedidos a enviar
+    :type linhas: List[str]
+    :return: respostas
+    :rtype: List[dict]
+    """
+    async with await s.iniciar(endereco):
+        leitor, escritor = await asyncio.open_unix_connection(
+            endereco, limit=LIMITE_LINHA
+        )
+        respostas: List[dict] = []
+        for linha in linhas:
+            escritor.write((linha + "\n").encode())
+            await escritor.drain()
+            respostas.append(loads(await leitor.readline()))
+        escritor.close()
+        await escritor.wait_closed()
+    return respostas
+
+
+def test_pedidos_por_socket(srv) -> None:
+    """Cada linha recebe uma resposta, incluindo as inválidas"""
+    with tempfile.TemporaryDirectory() as pasta:
+        respostas: List[dict] = asyncio.run(
+            conversar(
+                srv,
+                os.path.join(pasta, "servidor.sock"),
+                [
+                    dumps({"op": "pesquisar", "categoria": "cultura", "id": "a"}),
+                    "{",
+                    "[1]",
+                    dumps({"op": "pesquisar", "categoria": "cultura", "inicio": -1}),
+                ],
+            )
+        )
+    assert respostas[0]["ok"] is True and respostas[0]["id"] == "a"
+    assert "JSON inválido" in respostas[1]["erro"]
+    assert "objeto JSON" in respostas[2]["erro"]
+    assert "inicio tem de ser pelo menos 0" in respostas[3]["erro"]
+
+
+def test_excecao_no_trabalhador(srv, monkeypatch) -> None:
+    """Uma exceção na pool dá uma resposta de erro a todos os pedidos agrupados"""
+    libertar: threading.Event = threading.Event()
+
+    def falhar(st, comando: dict) -> dict:
+        libertar.wait(5)
+        raise RuntimeError("falha inesperada")
+
+    async def pedir() -> List[dict]:
+        comando: dict = {"op": "pesquisar", "categoria": "cultura"}
+        tarefas = [
+            asyncio.ensure_future(srv.executar({**comando, "id": i})) for i in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        libertar.set()
+        return await asyncio.gather(*tarefas)
+
+    monkeypatch.setattr(servidor, "executar_comando", falhar)
+    respostas: List[dict] = asyncio.run(pedir())
+    assert [r["id"] for r in respostas] == [0, 1, 2]
+    for resposta in respostas:
+        assert resposta["ok"] is False
+        assert resposta["erro"] == "Erro interno: RuntimeError: falha inesperada"
+    assert srv.agrupados == 2
+    assert srv._em_curso == {}
+    monkeypatch.undo()
+    resposta: dict = asyncio.run(
+        srv.executar({"op": "pesquisar", "categoria": "cultura"})
+    )
+    assert resposta["ok"] is True
+
+
+def test_escritas_nao_agrupadas(srv) -> None:
+    """As alterações são sempre executadas, mesmo quando são iguais"""
+
+    async def pedir() -> List[dict]:
+        designacao: str = next(iter(srv._st._pontos))._designacao
+        comando: dict = {"op": "avaliar", "designacao": designacao, "avaliacao": 3}
+        return await asyncio.gather(*(srv.executar(dict(comando)) for _ in range(3)))
+
+    assert all(r["ok"] for r in asyncio.run(pedir()))
+    assert srv.agrupados == 0
+    assert srv.pedidos == 3
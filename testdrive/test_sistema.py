@@ -0,0 +1,264 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from sistema.sistema_turistico import SistemaTuristico
+from sistema.ponto_interesse import PontoInteresse
+from sistema.via_circulacao import ViaCirculacao
+from sistema.Ponto2D import Ponto2D
+from testdrive.gerador import CENTRO, gerar_sistema
+
+
+def ponto(designacao: str, lat: float, lon: float, categoria: str = "natureza"):
+    """
+    Cria um ponto de interesse sem avaliações nem visitas
+
+    :param designacao: designação do ponto de interesse
+    :type designacao: str
+    :param lat: latitude do ponto de interesse
+    :type lat: float
+    :param lon: longitude do ponto de interesse
+    :type lon: float
+    :param categoria: categoria do ponto de interesse
+    :type categoria: str
+    :return: ponto de interesse
+    :rtype: PontoInteresse
+    """
+    return PontoInteresse(
+        designacao,
+        "Rua 1",
+        Ponto2D(lat, lon),
+        categoria,
+        "Estacionamento",
+        "Visitas",
+    )
+
+
+def test_pontos_proximos_com_visitas_iguais() -> None:
+    st: SistemaTuristico = SistemaTuristico()
+    for i in range(5000):
+        st.adicionar_ponto(
+            ponto(f"Miradouro {i}", CENTRO[0] + i * 1e-6, CENTRO[1] + i * 1e-6)
+        )
+    proximos: list = st.pontos_proximos(CENTRO[0], CENTRO[1])
+    assert len(proximos) == 5000
+    assert all(p._visitas == 0 for p in proximos)
+
+
+def test_pontos_proximos_por_visitas() -> None:
+    st: SistemaTuristico = gerar_sistema(300, semente=4)
+    proximos: list = st.pontos_proximos(CENTRO[0], CENTRO[1])
+    visitas: list = [p._visitas for p in proximos]
+    assert proximos
+    assert visitas == sorted(visitas, reverse=True)
+
+
+def test_agregados_das_avaliacoes() -> None:
+    st: SistemaTuristico = SistemaTuristico()
+    a: PontoInteresse = ponto("Miradouro", *CENTRO)
+    b: PontoInteresse = ponto("Museu", *CENTRO, categoria="cultura")
+    st.adicionar_ponto(a)
+    st.adicionar_ponto(b)
+    for avaliacao in (1, 4, 4, 3):
+        st.avaliar_ponto(avaliacao, a)
+    assert st.avaliar_pontos({"Museu": [0, 2, 1, 0], "Inexistente": [5, 0, 0, 0]}) == 3
+    assert (a._contagem_avaliacoes, a._soma_avaliacoes, a._visitas) == (4, 12, 4)
+    assert a._histograma == [1, 0, 1, 2]
+    assert a.media_avaliacao() == 3.0
+    assert (b._contagem_avaliacoes, b._soma_avaliacoes, b._visitas) == (3, 7, 3)
+    assert st.histograma_avaliacoes() == [1, 2, 2, 2]
+
+
+@pytest.mark.parametrize("avaliacao", [0, 5, -1, 2.0, True, "3"])
+def test_avaliar_ponto_fora_da_escala(avaliacao) -> None:
+    st: SistemaTuristico = SistemaTuristico()
+    a: PontoInteresse = ponto("Miradouro", *CENTRO)
+    st.adicionar_ponto(a)
+    with pytest.raises(ValueError):
+        st.avaliar_ponto(avaliacao, a)
+    assert (a._contagem_avaliacoes, a._soma_avaliacoes, a._visitas) == (0, 0, 0)
+    assert a._histograma == [0, 0, 0, 0]
+
+
+@pytest.mark.parametrize(
+    "contagem", [[1, 2, 3], [1, 2, 3, 4, 5], [1, -1, 0, 0], [0, 1.5, 0, 0], "1234"]
+)
+def test_avaliar_pontos_contagem_invalida(contagem) -> None:
+    st: SistemaTuristico = SistemaTuristico()
+    a: PontoInteresse = ponto("Miradouro", *CENTRO)
+    b: PontoInteresse = ponto("Museu", *CENTRO)
+    st.adicionar_ponto(a)
+    st.adicionar_ponto(b)
+    with pytest.raises(ValueError):
+        st.avaliar_pontos({"Miradouro": [1, 1, 1, 1], "Museu": contagem})
+    assert a._contagem_avaliacoes == 0 and b._contagem_avaliacoes == 0
+    assert a._histograma == [0, 0, 0, 0]
+
+
+def test_pontos_criticos_com_valores_iguais() -> None:
+    st: SistemaTuristico = SistemaTuristico()
+    st.acrescentar_vertice("Centro")
+    for i in range(3000):
+        st.acrescentar_vertice(f"Ponto {i}")
+    for i in range(10):
+        st.acrescentar_aresta(ViaCirculacao("Centro", f"Ponto {i}", 100, 30, 50))
+    criticos: list = st.pontos_criticos("grau_externo")
+    assert len(criticos) == 3001
+    assert criticos[0] == (10, "Centro")
+    assert all(valor == 0 for valor, _ in criticos[1:])
+    interno: list = st.pontos_criticos("grau_interno")
+    assert [valor for valor, _ in interno] == [1] * 10 + [0] * 2991
+
+
+def test_acrescentar_aresta_rejeitada_pelo_grafo() -> None:
+    st: SistemaTuristico = SistemaTuristico()
+    for nome in ("a", "b"):
+        st.acrescentar_vertice(nome)
+    assert st.acrescentar_aresta(ViaCirculacao("a", "b", 1, 30, 50))
+    rejeitadas: list = [
+        ViaCirculacao("a", "c", 1, 30, 50),
+        ViaCirculacao("c", "a", 1, 30, 50),
+        ViaCirculacao("a", "b", 2, 30, 50),
+        ViaCirculacao("b", "a", 2, 30, 50),
+    ]
+    for via in rejeitadas:
+        assert not st.acrescentar_aresta(via)
+    assert list(st._rede) == [("a", "b")]
+    assert st.obter_via("a", "b")._distancia == 1
+    assert st.obter_via("b", "a") is None
+    assert "c" not in st._vias_por_ponto
+    assert st._vias_por_ponto == {"a": {("a", "b")}, "b": {("a", "b")}}
+    assert st._grafo._vertices == {"a": {"b": 1}, "b": {}}
+
+
+def categoria_por_forca_bruta(st: SistemaTuristico, categoria: str) -> list:
+    """
+    Percorre a lista de pontos de interesse e ordena os da categoria
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param categoria: categoria a pesquisar
+    :type categoria: str
+    :return: designações por ordem alfabética
+    :rtype: list
+    """
+    return sorted(
+        (p._designacao for p in st._pontos if p._categoria == categoria),
+        key=lambda d: (d.casefold(), d),
+    )
+
+
+def verificar_categorias(st: SistemaTuristico) -> None:
+    """
+    Compara o índice de cada categoria com uma pesquisa linear
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    """
+    for categoria in st._categorias:
+        esperadas: list = categoria_por_forca_bruta(st, categoria)
+        obtidas: list = [p._designacao for p in st.iterar_categoria(categoria)]
+        assert obtidas == esperadas
+        assert [
+            p._designacao for p in st.iterar_categoria(categoria, 3, 5)
+        ] == esperadas[3:8]
+        assert st.pesquisar_pontos(categoria).count("\n") >= len(esperadas)
+
+
+def test_indice_categorias_acompanha_alteracoes() -> None:
+    st: SistemaTuristico = gerar_sistema(120, semente=2)
+    verificar_categorias(st)
+    st.adicionar_ponto(ponto("aaa Miradouro", *CENTRO))
+    st.adicionar_ponto(ponto("Zz Museu", *CENTRO, categoria="cultura"))
+    st.adicionar_ponto(ponto("ÁGUA Tasca", *CENTRO, categoria="gastronomia"))
+    verificar_categorias(st)
+    aleatorio: random.Random = random.Random(5)
+    for designacao in aleatorio.sample(
+        [p._designacao for p in st._pontos], 30
+    ):
+        st.remover_ponto(designacao)
+    verificar_categorias(st)
+    for ponto_interesse in aleatorio.sample(list(st._pontos), 20):
+        st.alterar_ponto(
+            ponto_interesse, aleatorio.choice(st._categorias), "Nenhuma"
+        )
+    verificar_categorias(st)
+
+
+def verificar_itinerarios(st: SistemaTuristico, pares: list) -> None:
+    """
+    Compara os caminhos da tabela com os do A* para vários pares de pontos
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param pares: pares (inicio, fim) de pontos da rede
+    :type pares: list
+    """
+    for inicio, fim in pares:
+        tabelado: tuple = st.itinerario(inicio, fim, tabelado=True)
+        a_estrela: tuple = st.itinerario(inicio, fim, tabelado=False)
+        assert tabelado[1] == a_estrela[1]
+        assert tabelado[0] == pytest.approx(a_estrela[0])
+        assert tabelado[2:] == pytest.approx(a_estrela[2:])
+
+
+def via_direta(st: SistemaTuristico, inicio: str, fim: str) -> ViaCirculacao:
+    """
+    Cria uma via com o comprimento da distância em linha reta entre dois
+    pontos, que mantém válida a heurística do A*
+
+    :param st: objeto que caracteriza o sistema
+    :type st: SistemaTuristico
+    :param inicio: ponto do início da via
+    :type inicio: str
+    :param fim: ponto do fim da via
+    :type fim: str
+    :return: via entre os dois pontos
+    :rtype: ViaCirculacao
+    """
+    a: PontoInteresse = st.obter_ponto(inicio)
+    b: PontoInteresse = st.obter_ponto(fim)
+    distancia: float = st.distancia_terra(
+        a._coordenadas._x, a._coordenadas._y, b._coordenadas._x, b._coordenadas._y
+    )
+    return ViaCirculacao(inicio, fim, distancia / 1000, 30, 50)
+
+
+def test_itinerario_tabelado_depois_de_alterar_a_rede() -> None:
+    st: SistemaTuristico = gerar_sistema(150, semente=6)
+    aleatorio: random.Random = random.Random(6)
+    nomes: list = [p._designacao for p in st._pontos]
+    origens: list = aleatorio.sample(nomes, 5)
+    pares: list = [(o, d) for o in origens for d in aleatorio.sample(nomes, 10)]
+    verificar_itinerarios(st, pares)
+    ligados: list = [p for p in pares if len(st.itinerario(*p)[1]) > 2]
+    assert ligados
+
+    inicio, fim = max(ligados, key=lambda p: len(st.itinerario(*p)[1]))
+    st.acrescentar_aresta(via_direta(st, inicio, fim))
+    assert st.itinerario(inicio, fim)[1] == [inicio, fim]
+    verificar_itinerarios(st, pares)
+
+    st.adicionar_ponto(ponto("Atalho", CENTRO[0], CENTRO[1]))
+    st.acrescentar_vertice("Atalho")
+    for origem in origens:
+        st.acrescentar_aresta(via_direta(st, origem, "Atalho"))
+    st.acrescentar_aresta(via_direta(st, "Atalho", nomes[0]))
+    for origem in origens:
+        assert st.itinerario(origem, "Atalho")[1] == [origem, "Atalho"]
+    verificar_itinerarios(
+        st, pares + [(o, nomes[0]) for o in origens] + [(o, "Atalho") for o in origens]
+    )
+
+    st.remover_ponto("Atalho")
+    assert st.itinerario(origens[0], "Atalho")[1] == []
+    for inicio, fim in ligados:
+        intermedios: list = st.itinerario(inicio, fim)[1][1:-1]
+        if intermedios and intermedios[0] not in origens:
+            st.remover_ponto(intermedios[0])
+    verificar_itinerarios(
+        st, [p for p in pares if st.existe_ponto(p[0]) and st.existe_ponto(p[1])]
+    )